@@ -0,0 +1,80 @@
+import sys
+import time
+
+from pyscipopt import quicksum
+
+from sillinger import FantasyAuction
+
+
+def top_k_lineups(auction, k=5, min_diff=1):
+    # K best BOT lineups from the auction's existing model. After each solve a no-good cut
+    # forces the next lineup to swap at least min_diff of the free agents picked so far.
+    model = auction.model
+    store = auction.store
+
+    lineups = []
+    cuts = []
+
+    try:
+        for n in range(k):
+            start_time = time.perf_counter()
+
+            best_solution = auction.solve_model()
+            if best_solution is None:
+                break
+
+            lineup = auction.selected_players(best_solution)
+            elapsed = time.perf_counter() - start_time
+
+            lineups.append({
+                'rank': n + 1,
+                'points': int(lineup['PTS'].sum()),
+                'spent': round(float((lineup['SALARY'] + lineup['BID']).sum()), 1),
+                'lineup': lineup,
+                'elapsed': elapsed,
+            })
+
+            # Forced players are in every lineup, so the cut only counts free agents
+            chosen = [auction.player_vars[i] for i in lineup.index if store.free_agents[i]]
+            if n + 1 < k and len(chosen) >= min_diff:
+                model.freeTransform()
+                cuts.append(model.addCons(quicksum(chosen) <= len(chosen) - min_diff))
+            else:
+                break
+    finally:
+        # Leave the model as build_model made it
+        if cuts:
+            model.freeTransform()
+            for cut in cuts:
+                model.delCons(cut)
+
+    return lineups
+
+
+def print_lineups(lineups):
+    best = set(lineups[0]['lineup']['PLAYER']) if lineups else set()
+
+    for entry in lineups:
+        players = set(entry['lineup']['PLAYER'])
+        print(f"#{entry['rank']}: {entry['points']} PTS, ${entry['spent']} spent, solved in {entry['elapsed'] * 1000:.0f} ms")
+        if entry['rank'] > 1:
+            print(f"    IN:  {', '.join(sorted(players - best))}")
+            print(f"    OUT: {', '.join(sorted(best - players))}")
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    min_diff = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+    fantasy_auction.build_model()
+
+    start_time = time.perf_counter()
+    lineups = top_k_lineups(fantasy_auction, k, min_diff)
+    elapsed = time.perf_counter() - start_time
+
+    print_lineups(lineups)
+    print(f"Model build: {fantasy_auction.timings['build'] * 1000:.0f} ms")
+    print(f"{len(lineups)} lineups in {elapsed * 1000:.0f} ms")
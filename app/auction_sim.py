@@ -0,0 +1,293 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from knapsack import COST_UNIT, merge_tables, position_table, to_units
+from league import LeagueModel
+from sillinger import FantasyAuction
+
+# Simulator built once per process. Forked workers inherit it from the parent,
+# spawned workers receive it once through the pool initializer, never per auction.
+_shared_simulator = None
+
+
+def _init_worker(simulator):
+    global _shared_simulator
+    _shared_simulator = simulator
+
+
+class BotBidder:
+    def __init__(self, points, positions, needs, budget, goalie_cap=None):
+        # BOT's plan for the rest of the auction: one knapsack table per position over the players
+        # still available, priced at what they are expected to go for. A sale only touches the
+        # sold player's position, so only that table is rebuilt.
+        self.points = points
+        self.positions = positions
+        self.needs = dict(needs)
+        self.max_needs = dict(needs)
+        self.budget = int(to_units(max(budget, 0)))
+        self.max_budget = self.budget
+        self.goalie_cap = goalie_cap
+        self.goalie_spent = 0.0
+
+        self.position_rows = {pos: np.flatnonzero(positions == pos) for pos in needs}
+        self.available = np.ones(len(points), dtype=bool)
+        self.tables = {}
+        self.pending = None
+
+    def reprice(self, expected_prices):
+        self.costs = to_units(expected_prices)
+        self.tables = {}
+
+    def table(self, pos, exclude=None):
+        # best[k, b] over the available players at pos, optionally without one of them
+        rows = self.position_rows[pos]
+        rows = rows[self.available[rows]]
+        if exclude is not None:
+            rows = rows[rows != exclude]
+        return position_table(self.points[rows], self.costs[rows], self.max_needs[pos], self.max_budget)[0]
+
+    def others_value(self, pos):
+        # Best points for every budget from filling the other positions' needs, or None when
+        # there are none. Tables only improve with budget, so a lone table needs no merging.
+        total = None
+        for other, need in self.needs.items():
+            if other == pos or need == 0:
+                continue
+            if other not in self.tables:
+                self.tables[other] = self.table(other)
+            total = self.tables[other][need] if total is None else merge_tables(total, self.tables[other][need])[0]
+        return total
+
+    def limit(self, j):
+        # Most BOT can pay for player j and still end up with at least the points it expects without him
+        pos = self.positions[j]
+        need = self.needs[pos]
+        if need == 0 or self.budget == 0:
+            return 0.0
+
+        without = self.table(pos, exclude=j)
+        self.pending = (j, without)
+
+        others = self.others_value(pos)
+        b = self.budget
+        if others is None:
+            value = without[need][b]
+            rest = without[need - 1][b::-1]
+        else:
+            value = (others[:b + 1] + without[need][b::-1]).max()
+            rest = merge_tables(others, without[need - 1])[0][b::-1]
+
+        # rest[x]: best points from the other needs after paying x units for j
+        affordable = np.flatnonzero((rest > -np.inf) & (self.points[j] + rest >= value))
+        if len(affordable) == 0:
+            return 0.0
+
+        limit = affordable.max() * COST_UNIT
+        if pos == 'G' and self.goalie_cap is not None:
+            limit = min(limit, self.goalie_cap - self.goalie_spent)
+        return limit
+
+    def sold(self, j, won, price):
+        pos = self.positions[j]
+        self.available[j] = False
+
+        # The table built for the bid already leaves the sold player out
+        if self.pending is not None and self.pending[0] == j:
+            self.tables[pos] = self.pending[1]
+        else:
+            self.tables.pop(pos, None)
+        self.pending = None
+
+        if won:
+            self.needs[pos] -= 1
+            self.budget -= int(to_units(price))
+            if pos == 'G':
+                self.goalie_spent += price
+
+
+class AuctionSimulator:
+    def __init__(self, auction, noise=0.25, reprice_threshold=0.05):
+        # Arrays for the priced free-agent pool and every team's cap and needs. Opponents value a
+        # player at his BID times their own lognormal noise; everyone's expected prices follow the
+        # league's inflation, the money left over the value left, as the auction goes.
+        # The auction must already have run process_data.
+        league = LeagueModel(auction)
+        df = auction.players_df
+
+        self.teams = league.teams
+        self.bot = self.teams.index('BOT')
+        self.min_salary = auction.min_salary
+        self.noise = noise
+        self.reprice_threshold = reprice_threshold
+
+        self.players = league.pool_df['PLAYER'].to_numpy()
+        self.points = league.points
+        self.bids = league.pool_df['BID'].to_numpy(dtype=float)
+        self.positions = league.positions
+
+        self.roster_positions = list(auction.roster)
+        self.position_index = np.array([self.roster_positions.index(pos) for pos in self.positions])
+        self.budgets = np.array([league.cap_left[team] for team in self.teams])
+        self.needs = np.array([[league.needs[team][pos] for pos in self.roster_positions] for team in self.teams])
+
+        self.bot_base_points = float(df.loc[auction.store.team_start('BOT'), auction.value_column].sum())
+
+    def expected_prices(self, inflation):
+        return self.min_salary + (self.bids - self.min_salary) * inflation
+
+    def nominate(self, team, strategy, rng, candidates):
+        order = candidates[np.argsort(-self.bids[candidates], kind='stable')]
+        if team == self.bot:
+            nominate = strategy.get('nominate', 'expensive')
+            if nominate == 'cheap':
+                return order[-1]
+            if nominate == 'random':
+                return rng.choice(order)
+            return order[0]
+        # Opponents throw out one of the three most expensive players left
+        return order[rng.integers(min(3, len(order)))]
+
+    def run_auction(self, strategy, seed):
+        start_time = time.perf_counter()
+        rng = np.random.default_rng(seed)
+        min_salary = self.min_salary
+
+        budgets = self.budgets.copy()
+        needs = self.needs.copy()
+        values = self.bids[None, :] * np.exp(self.noise * rng.standard_normal((len(self.teams), len(self.bids))))
+        available = np.ones(len(self.bids), dtype=bool)
+
+        bot = BotBidder(
+            self.points, self.positions, dict(zip(self.roster_positions, needs[self.bot].tolist())),
+            budgets[self.bot], strategy.get('goalie_cap')
+        )
+        inflation = 1.0
+        bot.reprice(self.expected_prices(inflation))
+        priced_inflation = inflation
+
+        bot_points = self.bot_base_points
+        bot_spent = 0.0
+        nominator = int(rng.integers(len(self.teams)))
+        decision_time = 0.0
+
+        while True:
+            # Only players at a position someone still needs can be nominated
+            candidates = np.flatnonzero(available & (needs.sum(axis=0) > 0)[self.position_index])
+            if len(candidates) == 0:
+                break
+
+            j = self.nominate(nominator, strategy, rng, candidates)
+            nominator = (nominator + 1) % len(self.teams)
+            p = self.position_index[j]
+
+            # Every team keeps min_salary back for each other slot it still has to fill
+            reserve = budgets - min_salary * (needs.sum(axis=1) - 1)
+            max_bids = np.where(needs[:, p] > 0, np.minimum(values[:, j] * inflation, reserve), 0)
+
+            decision_start = time.perf_counter()
+            max_bids[self.bot] = min(bot.limit(j), reserve[self.bot]) if needs[self.bot, p] > 0 else 0
+            decision_time += time.perf_counter() - decision_start
+
+            available[j] = False
+            order = np.argsort(-max_bids, kind='stable')
+            winner = order[0]
+
+            if max_bids[winner] < min_salary:
+                bot.sold(j, False, 0)
+                continue
+
+            # English auction: the winner pays one step over the runner-up, never more than his limit
+            price = min(max_bids[winner], max(max_bids[order[1]] + COST_UNIT, min_salary))
+            price = np.floor(price / COST_UNIT + 1e-6) * COST_UNIT
+
+            budgets[winner] -= price
+            needs[winner, p] -= 1
+            bot.sold(j, winner == self.bot, price)
+            if winner == self.bot:
+                bot_points += self.points[j]
+                bot_spent += price
+
+            value_left = (self.bids[available] - min_salary).sum()
+            if value_left > 0:
+                inflation = float(np.clip((budgets.sum() - min_salary * needs.sum()) / value_left, 0.25, 4))
+            if abs(inflation - priced_inflation) > self.reprice_threshold * priced_inflation:
+                bot.reprice(self.expected_prices(inflation))
+                priced_inflation = inflation
+
+        return {
+            'strategy': strategy.get('name'),
+            'seed': seed,
+            'points': round(float(bot_points), 2),
+            'spent': round(bot_spent, 1),
+            'unfilled': int(needs[self.bot].sum()),
+            'decision_time': decision_time,
+            'elapsed': time.perf_counter() - start_time,
+        }
+
+
+def simulate(task):
+    strategy, seed = task
+    return _shared_simulator.run_auction(strategy, seed)
+
+
+def run_auctions(csv_path, strategies, auctions=1000, workers=None, seed=0):
+    global _shared_simulator
+    auction = FantasyAuction(csv_path, verbose=False)
+    auction.process_data()
+    _shared_simulator = AuctionSimulator(auction)
+
+    # The same seeds for every strategy, so each one faces the same opponents
+    tasks = [(strategy, seed + n) for strategy in strategies for n in range(auctions)]
+
+    if workers == 1 or len(tasks) <= 1:
+        return pd.DataFrame([simulate(task) for task in tasks])
+
+    workers = workers or os.cpu_count()
+
+    # Fork shares the simulator with the workers without copying it through a pipe
+    context = None
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(_shared_simulator,)
+    ) as executor:
+        results = list(executor.map(simulate, tasks, chunksize=chunksize))
+
+    return pd.DataFrame(results)
+
+
+def summarize(results):
+    summary = results.groupby('strategy', sort=False)['points'].describe(percentiles=[0.1, 0.5, 0.9])
+    summary['spent'] = results.groupby('strategy', sort=False)['spent'].mean()
+    summary['unfilled'] = results.groupby('strategy', sort=False)['unfilled'].mean()
+    return summary.round(1)
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    auctions = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    strategies = [
+        {'name': 'expensive first', 'nominate': 'expensive'},
+        {'name': 'cheap first', 'nominate': 'cheap'},
+        {'name': 'random', 'nominate': 'random'},
+        {'name': 'goalies <= $4', 'nominate': 'expensive', 'goalie_cap': 4.0},
+    ]
+
+    start_time = time.perf_counter()
+    results = run_auctions(csv_path, strategies, auctions)
+    elapsed = time.perf_counter() - start_time
+
+    with pd.option_context('display.width', 200):
+        print(summarize(results))
+    print(f"BOT decisions: {results['decision_time'].mean() * 1000:.0f} ms per auction")
+    print(f"Simulated {len(results)} auctions in {elapsed:.2f} s")
@@ -0,0 +1,133 @@
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from player_store import PlayerStore
+from sillinger import FantasyAuction, PENALTIES, SALARY, MIN_SALARY, TEAMS, FORWARD, DEFENCE, GOALIE
+
+# Every season the repo ships; PlayerStore reads both the old and the current CSV layout.
+# Resolved from this file rather than the working directory, so the defaults work from anywhere.
+DATA_DIR = Path(__file__).parent.parent / 'data'
+SEASONS = {
+    '2023': str(DATA_DIR / 'players-23.csv'),
+    '2024': str(DATA_DIR / 'players-24.csv'),
+}
+
+# Stores loaded once per season. Forked workers inherit them from the parent,
+# spawned workers receive them once through the pool initializer, never per run.
+_shared_stores = None
+
+
+def _init_worker(stores):
+    global _shared_stores
+    _shared_stores = stores
+
+
+def run_season(task):
+    # A variant is a dict of overrides: name, salary_cap, min_salary, league_size (the baseline
+    # multiplier), forward, defence, goalie
+    season, variant = task
+    start_time = time.perf_counter()
+
+    store = _shared_stores[season].copy()
+    roster = {
+        'F': variant.get('forward', FORWARD),
+        'D': variant.get('defence', DEFENCE),
+        'G': variant.get('goalie', GOALIE),
+    }
+
+    auction = FantasyAuction(
+        store.csv_path, verbose=False, store=store, salary_cap=variant.get('salary_cap', SALARY),
+        roster=roster, min_salary=variant.get('min_salary', MIN_SALARY),
+        league_size=variant.get('league_size', TEAMS)
+    )
+
+    (total_pool, committed_salary, available_to_spend, player_count,
+     total_z, total_bid_sum, restrict, dollar_per_z) = auction.process_data()
+
+    df = auction.players_df
+    draftable = df['Draftable'] == 'YES'
+    bids = df[draftable].groupby(df['POS'].astype(str))['BID'].sum()
+
+    result = {
+        'season': season,
+        'variant': variant.get('name'),
+        'available': round(float(available_to_spend), 1),
+        'draftable': int(player_count),
+        'dollar_per_z': round(float(dollar_per_z), 4),
+        **{f'bids_{pos}': round(float(bids.get(pos, 0)), 1) for pos in roster},
+    }
+
+    auction.build_model()
+    best_solution = auction.solve_model()
+
+    if best_solution is None:
+        result['status'] = auction.model.getStatus()
+    else:
+        lineup = auction.selected_players(best_solution)
+        result.update({
+            'status': 'optimal',
+            'points': int(lineup['PTS'].sum()),
+            'spent': round(float((lineup['SALARY'] + lineup['BID']).sum()), 1),
+            'signed': int(store.free_agents[lineup.index].sum()),
+        })
+
+    result['elapsed'] = round(time.perf_counter() - start_time, 3)
+    return result
+
+
+def run_backtest(variants, output_path, seasons=SEASONS, workers=None):
+    # Every variant against every season. Results are appended to output_path as JSON lines
+    # as soon as they arrive, so a long run can be followed or cut short.
+    global _shared_stores
+    _shared_stores = {season: PlayerStore(path, teams=PENALTIES.keys()) for season, path in seasons.items()}
+
+    tasks = [(season, variant) for variant in variants for season in seasons]
+    workers = workers or os.cpu_count()
+
+    with open(output_path, 'w') as output:
+        def write(result):
+            output.write(json.dumps(result, separators=(',', ':')) + '\n')
+            output.flush()
+            return result
+
+        if workers == 1 or len(tasks) <= 1:
+            return pd.DataFrame([write(run_season(task)) for task in tasks])
+
+        # Fork shares the loaded stores with the workers without copying them through a pipe
+        context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+
+        chunksize = max(1, len(tasks) // (workers * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(_shared_stores,)
+        ) as executor:
+            results = [write(result) for result in executor.map(run_season, tasks, chunksize=chunksize)]
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else '../data/backtest.jsonl'
+
+    variants = [{'name': 'baseline'}]
+    variants += [{'name': f"min ${min_salary}", 'min_salary': min_salary} for min_salary in [0.3, 0.7, 1.0]]
+    variants += [{'name': f"{league_size}-team baselines", 'league_size': league_size} for league_size in [10, 12]]
+    variants += [{'name': f"{forward}F/{defence}D", 'forward': forward, 'defence': defence}
+                 for forward, defence in [(13, 8), (15, 6)]]
+
+    start_time = time.perf_counter()
+    results = run_backtest(variants, output_path)
+    elapsed = time.perf_counter() - start_time
+
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(results.pivot(index='variant', columns='season', values=['points', 'dollar_per_z']))
+    print(f"Ran {len(results)} season runs in {elapsed:.2f} s, results in {output_path}")
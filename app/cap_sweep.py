@@ -0,0 +1,117 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from knapsack import COST_UNIT, to_units, value_by_budget
+from sillinger import FantasyAuction
+
+
+def optimum_bounds(auction, max_cap):
+    # Upper bound on BOT's points for every cap up to max_cap, from one DP over the free players.
+    # Must-include players are taken out of the roster counts and the budget up front.
+    must_include = auction.model_must_include
+    fixed_points = auction.model_points[must_include].sum()
+    fixed_cost = auction.model_costs[must_include].sum()
+
+    roster = dict(auction.roster)
+    for pos in auction.model_positions[must_include]:
+        roster[pos] -= 1
+
+    budget = int(to_units(max(max_cap - fixed_cost, 0)))
+    values = value_by_budget(
+        auction.model_points[~must_include], auction.model_costs[~must_include],
+        auction.model_positions[~must_include], roster, budget
+    )
+
+    def bound(cap):
+        if cap < fixed_cost or min(roster.values()) < 0:
+            return -np.inf
+        return fixed_points + values[min(int(to_units(cap - fixed_cost)), budget)]
+
+    return bound
+
+
+def cap_sweep(auction, caps):
+    # Optimal BOT lineup for each cap using one model: only the budget right-hand side changes
+    # between solves, each solve starts from the previous lineup, and caps where the DP bound
+    # shows the previous lineup is still optimal are not solved at all.
+    model = auction.model
+    caps = sorted(caps)
+
+    start_time = time.perf_counter()
+    bound = optimum_bounds(auction, caps[-1])
+    bound_time = time.perf_counter() - start_time
+
+    results = []
+    previous = None
+    incumbent = {}
+
+    try:
+        for cap in caps:
+            start_time = time.perf_counter()
+            upper_bound = bound(cap)
+
+            if upper_bound == -np.inf:
+                results.append({'cap': cap, 'status': 'infeasible', 'solved': False,
+                                'elapsed': time.perf_counter() - start_time})
+                continue
+
+            # The previous lineup stays feasible at a higher cap; if the bound cannot beat it, keep it
+            if previous is not None and upper_bound <= previous['points'] + 1e-6:
+                results.append({**previous, 'cap': cap, 'solved': False,
+                                'elapsed': time.perf_counter() - start_time})
+                continue
+
+            model.freeTransform()
+            model.chgRhs(auction.budget_cons, cap)
+            if incumbent:
+                auction.warm_start(incumbent)
+
+            best_solution = auction.solve_model()
+            if best_solution is None:
+                results.append({'cap': cap, 'status': model.getStatus(), 'solved': True,
+                                'elapsed': time.perf_counter() - start_time})
+                continue
+
+            incumbent = {i: best_solution[var] for i, var in auction.player_vars.items()}
+            lineup = auction.selected_players(best_solution)
+            previous = {
+                'cap': cap,
+                'status': 'optimal',
+                'points': round(float(lineup[auction.value_column].sum()), 2),
+                'spent': round(float((lineup['SALARY'] + lineup['BID']).sum()), 1),
+                'roster': lineup['PLAYER'].tolist(),
+                'solved': True,
+                'elapsed': time.perf_counter() - start_time,
+            }
+            results.append(previous)
+    finally:
+        # Put the budget back to the auction's own cap
+        model.freeTransform()
+        model.chgRhs(auction.budget_cons, auction.salary_cap)
+
+    results = pd.DataFrame(results)
+    results.attrs['bound_time'] = bound_time
+    return results
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+    fantasy_auction.build_model()
+
+    # 100 caps from $40 to $70 on the $0.1 grid
+    caps = np.round(np.linspace(40, 70, 100) / COST_UNIT) * COST_UNIT
+
+    start_time = time.perf_counter()
+    curve = cap_sweep(fantasy_auction, caps)
+    elapsed = time.perf_counter() - start_time
+
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(curve.drop(columns=['roster']))
+    print(f"DP bound: {curve.attrs['bound_time'] * 1000:.0f} ms")
+    print(f"{int(curve['solved'].sum())} of {len(curve)} caps solved, sweep took {elapsed:.2f} s")
@@ -0,0 +1,123 @@
+import sys
+
+import numpy as np
+
+from player_store import FREE_AGENT_TEAMS
+
+# Stat columns and weights by position. A negative weight marks a category where less is
+# better (GAA); a weight of 0 leaves the column out.
+SKATER_CATEGORIES = {'G': 1.0, 'A': 1.0, '+/-': 1.0, 'PIM': 0.5, 'PPP': 1.0, 'SOG': 1.0}
+GOALIE_CATEGORIES = {'W': 1.0, 'SV%': 1.0, 'GAA': -1.0}
+DEFAULT_CATEGORIES = {'F': SKATER_CATEGORIES, 'D': SKATER_CATEGORIES, 'G': GOALIE_CATEGORIES}
+
+# Categories a team is ranked on by its average instead of its total
+RATE_CATEGORIES = ['SV%', 'GAA']
+
+
+class CategoryValuation:
+    def __init__(self, categories=None, method='z'):
+        # Values players on several stat columns instead of PTS alone. method='z' adds up the
+        # weighted per-category z-scores inside each position; method='sgp' adds up standings
+        # gain points, each category divided by the gap between neighbouring teams in the
+        # current standings. Either way the value is one matrix pass over players x categories.
+        if method not in ('z', 'sgp'):
+            raise ValueError(f"Unknown valuation method: {method}")
+        self.categories = categories if categories is not None else DEFAULT_CATEGORIES
+        self.method = method
+
+    def matrices(self, auction):
+        # Stat matrix (players x columns), position code per player and weights (positions x columns)
+        df = auction.players_df
+        positions = [pos for pos in auction.roster if pos in self.categories and pos in auction.store.positions]
+        columns = sorted({col for pos in positions for col, weight in self.categories[pos].items() if weight})
+
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Missing stat columns for the category valuation: {missing}")
+
+        stats = df[columns].to_numpy(dtype=float)
+        stats = np.where(np.isnan(stats), 0, stats)
+
+        pos_codes = np.full(len(df), -1)
+        for code, pos in enumerate(positions):
+            pos_codes[auction.store.positions[pos]] = code
+
+        weights = np.array([[self.categories[pos].get(col, 0.0) for col in columns] for pos in positions])
+        return stats, pos_codes, weights, positions, columns
+
+    @staticmethod
+    def pool_moments(stats, pos_codes, pool, n_positions):
+        # Mean and standard deviation of every column over each position's pool, as two
+        # (positions x players) @ (players x columns) products
+        members = (pos_codes[None, :] == np.arange(n_positions)[:, None]) & pool[None, :]
+        counts = np.maximum(members.sum(axis=1), 1)[:, None]
+        mean = members @ stats / counts
+        variance = members @ stats ** 2 / counts - mean ** 2
+        stdev = np.sqrt(np.maximum(variance, 0))
+        stdev[stdev == 0] = 1
+        return mean, stdev
+
+    def denominators(self, auction, stats, columns):
+        # Standings gain points: one place in the standings is worth the spread between the
+        # best and the worst team in a category over (teams - 1), from START rosters
+        df = auction.players_df
+        store = auction.store
+        teams = [team for team in auction.penalties if team not in FREE_AGENT_TEAMS]
+        team_codes = np.full(len(df), -1)
+        for code, team in enumerate(teams):
+            rows = store.team_rows.get(team, np.empty(0, dtype=int))
+            team_codes[rows[store.start[rows]]] = code
+
+        members = (team_codes[None, :] == np.arange(len(teams))[:, None]).astype(float)
+        totals = members @ stats
+        rates = [k for k, col in enumerate(columns) if col in RATE_CATEGORIES]
+        if rates:
+            totals[:, rates] /= np.maximum(members.sum(axis=1), 1)[:, None]
+
+        spread = (totals.max(axis=0) - totals.min(axis=0)) / max(len(teams) - 1, 1)
+        spread[spread == 0] = 1
+        return spread
+
+    def value(self, auction):
+        # Combined value of every player; NaN for positions without categories. Players are
+        # centred on their position's pool, so values compare across categories; the pool is
+        # every non-MINOR player first, then the position's top roster slots league-wide.
+        stats, pos_codes, weights, positions, columns = self.matrices(auction)
+        store = auction.store
+        valued = pos_codes >= 0
+        codes = np.where(valued, pos_codes, 0)
+
+        pool = valued & ~store.minor
+        if self.method == 'sgp':
+            scale = np.broadcast_to(self.denominators(auction, stats, columns), (len(positions), len(columns)))
+
+        for _ in range(2):
+            mean, stdev = self.pool_moments(stats, pos_codes, pool, len(positions))
+            if self.method == 'z':
+                scale = stdev
+            values = (((stats - mean[codes]) / scale[codes]) * weights[codes]).sum(axis=1)
+
+            # Second pass: only the players good enough to be rostered set the reference
+            order = np.lexsort((-values, codes))
+            order = order[pool[order]]
+            group_start = np.searchsorted(codes[order], np.arange(len(positions)))
+            ranks = np.arange(len(order)) - group_start[codes[order]]
+            baselines = np.array([auction.roster[pos] * auction.league_size for pos in positions])
+            pool = np.zeros(len(pool), dtype=bool)
+            pool[order[ranks < baselines[codes[order]]]] = True
+
+        return np.where(valued, values, np.nan)
+
+
+if __name__ == "__main__":
+    from sillinger import FantasyAuction
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    method = sys.argv[2] if len(sys.argv) > 2 else 'z'
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False, categories=CategoryValuation(method=method))
+    result = fantasy_auction.compute()
+    print(f"DOLLAR_PER_Z: {result['valuation']['dollar_per_z']:.2f}, lineup value {result['points']:.2f}")
+
+    df = result['players']
+    print(df[df['BID'] > 0].nlargest(20, 'BID')[['PLAYER', 'POS', 'PTS', 'VALUE', 'Z-score', 'BID']].to_string(index=False))
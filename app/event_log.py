@@ -0,0 +1,117 @@
+import json
+import os
+import time
+
+import numpy as np
+
+# Bump when the snapshot layout changes; older snapshots are then ignored and the log replayed
+SNAPSHOT_VERSION = 1
+
+# Columns of players_df a live auction changes; everything else comes from the CSV
+SNAPSHOT_COLUMNS = ['FCHL TEAM', 'STATUS', 'SALARY', 'BID', 'Draftable', 'Z-score']
+CATEGORY_SNAPSHOT_COLUMNS = ['FCHL TEAM', 'STATUS']
+
+
+class EventLog:
+    def __init__(self, log_dir, snapshot_every=20):
+        # Append-only record of a live auction: one JSON line per event in events.jsonl and,
+        # every snapshot_every events, a binary snapshot of the auction state that remembers
+        # where in the log it was taken. Recovery loads the snapshot and replays the lines
+        # after it.
+        self.log_dir = log_dir
+        self.snapshot_every = snapshot_every
+        self.events_path = os.path.join(log_dir, 'events.jsonl')
+        self.snapshot_path = os.path.join(log_dir, 'snapshot.npz')
+        os.makedirs(log_dir, exist_ok=True)
+
+        # Sequence number and byte offset of the end of the last complete event
+        self.seq, self.offset = self.scan()
+        self.since_snapshot = 0
+
+    def scan(self):
+        # Last sequence number and the end of the last complete line. A line cut short by a
+        # crash is dropped from the file so the next append starts clean.
+        if not os.path.exists(self.events_path):
+            return 0, 0
+
+        seq = offset = 0
+        with open(self.events_path, 'rb') as file:
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+                seq = json.loads(line)['seq']
+                offset += len(line)
+
+        if offset != os.path.getsize(self.events_path):
+            with open(self.events_path, 'r+b') as file:
+                file.truncate(offset)
+        return seq, offset
+
+    def append(self, kind, **payload):
+        # One line per event, flushed to disk before the caller applies it
+        self.seq += 1
+        line = json.dumps({'seq': self.seq, 'time': time.time(), 'kind': kind, **payload}).encode() + b'\n'
+        with open(self.events_path, 'ab') as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+        self.offset += len(line)
+        self.since_snapshot += 1
+        return self.seq
+
+    def events(self, offset=0):
+        # Events from a byte offset on, e.g. the tail after a snapshot
+        if not os.path.exists(self.events_path):
+            return
+        with open(self.events_path, 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+                yield json.loads(line)
+
+    def snapshot_due(self):
+        return self.since_snapshot >= self.snapshot_every
+
+    def write_snapshot(self, live):
+        # Mutable player columns as arrays plus the valuation totals, written beside the old
+        # snapshot and renamed over it
+        df = live.auction.players_df
+        arrays = {}
+        for col in SNAPSHOT_COLUMNS:
+            if col in CATEGORY_SNAPSHOT_COLUMNS:
+                arrays[col] = df[col].cat.codes.to_numpy()
+            elif col == 'Draftable':
+                arrays[col] = (df[col] == 'YES').to_numpy()
+            else:
+                arrays[col] = df[col].to_numpy(dtype=float)
+
+        meta = {
+            'version': SNAPSHOT_VERSION,
+            'seq': self.seq,
+            'offset': self.offset,
+            'rows': len(df),
+            'categories': {col: df[col].cat.categories.tolist() for col in CATEGORY_SNAPSHOT_COLUMNS},
+            'totals': live.totals(),
+            'position_z': live.auction.position_z,
+            'penalties': live.auction.penalties,
+        }
+        arrays['meta'] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+
+        tmp_path = self.snapshot_path + '.tmp.npz'
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, self.snapshot_path)
+        self.since_snapshot = 0
+
+    def read_snapshot(self, rows):
+        # (meta, arrays) of the latest snapshot, or None when there is none that fits
+        try:
+            with np.load(self.snapshot_path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+
+        meta = json.loads(arrays.pop('meta').tobytes())
+        if meta.get('version') != SNAPSHOT_VERSION or meta['rows'] != rows or meta['offset'] > self.offset:
+            return None
+        return meta, arrays
@@ -0,0 +1,193 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+
+class _TimedStage:
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return {}
+
+    def __exit__(self, *exc):
+        self.timer.timings[self.name] = time.perf_counter() - self.start
+        return False
+
+
+class StageTimer:
+    # Default for a FantasyAuction that is not being profiled: only the wall time of the latest
+    # run of each stage, in timings
+    enabled = False
+
+    def __init__(self):
+        self.timings = {}
+
+    def stage(self, name, **args):
+        return _TimedStage(self, name)
+
+    def record_scip(self, model, stage=None):
+        pass
+
+
+class _Stage:
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.record = {'name': name, **args}
+
+    def __enter__(self):
+        self.profiler._enter(self.record)
+        return self.record
+
+    def __exit__(self, *exc):
+        self.profiler._exit(self.record)
+        return False
+
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, memory=True):
+        # Wall time and row counts for every stage; peak memory through tracemalloc when
+        # memory=True, which slows allocation-heavy code down noticeably while it runs. Use it
+        # as a context manager, or call stop(), so tracing ends with the profiled run.
+        self.memory = memory
+        self.records = []
+        self.timings = {}  # Seconds of the latest run of each stage, as StageTimer keeps them
+        self.scip = {}
+        self.origin = time.perf_counter()
+        self._stack = []
+
+        self._tracing = memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def stop(self):
+        # Memory figures end here; wall times keep being recorded
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        self.memory = False
+
+    def stage(self, name, **args):
+        # with profiler.stage('load') as stage: ... stage['rows'] = n
+        return _Stage(self, name, args)
+
+    def _enter(self, record):
+        record['depth'] = len(self._stack)
+        if self.memory:
+            # The enclosing stage keeps the peak seen so far before this stage resets it
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent['_peak'] = max(parent['_peak'], peak)
+            tracemalloc.reset_peak()
+            record['_base'] = current
+            record['_peak'] = current
+        self._stack.append(record)
+        record['_start'] = time.perf_counter()
+
+    def _exit(self, record):
+        end = time.perf_counter()
+        self._stack.pop()
+
+        record['start'] = record.pop('_start') - self.origin
+        record['elapsed'] = end - self.origin - record['start']
+        self.timings[record['name']] = record['elapsed']
+
+        # A stage still open when stop() ran gets no memory figure
+        base = record.pop('_base', None)
+        peak = record.pop('_peak', None)
+        if self.memory and base is not None:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            record['peak_mb'] = (peak - base) / 2 ** 20
+            if self._stack:
+                parent = self._stack[-1]
+                parent['_peak'] = max(parent['_peak'], peak)
+
+        self.records.append(record)
+
+    def record_scip(self, model, stage=None):
+        # Search statistics of the latest solve, also attached to the stage that ran it
+        self.scip = {
+            'status': model.getStatus(),
+            'nodes': model.getNNodes(),
+            'lp_iterations': model.getNLPIterations(),
+            'gap': model.getGap(),
+            'presolve_time': model.getPresolvingTime(),
+            'solve_time': model.getSolvingTime(),
+            'variables': model.getNVars(),
+            'constraints': model.getNConss(),
+        }
+        if stage is not None:
+            stage.update(self.scip)
+
+    def summary(self):
+        # Stages in the order they started, nested stages indented under their parent
+        df = pd.DataFrame(sorted(self.records, key=lambda record: record['start']))
+        if df.empty:
+            return df
+        df['name'] = ['  ' * depth + name for depth, name in zip(df['depth'], df['name'])]
+        df['ms'] = (df['elapsed'] * 1000).round(2)
+        columns = ['name', 'ms'] + [col for col in ('rows', 'peak_mb') if col in df]
+        return df[columns]
+
+    def to_dict(self):
+        return {'stages': sorted(self.records, key=lambda record: record['start']), 'scip': self.scip}
+
+    def write_json(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2, default=float)
+
+    def write_trace(self, path):
+        # Chrome trace-event format, for chrome://tracing, Perfetto or speedscope
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = []
+        for record in self.records:
+            args = {key: value for key, value in record.items() if key not in ('name', 'start', 'elapsed', 'depth')}
+            events.append({
+                'name': record['name'], 'cat': 'sillinger', 'ph': 'X', 'pid': pid, 'tid': tid,
+                'ts': record['start'] * 1e6, 'dur': record['elapsed'] * 1e6, 'args': args,
+            })
+
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file, default=float)
+
+
+if __name__ == "__main__":
+    from sillinger import FantasyAuction
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    trace_path = sys.argv[2] if len(sys.argv) > 2 else 'sillinger-trace.json'
+
+    # The full verbose run, with its output thrown away so only rendering time is measured
+    with Profiler() as profiler, contextlib.redirect_stdout(io.StringIO()):
+        fantasy_auction = FantasyAuction(csv_path, profiler=profiler)
+        processed = fantasy_auction.process_data()
+        fantasy_auction.build_model()
+        best_solution = fantasy_auction.solve_model()
+        fantasy_auction.print_results(*processed, best_solution)
+
+    with pd.option_context('display.width', 200):
+        print(profiler.summary().to_string(index=False))
+    print(f"SCIP: {profiler.scip}")
+
+    profiler.write_trace(trace_path)
+    print(f"Trace written to {trace_path}")
@@ -0,0 +1,266 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pyscipopt import Model, quicksum
+
+# Yearly change in PTS by age: young players improve, veterans decline. Each row is
+# (oldest age it applies to, factor); the last factor covers every older player.
+AGE_CURVE = [(23, 1.08), (26, 1.03), (29, 1.0), (32, 0.95), (None, 0.9)]
+
+
+def age_factor(age):
+    # Multiplier from this season's PTS to next season's for players of the given ages
+    age = np.asarray(age)
+    limits = [limit for limit, _ in AGE_CURVE[:-1]]
+    factors = [factor for _, factor in AGE_CURVE[:-1]]
+    return np.select([age <= limit for limit in limits], factors, AGE_CURVE[-1][1])
+
+
+def project_points(points, age, seasons):
+    # (players, seasons) matrix of projected PTS; column 0 is this season's projection
+    projected = np.empty((len(points), seasons))
+    projected[:, 0] = points
+    for season in range(1, seasons):
+        projected[:, season] = projected[:, season - 1] * age_factor(np.asarray(age) + season - 1)
+    return projected
+
+
+class KeeperPlanner:
+    def __init__(self, auction, seasons=3, discount=0.85, future_cap=None, contract_seasons=None):
+        # Chooses this season's acquisitions for BOT with the following seasons in mind. Bought
+        # players carry their price as salary into later seasons and BOT's own players (MINOR
+        # prospects included) keep theirs; PTS move along AGE_CURVE. Slots BOT cannot fill from
+        # its own players are bought at the market rate of this season's draftable free agents.
+        # contract_seasons is how many seasons, this one included, a player stays BOT's at his
+        # salary: a dict by GROUP (e.g. {'3': 1, 'RFA2': 2}) or one number per players_df row.
+        # The CSV has no contract terms, so by default every contract runs through the horizon.
+        self.auction = auction
+        self.seasons = seasons
+        self.discount = discount
+        self.future_cap = auction.salary_cap if future_cap is None else future_cap
+        self.infeasible_seasons = set()  # Later seasons of the latest plan without a feasible lineup
+
+        # A sale or revalue since the last extract leaves the candidates and costs stale
+        if not auction.model_data_current():
+            auction.extract_model_data(auction.model_forced, auction.model_excluded)
+
+        df = auction.players_df
+        store = auction.store
+
+        # This season's candidates, exactly as in the single-season model
+        candidates = auction.filtered_df.index.to_numpy()
+        self.n_candidates = len(candidates)
+
+        # BOT's other players can only help from next season on
+        bot_rows = store.team_rows.get('BOT', np.array([], dtype=int))
+        keepers = np.setdiff1d(bot_rows[store.minor[bot_rows]], candidates)
+
+        self.rows = np.concatenate([candidates, keepers])
+        self.positions = df['POS'].astype(str).to_numpy()[self.rows]
+        self.costs = np.concatenate([auction.model_costs, df['SALARY'].to_numpy(dtype=float)[keepers]])
+        self.must_include = np.concatenate([auction.model_must_include, np.zeros(len(keepers), dtype=bool)])
+        self.points = project_points(
+            df['PTS'].to_numpy(dtype=float)[self.rows], df['AGE'].to_numpy(dtype=float)[self.rows], seasons
+        )
+        self.contract_seasons = self.contract_lengths(contract_seasons)
+
+        # A market slot gets the average draftable free agent at his average bid
+        draftable = (df['Draftable'] == 'YES').to_numpy() & store.free_agents
+        self.market = {}
+        for pos in auction.roster:
+            rows = np.intersect1d(store.positions.get(pos, []), np.flatnonzero(draftable))
+            if len(rows):
+                self.market[pos] = (float(df['PTS'].to_numpy()[rows].mean()), float(df['BID'].to_numpy()[rows].mean()))
+
+    def contract_lengths(self, contract_seasons):
+        if contract_seasons is None:
+            return np.full(len(self.rows), self.seasons)
+        if isinstance(contract_seasons, dict):
+            groups = self.auction.players_df['GROUP'].astype(str).to_numpy()[self.rows]
+            return np.array([contract_seasons.get(group, self.seasons) for group in groups])
+        return np.asarray(contract_seasons)[self.rows]
+
+    def weight(self, season):
+        return self.discount ** season
+
+    def owned(self, k, season, acquired):
+        # BOT's own prospects always, candidates once picked, both until their contract ends
+        if season >= self.contract_seasons[k]:
+            return False
+        return k >= self.n_candidates or acquired is None or bool(acquired[k])
+
+    def build(self, first, last, acquired=None, gap=0.001, time_limit=None):
+        # Model of seasons first..last-1. Season 0 picks this season's lineup from the candidates;
+        # later seasons start owned players or market slots. When acquired is given the season 0
+        # picks are fixed to it.
+        model = Model("KeeperPlan")
+        model.setParam('display/verblevel', 0)
+        model.setParam('limits/gap', gap)
+        if time_limit is not None:
+            model.setParam('limits/time', time_limit)
+
+        roster = self.auction.roster
+        candidates = range(self.n_candidates)
+
+        # Season 0 picks; they decide which candidates BOT owns afterwards
+        if acquired is None:
+            pick = [
+                model.addVar(vtype="B", obj=self.points[k, 0] * (first == 0), lb=float(self.must_include[k]))
+                for k in candidates
+            ]
+        else:
+            pick = [float(acquired[k]) for k in candidates]
+
+        lineups = {}
+        markets = {}
+        for season in range(max(first, 1), last):
+            weight = self.weight(season)
+            # Only players BOT owns can start; an expired contract frees the slot for the market
+            lineups[season] = [
+                model.addVar(vtype="B", obj=weight * self.points[k, season],
+                             ub=1.0 if self.owned(k, season, acquired) else 0.0)
+                for k in range(len(self.rows))
+            ]
+            for k in candidates:
+                if acquired is None:
+                    model.addCons(lineups[season][k] <= pick[k])
+
+            markets[season] = {
+                pos: model.addVar(vtype="I", lb=0, ub=count, obj=weight * self.market[pos][0])
+                for pos, count in roster.items() if pos in self.market
+            }
+
+        model.setMaximize()
+
+        # Roster counts and the cap in every season of the window
+        if first == 0 and acquired is None:
+            model.addCons(quicksum(self.costs[k] * pick[k] for k in candidates) <= self.auction.salary_cap)
+            for pos, count in roster.items():
+                model.addCons(quicksum(pick[k] for k in np.flatnonzero(self.positions[:self.n_candidates] == pos)) == count)
+
+        for season, lineup in lineups.items():
+            market = markets[season]
+            model.addCons(
+                quicksum(self.costs[k] * lineup[k] for k in range(len(self.rows)))
+                + quicksum(self.market[pos][1] * var for pos, var in market.items()) <= self.future_cap
+            )
+            for pos, count in roster.items():
+                model.addCons(
+                    quicksum(lineup[k] for k in np.flatnonzero(self.positions == pos)) + market.get(pos, 0) == count
+                )
+
+        return model, pick, lineups, markets
+
+    def solve(self, mode='rolling', window=2, gap=0.001, time_limit=None):
+        # mode='full' solves every season in one model (seconds). mode='rolling' decides this season's
+        # picks with only `window` seasons in view, then plans each later season alone with
+        # those picks fixed, since later seasons depend on each other only through them.
+        start_time = time.perf_counter()
+        self.mode = mode
+        self.infeasible_seasons = set()
+
+        last = self.seasons if mode == 'full' else min(window, self.seasons)
+        model, pick, lineups, markets = self.build(0, last, gap=gap, time_limit=time_limit)
+        model.optimize()
+        self.status = model.getStatus()
+        if model.getNSols() == 0:
+            self.plan = None
+            self.elapsed = time.perf_counter() - start_time
+            return None
+
+        solution = model.getBestSol()
+        acquired = np.array([solution[var] > 0.5 for var in pick])
+        starts = {season: np.array([solution[var] > 0.5 for var in lineup]) for season, lineup in lineups.items()}
+        slots = {season: {pos: int(round(solution[var])) for pos, var in market.items()}
+                 for season, market in markets.items()}
+
+        for season in range(last, self.seasons):
+            starts[season], slots[season] = self.plan_season(season, acquired, gap)
+
+        self.elapsed = time.perf_counter() - start_time
+        self.plan = self.plan_frame(acquired, starts, slots)
+        return self.plan
+
+    def plan_season(self, season, acquired, gap=0.001):
+        # One later season's lineup given this season's picks. A season with no feasible lineup
+        # (e.g. future_cap below what is already committed) comes back empty and is counted in
+        # self.infeasible_seasons.
+        model, _, lineups, markets = self.build(season, season + 1, acquired=acquired, gap=gap)
+        model.optimize()
+        if model.getNSols() == 0:
+            self.infeasible_seasons.add(season)
+            return np.zeros(len(self.rows), dtype=bool), {}
+        solution = model.getBestSol()
+        starts = np.array([solution[var] > 0.5 for var in lineups[season]])
+        slots = {pos: int(round(solution[var])) for pos, var in markets[season].items()}
+        return starts, slots
+
+    def evaluate(self, acquired):
+        # Discounted PTS over the horizon for a given set of season 0 picks, e.g. the
+        # single-season optimum, with every later season planned around them
+        acquired = np.asarray(acquired, dtype=bool)
+        self.infeasible_seasons = set()
+        total = self.points[:self.n_candidates, 0][acquired].sum()
+        for season in range(1, self.seasons):
+            starts, slots = self.plan_season(season, acquired)
+            total += self.weight(season) * self.season_points(season, starts, slots)
+        return total
+
+    def season_points(self, season, starts, slots):
+        return self.points[starts, season].sum() + sum(self.market[pos][0] * count for pos, count in slots.items())
+
+    def plan_frame(self, acquired, starts, slots):
+        # One row per player in any season's lineup, plus per-season totals in self.seasons_summary
+        df = self.auction.players_df
+        in_lineup = np.zeros(len(self.rows), dtype=bool)
+        in_lineup[:self.n_candidates] = acquired
+        for season_starts in starts.values():
+            in_lineup |= season_starts
+
+        plan = df.loc[self.rows[in_lineup], ['PLAYER', 'POS', 'FCHL TEAM', 'AGE', 'PTS', 'SALARY', 'BID']].copy()
+        plan['COST'] = self.costs[in_lineup]
+        plan['SEASON 0'] = np.concatenate([acquired, np.zeros(len(self.rows) - self.n_candidates, dtype=bool)])[in_lineup]
+        for season, season_starts in starts.items():
+            plan[f'SEASON {season}'] = season_starts[in_lineup]
+            plan[f'PTS {season}'] = self.points[in_lineup, season].round(1)
+
+        summary = []
+        season_starts = {0: np.concatenate([acquired, np.zeros(len(self.rows) - self.n_candidates, dtype=bool)]), **starts}
+        for season in range(self.seasons):
+            chosen = season_starts[season]
+            market = slots.get(season, {})
+            summary.append({
+                'season': season,
+                'points': round(self.season_points(season, chosen, market), 1),
+                'salary': round(self.costs[chosen].sum() + sum(self.market[pos][1] * n for pos, n in market.items()), 1),
+                'market slots': sum(market.values()),
+            })
+        self.seasons_summary = pd.DataFrame(summary).set_index('season')
+        self.objective = sum(self.weight(season) * row['points'] for season, row in self.seasons_summary.iterrows())
+
+        return plan.sort_values(['SEASON 0', 'PTS'], ascending=False)
+
+
+if __name__ == "__main__":
+    from sillinger import FantasyAuction
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    seasons = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+    planner = KeeperPlanner(fantasy_auction, seasons=seasons)
+
+    # This season alone, then judged over the whole horizon
+    lineup = fantasy_auction.solve_lineup()
+    single_season = np.isin(fantasy_auction.filtered_df.index, lineup.rows)
+    print(f"Single-season lineup: {lineup.points:.0f} PTS now, {planner.evaluate(single_season):.1f} over {seasons} seasons")
+
+    for mode in ('full', 'rolling'):
+        plan = planner.solve(mode)
+        acquired = plan[plan['SEASON 0'] & plan['FCHL TEAM'].isin(['UFA', 'RFA', 'ENT'])]
+        print(f"\n{mode}: {planner.objective:.1f} over {seasons} seasons in {planner.elapsed:.2f}s ({planner.status})")
+        print(planner.seasons_summary)
+        print(acquired[['PLAYER', 'POS', 'AGE', 'PTS', 'COST']].to_string(index=False))
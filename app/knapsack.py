@@ -0,0 +1,121 @@
+import numpy as np
+
+# Salaries and bids are kept to one decimal, so the budget is discretised in $0.1 steps
+COST_UNIT = 0.1
+
+
+def to_units(values):
+    # Rounding down keeps every DP result an upper bound when a cost is not on the grid
+    return np.floor(np.asarray(values, dtype=float) / COST_UNIT + 1e-6).astype(int)
+
+
+def on_grid(values):
+    units = np.asarray(values, dtype=float) / COST_UNIT
+    return bool(np.all(np.abs(units - np.round(units)) < 1e-6))
+
+
+def position_table(points, costs, count, budget, track=False):
+    # best[k, b]: most points from exactly k of these players costing at most b units.
+    # With track=True also returns take[j, k, b]: player j improved best[k, b] when added.
+    best = np.full((count + 1, budget + 1), -np.inf)
+    best[0, :] = 0
+    take = np.zeros((len(points), count + 1, budget + 1), dtype=bool) if track else None
+
+    for j, (pts, cost) in enumerate(zip(points.tolist(), costs.tolist())):
+        if cost > budget:
+            continue
+        # The right-hand side is evaluated from the previous row first, so each player is used once
+        candidate = best[:-1, :budget + 1 - cost] + pts
+        if track:
+            take[j, 1:, cost:] = candidate > best[1:, cost:]
+        best[1:, cost:] = np.maximum(best[1:, cost:], candidate)
+
+    return best, take
+
+
+def merge_tables(first, second):
+    # merged[b] = max over splits of first[b1] + second[b - b1]; split[b] is the best b1
+    budget = len(first) - 1
+    merged = np.empty(budget + 1)
+    split = np.zeros(budget + 1, dtype=int)
+    for b in range(budget + 1):
+        totals = first[:b + 1] + second[b::-1]
+        split[b] = np.argmax(totals)
+        merged[b] = totals[split[b]]
+    return merged, split
+
+
+def value_by_budget(points, costs, positions, roster, budget):
+    # Best total points for every budget 0..budget units with exactly roster[pos] players
+    # per position. points/costs/positions describe the players that may still be picked.
+    costs = to_units(costs)
+
+    total = None
+    for pos, count in roster.items():
+        in_position = positions == pos
+        table = position_table(points[in_position], costs[in_position], count, budget)[0][count]
+        total = table if total is None else merge_tables(total, table)[0]
+
+    return total
+
+
+def solve_roster(points, costs, positions, roster, budget, at_most=False):
+    # Exact selection of roster[pos] players per position (or up to roster[pos] with
+    # at_most=True) within budget units.
+    # Returns (points, positional indexes of the picked players) or None when infeasible.
+    costs = to_units(costs)
+
+    tables = []
+    total = None
+    splits = []
+    for pos, count in roster.items():
+        rows = np.flatnonzero(positions == pos)
+        best, take = position_table(points[rows], costs[rows], count, budget, track=True)
+
+        # counts[b]: how many players the position takes when it gets b units
+        if at_most:
+            counts = best.argmax(axis=0)
+            table = best.max(axis=0)
+        else:
+            counts = np.full(budget + 1, count)
+            table = best[count]
+        tables.append((rows, counts, take))
+
+        if total is None:
+            total = table
+        elif len(splits) == len(roster) - 2:
+            # The last merge is only read at the full budget, so one split is enough
+            totals = total + table[::-1]
+            split = np.zeros(budget + 1, dtype=int)
+            split[budget] = np.argmax(totals)
+            total = np.full(budget + 1, -np.inf)
+            total[budget] = totals[split[budget]]
+            splits.append(split)
+        else:
+            total, split = merge_tables(total, table)
+            splits.append(split)
+
+    if total[budget] == -np.inf:
+        return None
+
+    # Walk the merges back to the budget each position received
+    budgets = []
+    b = budget
+    for split in reversed(splits):
+        budgets.append(b - split[b])
+        b = split[b]
+    budgets.append(b)
+    budgets.reverse()
+
+    selected = []
+    for (rows, counts, take), b in zip(tables, budgets):
+        k = counts[b]
+        for j in range(len(rows) - 1, -1, -1):
+            if k == 0:
+                break
+            if take[j, k, b]:
+                selected.append(rows[j])
+                k -= 1
+                b -= costs[rows[j]]
+
+    return total[budget], sorted(selected)
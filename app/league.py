@@ -0,0 +1,256 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from pyscipopt import Model, quicksum
+
+from knapsack import solve_roster, to_units
+from sillinger import FantasyAuction, LEAGUE, SALARY
+
+# The free-agent pool and every team's cap and needs, for the decomposition's workers. Forked
+# workers inherit it from the parent, spawned workers receive it once through the pool
+# initializer; each task only carries a team and the current prices.
+_shared_pool = None
+
+
+def _init_worker(pool):
+    global _shared_pool
+    _shared_pool = pool
+
+
+def _solve_team(task):
+    team, prices = task
+    return solve_team(*_shared_pool, team, prices)
+
+
+def solve_team(points, costs, positions, needs, cap_left, team, prices, available=None):
+    # Best roster for one team when each free agent also costs his price in points,
+    # optionally limited to the players still available
+    rows = np.arange(len(points)) if available is None else np.flatnonzero(available)
+    picked = np.zeros(len(points), dtype=bool)
+
+    result = solve_roster(
+        points[rows] - prices[rows], costs[rows], positions[rows], needs[team],
+        max(int(to_units(cap_left[team])), 0), at_most=True
+    )
+    if result is not None:
+        picked[rows[result[1]]] = True
+    return picked
+
+
+class LeagueModel:
+    def __init__(self, auction):
+        # Every team's remaining cap and roster needs, against the pool of priced free agents.
+        # The auction must already have run process_data so free agents carry bids.
+        self.auction = auction
+        df = auction.players_df
+        store = auction.store
+
+        self.teams = LEAGUE.team_codes()
+
+        pool = np.flatnonzero(store.free_agents & (df['BID'] > 0).to_numpy())
+        self.pool_df = df.loc[pool]
+        self.points = self.pool_df[auction.value_column].to_numpy(dtype=float)
+        self.costs = (self.pool_df['SALARY'] + self.pool_df['BID']).to_numpy(dtype=float)
+        self.positions = self.pool_df['POS'].astype(str).to_numpy()
+
+        self.cap_left = {}
+        self.needs = {}
+        for team in self.teams:
+            rows = store.team_rows[team]
+            cap = auction.salary_cap if team == 'BOT' else SALARY
+            committed = df.loc[rows[store.committed[rows]], 'SALARY'].sum()
+            self.cap_left[team] = cap - committed - auction.penalties.get(team, 0)
+
+            starters = df.loc[store.team_start(team), 'POS'].astype(str).value_counts()
+            self.needs[team] = {
+                pos: max(count - int(starters.get(pos, 0)), 0) for pos, count in auction.roster.items()
+            }
+
+    def solve(self, gap=0.0, time_limit=None):
+        # One assignment model with a variable per free agent per team. Teams with similar caps
+        # make the model very symmetric, so SCIP gets the teams-pick-in-turn repair of the DP
+        # as a starting league; with whole PTS it then only has to close the LP bound to the
+        # next integer.
+        start_time = time.perf_counter()
+
+        model = Model("LeagueAssignment")
+        model.hideOutput()
+        model.setParam('limits/gap', gap)
+        if time_limit is not None:
+            model.setParam('limits/time', time_limit)
+
+        n_players = len(self.points)
+        n_teams = len(self.teams)
+
+        # x[t, j]: player j goes to team t
+        x = np.array(
+            [model.addVar(vtype="B", obj=points) for points in np.tile(self.points, n_teams).tolist()], dtype=object
+        ).reshape(n_teams, n_players)
+        model.setMaximize()
+        if np.array_equal(self.points, np.round(self.points)):
+            model.setObjIntegral()
+
+        costs = self.costs.tolist()
+        in_position = {pos: np.flatnonzero(self.positions == pos) for pos in np.unique(self.positions)}
+        empty = np.empty(0, dtype=int)
+        for t, team in enumerate(self.teams):
+            model.addCons(quicksum(cost * var for cost, var in zip(costs, x[t])) <= self.cap_left[team])
+            for pos, need in self.needs[team].items():
+                model.addCons(quicksum(x[t, in_position.get(pos, empty)]) <= need)
+
+        # Each free agent signs with at most one team
+        for j in range(n_players):
+            model.addCons(quicksum(x[:, j]) <= 1)
+
+        start = self.repair(np.zeros(n_players))
+        solution = model.createSol()
+        for var, value in zip(x.ravel().tolist(), start.ravel().tolist()):
+            model.setSolVal(solution, var, float(value))
+        model.addSol(solution)
+
+        build_time = time.perf_counter() - start_time
+        model.optimize()
+
+        if model.getStatus() not in ("optimal", "gaplimit", "timelimit") or model.getNSols() == 0:
+            print(f"Warning: The league model did not solve. Status: {model.getStatus()}")
+            return None
+
+        values = np.array([model.getVal(var) for var in x.ravel()]).reshape(n_teams, n_players) > 0.5
+        assignment = self.assignment_frame(values)
+        assignment.attrs.update({
+            'build_time': build_time,
+            'elapsed': time.perf_counter() - start_time,
+            'points': model.getObjVal(),
+            'bound': model.getDualbound(),
+            'status': model.getStatus(),
+        })
+        return assignment
+
+    def pool(self):
+        return self.points, self.costs, self.positions, self.needs, self.cap_left
+
+    def solve_team(self, team, prices, available=None):
+        return solve_team(*self.pool(), team, prices, available)
+
+    def repair(self, prices):
+        # Feasible assignment from a price vector: teams pick in turn from whoever is left
+        values = np.zeros((len(self.teams), len(self.points)), dtype=bool)
+        available = np.ones(len(self.points), dtype=bool)
+        for t, team in enumerate(self.teams):
+            values[t] = self.solve_team(team, prices, available)
+            available &= ~values[t]
+        return values
+
+    def solve_decomposed(self, iterations=50, step=2.0, workers=None):
+        # Lagrangian decomposition: each team solves its own DP against player prices and
+        # the prices rise on players claimed by several teams until the claims agree.
+        # Every round also repairs the claims into a feasible league and keeps the best one.
+        # The teams' DPs of a round run in a process pool of `workers` (all CPUs by default).
+        workers = workers or os.cpu_count()
+        if workers == 1:
+            return self.price_loop(
+                lambda prices: np.array([self.solve_team(team, prices) for team in self.teams]), iterations, step
+            )
+
+        # Fork shares the pool with the workers without copying it through a pipe
+        context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(self.teams)), mp_context=context, initializer=_init_worker,
+            initargs=(self.pool(),)
+        ) as executor:
+            return self.price_loop(
+                lambda prices: np.array(list(executor.map(_solve_team, [(team, prices) for team in self.teams]))),
+                iterations, step
+            )
+
+    def price_loop(self, solve_teams, iterations, step):
+        # solve_teams(prices) returns every team's picks at those prices, one row per team
+        start_time = time.perf_counter()
+
+        prices = np.zeros(len(self.points))
+        best_values = None
+        best_points = -np.inf
+        best_bound = np.inf
+        history = []
+
+        for iteration in range(iterations):
+            picks = solve_teams(prices)
+            claims = picks.sum(axis=0)
+
+            # Dual value of this price vector is an upper bound on the league optimum
+            bound = sum((self.points - prices)[row].sum() for row in picks) + prices.sum()
+            best_bound = min(best_bound, bound)
+
+            values = picks if claims.max() <= 1 else self.repair(prices)
+            points = float(self.points[values.any(axis=0)].sum())
+            if points > best_points:
+                best_values, best_points = values, points
+
+            conflicts = int((claims > 1).sum())
+            history.append({'iteration': iteration, 'bound': bound, 'points': points, 'conflicts': conflicts})
+
+            subgradient = claims - 1
+            # Players nobody claims at a zero price cannot move the prices
+            subgradient[(subgradient < 0) & (prices == 0)] = 0
+            if conflicts == 0 or best_bound - best_points < 1 or not subgradient.any():
+                break
+
+            # Polyak step towards the best known league, shrinking over time
+            scale = step / (1 + iteration / 10) * (best_bound - best_points) / (subgradient ** 2).sum()
+            prices = np.maximum(prices + scale * subgradient, 0)
+
+        assignment = self.assignment_frame(best_values)
+        assignment.attrs.update({
+            'elapsed': time.perf_counter() - start_time,
+            'points': best_points,
+            'bound': best_bound,
+            'iterations': history,
+        })
+        return assignment
+
+    def assignment_frame(self, values):
+        teams = np.array(self.teams)
+        assigned = values.any(axis=0)
+
+        assignment = self.pool_df[['PLAYER', 'POS', 'PTS', 'BID']].copy()
+        assignment['TEAM'] = np.where(assigned, teams[values.argmax(axis=0)], '')
+        return assignment[assigned]
+
+    def team_summary(self, assignment):
+        rows = []
+        for team in self.teams:
+            players = assignment[assignment['TEAM'] == team]
+            rows.append({
+                'TEAM': team,
+                'CAP LEFT': round(self.cap_left[team], 1),
+                'NEEDS': ' '.join(f"{pos}{need}" for pos, need in self.needs[team].items()),
+                'SIGNED': len(players),
+                'SPENT': round(players['BID'].sum(), 1),
+                'PTS': int(players['PTS'].sum()),
+            })
+        return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+    league = LeagueModel(fantasy_auction)
+
+    assignment = league.solve()
+    print(league.team_summary(assignment))
+    print(f"Full model: {assignment.attrs['points']:.0f} PTS (bound {assignment.attrs['bound']:.0f}) in {assignment.attrs['elapsed']:.2f} s")
+
+    decomposed = league.solve_decomposed()
+    print(league.team_summary(decomposed))
+    print(f"Decomposed: {decomposed.attrs['points']:.0f} PTS (bound {decomposed.attrs['bound']:.0f}) "
+          f"after {len(decomposed.attrs['iterations'])} price rounds in {decomposed.attrs['elapsed']:.2f} s")
@@ -0,0 +1,27 @@
+import json
+import os
+from functools import lru_cache
+
+# teams.json lives next to the scripts
+TEAMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'teams.json')
+
+
+class LeagueConfig:
+    def __init__(self, teams_path=TEAMS_PATH):
+        self.teams_path = teams_path
+
+        # Load teams from the JSON file
+        with open(teams_path, 'r') as file:
+            self.teams = json.load(file)
+
+        # Extract penalties from the teams data
+        self.penalties = {team: data['penalty'] for team, data in self.teams.items()}
+
+    def team_codes(self):
+        return list(self.teams)
+
+
+@lru_cache(maxsize=None)
+def get_league_config(teams_path=TEAMS_PATH):
+    # One shared, parsed copy of teams.json per path
+    return LeagueConfig(teams_path)
@@ -0,0 +1,386 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from event_log import CATEGORY_SNAPSHOT_COLUMNS, SNAPSHOT_COLUMNS, EventLog
+from player_store import FREE_AGENT_TEAMS
+from sillinger import FantasyAuction, PENALTIES, VALUATION_FIELDS
+
+
+class LiveAuction:
+    def __init__(self, csv_path, backend='scip', log_dir=None):
+        # The valuation and the BOT model are built once and then edited after every sale.
+        # With backend='dp' the lineup comes from the in-process knapsack DP instead.
+        # With a log_dir every event is written to an append-only log (event_log.py) before it
+        # is applied, and a restart resumes from the last snapshot plus the events after it.
+        self.backend = backend
+        self.auction = FantasyAuction(csv_path, verbose=False)
+        self.store = self.auction.store
+        self.log = EventLog(log_dir) if log_dir is not None else None
+
+        snapshot = None if self.log is None else self.log.read_snapshot(len(self.auction.players_df))
+        if snapshot is None:
+            self.set_totals(self.auction.process_data())
+            offset = 0
+        else:
+            offset = self.restore(*snapshot)
+
+        # Logged events are replayed on the valuation only; the model is built once afterwards
+        self.replayed = 0
+        if self.log is not None:
+            for event in self.log.events(offset):
+                self.apply(event)
+                self.replayed += 1
+
+        self.rebuild()
+
+    def totals(self):
+        return {field: float(getattr(self, field)) for field in VALUATION_FIELDS}
+
+    def set_totals(self, values):
+        if isinstance(values, dict):
+            values = [values[field] for field in VALUATION_FIELDS]
+        for field, value in zip(VALUATION_FIELDS, values):
+            setattr(self, field, value)
+
+    def restore(self, meta, arrays):
+        # Put a snapshot's columns and totals back in place of process_data; returns the log
+        # offset the snapshot was taken at
+        df = self.auction.players_df
+        for col in SNAPSHOT_COLUMNS:
+            if col in CATEGORY_SNAPSHOT_COLUMNS:
+                df[col] = pd.Categorical.from_codes(arrays[col], categories=meta['categories'][col])
+            elif col == 'Draftable':
+                df[col] = np.where(arrays[col], 'YES', 'NO')
+            else:
+                df[col] = arrays[col]
+        self.store.refresh()
+
+        self.set_totals(meta['totals'])
+        self.auction.position_z = {pos: tuple(value) for pos, value in meta['position_z'].items()}
+        self.auction.penalties = meta['penalties']
+        return meta['offset']
+
+    def rebuild(self):
+        # Fresh model (or DP data) from the current valuation
+        self.auction.model = None
+        if self.backend == 'dp':
+            self.auction.extract_model_data()
+        else:
+            self.auction.build_model()
+
+        # Budget coefficient currently in the model for every player that has a variable
+        self.costs = (self.auction.filtered_df['SALARY'] + self.auction.filtered_df['BID']).to_dict()
+
+        # Free agents whose variable is currently allowed into the lineup
+        self.active = set(self.auction.filtered_df.index[self.store.free_agents[self.auction.filtered_df.index]])
+
+        self.solve()
+
+    def solve(self):
+        if self.backend == 'dp':
+            self.lineup = self.auction.solve_lineup('dp')
+        else:
+            self.best_solution = self.auction.solve_model()
+            self.incumbent = self.store_incumbent()
+
+    def find_player(self, player):
+        if not isinstance(player, str):
+            return int(player)
+
+        matches = self.store.name_rows.get(player)
+        if matches is None or len(matches) == 0:
+            raise ValueError(f"Unknown player: {player}")
+
+        # Prefer the free agent when a name is shared with a rostered player
+        free_agents = matches[self.store.free_agents[matches]]
+        if len(free_agents) == 1:
+            return int(free_agents[0])
+        if len(matches) == 1:
+            return int(matches[0])
+
+        raise ValueError(f"Ambiguous player name: {player} (rows {list(matches)})")
+
+    def record_sale(self, player, team, price):
+        start_time = time.perf_counter()
+
+        idx = self.find_player(player)
+        df = self.auction.players_df
+
+        if not self.store.free_agents[idx]:
+            raise ValueError(f"{df.at[idx, 'PLAYER']} is not a free agent ({df.at[idx, 'FCHL TEAM']})")
+        if team not in PENALTIES:
+            raise ValueError(f"Unknown team: {team}")
+
+        self.record('sale', row=idx, player=df.at[idx, 'PLAYER'], team=team, price=price)
+        self.revalue(idx, team, price)
+        if self.backend == 'dp':
+            # The DP only needs the refreshed coefficient vectors
+            self.auction.extract_model_data()
+        else:
+            self.update_model(idx, team, price)
+
+        self.solve()
+        self.checkpoint()
+
+        elapsed = time.perf_counter() - start_time
+        return self.recommendation(), elapsed
+
+    def move_player(self, player, team, status, salary=None):
+        # Keeper moves: trades, promotions from MINOR, releases to free agency. Every position's
+        # baseline can shift, so the valuation and the model are rebuilt.
+        start_time = time.perf_counter()
+
+        idx = self.find_player(player)
+        df = self.auction.players_df
+
+        if team not in PENALTIES and team not in FREE_AGENT_TEAMS:
+            raise ValueError(f"Unknown team: {team}")
+        if status not in df['STATUS'].cat.categories:
+            raise ValueError(f"Unknown status: {status}")
+
+        self.record('move', row=idx, player=df.at[idx, 'PLAYER'], team=team, status=status, salary=salary)
+        self.move(idx, team, status, salary)
+        self.rebuild()
+        self.checkpoint()
+
+        elapsed = time.perf_counter() - start_time
+        return self.recommendation(), elapsed
+
+    def set_penalty(self, team, penalty):
+        start_time = time.perf_counter()
+
+        if team not in self.auction.penalties:
+            raise ValueError(f"Unknown team: {team}")
+
+        self.record('penalty', team=team, penalty=penalty)
+        self.change_penalty(team, penalty)
+        self.rebuild()
+        self.checkpoint()
+
+        elapsed = time.perf_counter() - start_time
+        return self.recommendation(), elapsed
+
+    def record(self, kind, **payload):
+        # Write-ahead: the event is on disk before the state changes
+        if self.log is not None:
+            self.log.append(kind, **payload)
+
+    def checkpoint(self, force=False):
+        if self.log is not None and (force or self.log.snapshot_due()):
+            self.log.write_snapshot(self)
+
+    def apply(self, event):
+        # State-only replay of a logged event
+        if event['kind'] == 'sale':
+            self.revalue(event['row'], event['team'], event['price'])
+        elif event['kind'] == 'move':
+            self.move(event['row'], event['team'], event['status'], event['salary'])
+        elif event['kind'] == 'penalty':
+            self.change_penalty(event['team'], event['penalty'])
+        else:
+            raise ValueError(f"Unknown event: {event['kind']}")
+
+    def revalue(self, idx, team, price):
+        df = self.auction.players_df
+        pos = df.at[idx, 'POS']
+
+        # Clear the current valuation of the sold player's position before recomputing it
+        rows = self.store.positions[pos]
+        position_draftable = rows[(df.loc[rows, 'Draftable'] == 'YES').to_numpy()]
+        df.loc[position_draftable, 'Draftable'] = 'NO'
+        df.loc[position_draftable, 'Z-score'] = float('nan')
+        df.loc[position_draftable, 'BID'] = 0.0
+
+        # The sold player now counts as a committed START player on the buying team
+        self.store.record_sale(idx, team, price)
+
+        self.committed_salary += price
+        self.available_to_spend -= price
+
+        # Only the affected position's baseline and z-scores change
+        old_count, old_z = self.auction.position_z[pos]
+        new_count, new_z = self.auction.calculate_position_z_scores(pos)
+        self.auction.position_z[pos] = (new_count, new_z)
+
+        self.player_count += new_count - old_count
+        self.total_z += new_z - old_z
+
+        # Bids are a vectorized pass over the draftable players using the new dollar_per_z
+        self.total_bid_sum, self.restrict, self.dollar_per_z = self.auction.update_bids(
+            self.player_count, self.total_z, self.available_to_spend
+        )
+
+    def move(self, idx, team, status, salary=None):
+        df = self.auction.players_df
+        store = self.store
+
+        # Free agents carry no salary, as in process_data
+        if team in FREE_AGENT_TEAMS:
+            salary = 0.0
+        old_committed = df.at[idx, 'SALARY'] if store.committed[idx] else 0.0
+        store.move_player(idx, team, status, salary)
+        new_committed = df.at[idx, 'SALARY'] if store.committed[idx] else 0.0
+
+        self.committed_salary += new_committed - old_committed
+        self.available_to_spend = self.total_pool - self.committed_salary
+        self.revalue_all()
+
+    def change_penalty(self, team, penalty):
+        penalties = dict(self.auction.penalties)
+        change = penalty - penalties[team]
+        penalties[team] = penalty
+        self.auction.penalties = penalties
+
+        self.committed_salary += change
+        self.available_to_spend -= change
+        self.total_bid_sum, self.restrict, self.dollar_per_z = self.auction.update_bids(
+            self.player_count, self.total_z, self.available_to_spend
+        )
+
+    def revalue_all(self):
+        df = self.auction.players_df
+        draftable = df.index[df['Draftable'] == 'YES']
+        df.loc[draftable, 'Draftable'] = 'NO'
+        df.loc[draftable, 'Z-score'] = float('nan')
+        df.loc[draftable, 'BID'] = 0.0
+
+        self.player_count, self.total_z = self.auction.calculate_z_scores()
+        self.total_bid_sum, self.restrict, self.dollar_per_z = self.auction.update_bids(
+            self.player_count, self.total_z, self.available_to_spend
+        )
+
+    def update_model(self, idx, team, price):
+        auction = self.auction
+        model = auction.model
+        df = auction.players_df
+
+        # Return the model to the problem stage so it can be edited in place
+        model.freeTransform()
+
+        self.active.discard(idx)
+
+        if team == 'BOT':
+            # Fix the player into the lineup and move his price into the budget right-hand side
+            var = auction.player_vars.get(idx)
+            if var is None:
+                var = self.add_player_var(idx, 0.0)
+            model.chgVarUb(var, 1)
+            model.chgVarLb(var, 1)
+            model.chgCoefLinear(auction.budget_cons, var, 0.0)
+            model.chgRhs(auction.budget_cons, model.getRhs(auction.budget_cons) - price)
+            self.costs[idx] = 0.0
+        elif idx in auction.player_vars:
+            model.chgVarUb(auction.player_vars[idx], 0)
+
+        # Refresh budget coefficients of the remaining free agents from the new bids
+        free_agents = df.index[self.store.free_agents & (df['BID'] > 0).to_numpy()]
+        costs = (df.loc[free_agents, 'SALARY'] + df.loc[free_agents, 'BID']).to_dict()
+
+        for i, cost in costs.items():
+            var = auction.player_vars.get(i)
+            if var is None:
+                self.add_player_var(i, cost)
+            else:
+                if self.costs[i] != cost:
+                    model.chgCoefLinear(auction.budget_cons, var, cost)
+                    self.costs[i] = cost
+                if i not in self.active:
+                    model.chgVarUb(var, 1)
+            self.active.add(i)
+
+        # Players that fell out of the draftable pool leave the lineup
+        for i in self.active - costs.keys():
+            model.chgVarUb(auction.player_vars[i], 0)
+        self.active &= costs.keys()
+
+        # Keep filtered_df and the model data in line with what a full rebuild would select; the
+        # edits above make the model match them
+        auction.extract_model_data()
+        auction.model_key = auction.model_data_key
+
+        self.warm_start()
+
+    def add_player_var(self, idx, cost):
+        auction = self.auction
+        df = auction.players_df
+
+        var = auction.model.addVar(
+            vtype="B", name=f"{df.at[idx, 'PLAYER']}_{df.at[idx, 'POS']}", obj=float(df.at[idx, auction.value_column])
+        )
+        auction.model.addCoefLinear(auction.budget_cons, var, cost)
+        auction.model.addCoefLinear(auction.position_cons[df.at[idx, 'POS']], var, 1.0)
+
+        auction.player_vars[idx] = var
+        self.costs[idx] = cost
+        return var
+
+    def store_incumbent(self):
+        # Solution values are freed with the transformed problem, so copy them out
+        if self.best_solution is None:
+            return {}
+        return {i: self.best_solution[var] for i, var in self.auction.player_vars.items()}
+
+    def warm_start(self):
+        if not self.incumbent:
+            return
+
+        # Variables fixed by the sale override their value in the previous lineup
+        values = dict(self.incumbent)
+        for i, var in self.auction.player_vars.items():
+            if var.getUbOriginal() < 0.5:
+                values[i] = 0.0
+            elif var.getLbOriginal() > 0.5:
+                values[i] = 1.0
+        self.auction.warm_start(values)
+
+    def recommendation(self):
+        if self.backend == 'dp':
+            return self.lineup.players(self.auction) if self.lineup.status == 'optimal' else None
+        if self.best_solution is None:
+            return None
+        return self.auction.selected_players(self.best_solution)
+
+    def print_recommendation(self):
+        lineup = self.recommendation()
+        if lineup is None:
+            print("No feasible lineup for BOT.")
+            return
+
+        print(f"DOLLAR_PER_Z: {self.dollar_per_z:.2f}  AVAILABLE TO SPEND: {self.available_to_spend:.1f}")
+        print(tabulate(
+            lineup[['PLAYER', 'POS', 'FCHL TEAM', 'STATUS', 'PTS', 'SALARY', 'BID']].values.tolist(),
+            headers=["Player", "Position", "FCHL Team", "Status", "Points", "Salary", "Bid"],
+            tablefmt="fancy_outline"
+        ))
+        print(f"Total PTS: {lineup['PTS'].sum()}")
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    backend = sys.argv[2] if len(sys.argv) > 2 else 'scip'
+    log_dir = sys.argv[3] if len(sys.argv) > 3 else None
+
+    live_auction = LiveAuction(csv_path, backend, log_dir)
+    if live_auction.replayed:
+        print(f"Resumed after {live_auction.replayed} logged events")
+    live_auction.print_recommendation()
+
+    print("Enter each sale as: PLAYER, TEAM, PRICE (empty line to quit)")
+    while True:
+        line = input("> ").strip()
+        if not line:
+            break
+
+        try:
+            player, team, price = [part.strip() for part in line.rsplit(',', 2)]
+            lineup, elapsed = live_auction.record_sale(player, team, float(price))
+        except ValueError as ve:
+            print(f"Error: {ve}")
+            continue
+
+        live_auction.print_recommendation()
+        print(f"Updated in {elapsed * 1000:.0f} ms")
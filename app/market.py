@@ -0,0 +1,146 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from league import LeagueModel
+from sillinger import FantasyAuction
+
+
+class MarketPricer:
+    def __init__(self, auction, temperature=0.2):
+        # Every team's remaining cap and roster needs come from LeagueModel, the supply is
+        # every free agent at a rostered position. The auction must already have run process_data.
+        # temperature is in dollars: how far apart two players' surpluses must be before a team
+        # clearly prefers one of them.
+        self.auction = auction
+        self.temperature = temperature
+        self.min_salary = auction.min_salary
+        self.league = LeagueModel(auction)
+
+        df = auction.players_df
+        store = auction.store
+
+        in_roster = df['POS'].astype(str).isin(list(auction.roster)).to_numpy()
+        values = df[auction.value_column].to_numpy(dtype=float)
+        self.rows = np.flatnonzero(store.free_agents & in_roster & (values > 0))
+        self.points = values[self.rows]
+        self.bids = df['BID'].to_numpy(dtype=float)[self.rows]
+        positions = df['POS'].astype(str).to_numpy()[self.rows]
+
+        self.positions = list(auction.roster)
+        self.position_cols = {pos: np.flatnonzero(positions == pos) for pos in self.positions}
+
+        teams = self.league.teams
+        self.budgets = np.array([self.league.cap_left[team] for team in teams])
+        self.needs = np.array([[self.league.needs[team][pos] for pos in self.positions] for team in teams])
+
+    def demand(self, rates, prices):
+        # demand[t, j]: share of player j that team t wants. Each team spreads its needs at a
+        # position over the players there by a logit of surplus rates[t] * PTS - price, with
+        # signing nobody as the zero-surplus outside option; one team never wants more than all of him.
+        surplus = (rates[:, None] * self.points[None, :] - prices[None, :]) / self.temperature
+        demand = np.zeros(surplus.shape)
+
+        for p, pos in enumerate(self.positions):
+            cols = self.position_cols[pos]
+            position_surplus = surplus[:, cols]
+
+            # Shift by the best surplus (or the outside option) so exp never overflows
+            top = np.maximum(position_surplus.max(axis=1, keepdims=True), 0)
+            weights = np.exp(position_surplus - top)
+            outside = np.exp(-top)
+
+            shares = weights / (weights.sum(axis=1, keepdims=True) + outside)
+            demand[:, cols] = np.minimum(self.needs[:, p][:, None] * shares, 1)
+
+        return demand
+
+    def run(self, max_iterations=1000, price_step=0.1, rate_step=0.05, max_residual=0.5, max_budget_gap=0.01):
+        # Tatonnement: prices rise on players wanted by more than one team and fall towards
+        # min_salary on players wanted by less, while each team's dollars-per-point rate moves until
+        # what it wants costs what it has left. Stops when every position's excess demand is under
+        # max_residual players and every team is within max_budget_gap of its budget.
+        start_time = time.perf_counter()
+
+        # Start from the linear bids and the league-wide dollars per point they imply
+        draftable = self.bids > 0
+        prices = np.where(draftable, self.bids, self.min_salary)
+        rates = np.full(len(self.budgets), self.bids[draftable].sum() / self.points[draftable].sum())
+
+        history = []
+        for iteration in range(max_iterations):
+            iteration_start = time.perf_counter()
+
+            demand = self.demand(rates, prices)
+            claims = demand.sum(axis=0)
+            spend = (demand * prices[None, :]).sum(axis=1)
+
+            # Players left over at the reserve price are not excess supply
+            excess = np.where((prices <= self.min_salary) & (claims < 1), 0, claims - 1)
+            budget_gap = np.clip((spend - self.budgets) / self.budgets, -0.5, 0.5)
+
+            residuals = {pos: float(np.abs(excess[cols]).sum()) for pos, cols in self.position_cols.items()}
+            self.converged = max(residuals.values()) < max_residual and np.abs(budget_gap).max() < max_budget_gap
+            history.append({
+                'iteration': iteration,
+                **{f'{pos} residual': residual for pos, residual in residuals.items()},
+                'budget gap': float(np.abs(budget_gap).max()),
+                'elapsed': time.perf_counter() - iteration_start,
+            })
+
+            if self.converged:
+                break
+
+            prices = np.maximum(prices + price_step * excess, self.min_salary)
+            rates = rates * (1 - rate_step * budget_gap)
+
+        self.prices = prices
+        self.rates = rates
+        self.history = pd.DataFrame(history)
+
+        # The players most in demand fill the league's needs at each position
+        self.sold = np.zeros(len(self.rows), dtype=bool)
+        for p, pos in enumerate(self.positions):
+            cols = self.position_cols[pos]
+            self.sold[cols[np.argsort(-claims[cols], kind='stable')[:self.needs[:, p].sum()]]] = True
+
+        self.elapsed = time.perf_counter() - start_time
+
+        df = self.auction.players_df
+        results = df.iloc[self.rows][['PLAYER', 'POS', 'PTS', 'BID']].copy()
+        results['DEMAND'] = claims.round(2)
+        results['PRICE'] = np.where(self.sold, prices, 0).round(1)
+        return results
+
+    def apply(self):
+        # Replace the linear bids with the clearing prices; unsold players stop being draftable
+        df = self.auction.players_df
+        index = df.index[self.rows]
+        df.loc[index, 'BID'] = np.where(self.sold, self.prices, 0).round(1)
+        df.loc[index, 'Draftable'] = np.where(self.sold, 'YES', 'NO')
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+
+    pricer = MarketPricer(fantasy_auction)
+    results = pricer.run()
+
+    by_position = results.groupby('POS', observed=True).agg(
+        LINEAR=('BID', 'sum'), MARKET=('PRICE', 'sum'),
+        LINEAR_N=('BID', lambda bids: int((bids > 0).sum())), MARKET_N=('PRICE', lambda prices: int((prices > 0).sum())),
+    )
+    print(by_position.round(1))
+
+    with pd.option_context('display.max_rows', 40, 'display.width', 200):
+        print(results.sort_values('PRICE', ascending=False).head(40))
+
+    print(pricer.history.tail(5).round(4))
+    status = "converged" if pricer.converged else "stopped"
+    print(f"{status} after {len(pricer.history)} iterations in {pricer.elapsed * 1000:.0f} ms "
+          f"({pricer.history['elapsed'].mean() * 1000:.2f} ms per iteration)")
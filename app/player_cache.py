@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Bump when the cached layout changes so stale caches are rebuilt
+CACHE_VERSION = 2
+
+
+class PlayerCache:
+    def __init__(self, csv_path, cache_dir=None, dependencies=()):
+        # dependencies are other files the cached table is built from, e.g. the blended
+        # projections beside the CSV; editing, adding or deleting one invalidates the cache
+        self.csv_path = csv_path
+        self.dependencies = [os.path.abspath(path) for path in dependencies]
+
+        # Default to a .cache folder next to the CSV, one sub-folder per file
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), '.cache')
+        self.cache_dir = os.path.join(cache_dir, os.path.basename(csv_path))
+        self.meta_path = os.path.join(self.cache_dir, 'meta.json')
+
+    def source_stamp(self):
+        stat = os.stat(self.csv_path)
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+    def source_hash(self, path=None):
+        digest = hashlib.sha1()
+        with open(path or self.csv_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def dependency_stamps(self):
+        # mtime, size and sha1 of each dependency, None for a missing one
+        stamps = {}
+        for path in self.dependencies:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stamps[path] = None
+                continue
+            stamps[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': self.source_hash(path)}
+        return stamps
+
+    def dependencies_valid(self, meta):
+        recorded = meta.get('dependencies', {})
+        if sorted(recorded) != sorted(self.dependencies):
+            return False
+
+        for path, stamp in recorded.items():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                if stamp is not None:
+                    return False
+                continue
+            if stamp is None or stat.st_size != stamp['size']:
+                return False
+            if stat.st_mtime_ns != stamp['mtime_ns']:
+                # Touched only: keep the cache when the contents are the same
+                if self.source_hash(path) != stamp['sha1']:
+                    return False
+                stamp['mtime_ns'] = stat.st_mtime_ns
+                self.write_meta(meta)
+        return True
+
+    def read_meta(self):
+        try:
+            with open(self.meta_path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self, meta, check_dependencies=True):
+        if meta is None or meta.get('version') != CACHE_VERSION:
+            return False
+        if check_dependencies and not self.dependencies_valid(meta):
+            return False
+
+        stamp = self.source_stamp()
+        if meta['mtime_ns'] == stamp['mtime_ns'] and meta['size'] == stamp['size']:
+            return True
+
+        # The file was touched; only rebuild when its contents really changed
+        if meta['size'] == stamp['size'] and meta['sha1'] == self.source_hash():
+            meta.update(stamp)
+            self.write_meta(meta)
+            return True
+
+        return False
+
+    def load(self):
+        # Returns the cached table, or None when it is missing or stale
+        meta = self.read_meta()
+        if not self.is_valid(meta):
+            return None
+
+        columns = {}
+        for name, info in meta['columns'].items():
+            # Copy-on-write maps keep the file untouched while allowing in-memory edits
+            values = np.load(self.column_path(info['file']), mmap_mode='c')
+            if info['kind'] == 'category':
+                columns[name] = pd.Categorical.from_codes(values, categories=info['categories'])
+            else:
+                columns[name] = values
+
+        return pd.DataFrame(columns, columns=list(meta['columns']))
+
+    def save(self, df):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        columns = {}
+        for position, name in enumerate(df.columns):
+            file_name = f"{position:03d}.npy"
+            col = df[name]
+
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                np.save(self.column_path(file_name), col.cat.codes.to_numpy())
+                columns[name] = {
+                    'file': file_name, 'kind': 'category', 'categories': col.cat.categories.tolist()
+                }
+            elif pd.api.types.is_numeric_dtype(col.dtype):
+                np.save(self.column_path(file_name), col.to_numpy())
+                columns[name] = {'file': file_name, 'kind': 'numeric'}
+            else:
+                # Fixed-width unicode so the column can be memory-mapped without pickling
+                np.save(self.column_path(file_name), col.fillna('').to_numpy(dtype=str))
+                columns[name] = {'file': file_name, 'kind': 'text'}
+
+        # meta.json is written last so a half-written cache is never treated as valid
+        meta = {
+            'version': CACHE_VERSION, 'sha1': self.source_hash(), 'columns': columns,
+            'dependencies': self.dependency_stamps(),
+        }
+        meta.update(self.source_stamp())
+        self.write_meta(meta)
+
+    def update_columns(self, columns, info=None):
+        # Replace or add whole columns of a valid cache without rewriting the others, e.g. blended
+        # projections; info is merged into meta.json. The caller has just rewritten the
+        # dependencies these columns come from, so they are stamped again rather than checked.
+        # Returns False when there is no valid cache to update.
+        meta = self.read_meta()
+        if not self.is_valid(meta, check_dependencies=False):
+            return False
+
+        for name, values in columns.items():
+            col_info = meta['columns'].get(name)
+            file_name = col_info['file'] if col_info is not None else f"{len(meta['columns']):03d}.npy"
+
+            # Written beside the old file and renamed, so open memory maps keep the old data
+            tmp_path = self.column_path(file_name + '.tmp')
+            with open(tmp_path, 'wb') as file:
+                np.save(file, np.asarray(values))
+            os.replace(tmp_path, self.column_path(file_name))
+            meta['columns'][name] = {'file': file_name, 'kind': 'numeric'}
+
+        meta.update(info or {})
+        meta['dependencies'] = self.dependency_stamps()
+        self.write_meta(meta)
+        return True
+
+    def write_meta(self, meta):
+        tmp_path = self.meta_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(meta, file)
+        os.replace(tmp_path, self.meta_path)
+
+    def column_path(self, file_name):
+        return os.path.join(self.cache_dir, file_name)
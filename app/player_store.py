@@ -0,0 +1,194 @@
+import copy
+import os
+
+import numpy as np
+import pandas as pd
+
+from player_cache import PlayerCache
+
+# Teams that hold players still available in the auction
+FREE_AGENT_TEAMS = ['ENT', 'RFA', 'UFA']
+
+# MINOR players in these groups count against the cap
+COMMITTED_GROUPS = ['2', '3']
+
+# Low-cardinality text columns stored as integer-coded categoricals
+CATEGORY_COLUMNS = ['POS', 'GROUP', 'STATUS', 'FCHL TEAM', 'NHL TEAM']
+
+# Column order of the current CSV layout
+COLUMNS = ['PLAYER', 'POS', 'GROUP', 'STATUS', 'FCHL TEAM', 'NHL TEAM', 'AGE', 'SALARY', 'BID', 'PTS']
+
+# Header of the pre-2024 layout (players-23.csv) mapped to the current names
+LEGACY_COLUMNS = {
+    'Player': 'PLAYER', 'Pos': 'POS', 'Pts': 'PTS', 'Team': 'FCHL TEAM',
+    'Status': 'STATUS', 'Salary': 'SALARY', 'Bid': 'BID',
+}
+
+# Columns the legacy layout lacks. Without a GROUP no MINOR salary counts against the cap.
+LEGACY_DEFAULTS = {'GROUP': '', 'NHL TEAM': '', 'AGE': 0}
+
+# Blended projections (projections.py) live beside the CSV as players-24.projections.csv
+PROJECTION_COLUMNS = ['PTS', 'PTS_SD']
+
+
+def projections_path(csv_path):
+    return os.path.splitext(csv_path)[0] + '.projections.csv'
+
+
+class PlayerStore:
+    def __init__(self, csv_path, teams=(), use_cache=True):
+        self.csv_path = csv_path
+        self.df = self.load(csv_path, teams, use_cache)
+        self.refresh()
+
+    @staticmethod
+    def load(csv_path, teams=(), use_cache=True):
+        # Reuse the binary column cache while the CSV and its projections are unchanged
+        cache = PlayerCache(csv_path, dependencies=[projections_path(csv_path)]) if use_cache else None
+        df = cache.load() if cache is not None else None
+
+        if df is None:
+            df = PlayerStore.read_csv(csv_path)
+            PlayerStore.apply_projections(df, csv_path)
+            if cache is not None:
+                try:
+                    cache.save(df)
+                except OSError as e:
+                    print(f"Warning: could not write the player cache: {e}")
+
+        return PlayerStore.categorize(df, teams)
+
+    @staticmethod
+    def read_csv(csv_path):
+        dtype = {'AGE': int, 'PTS': int, 'SALARY': float, 'BID': float, 'GROUP': str}
+
+        header = pd.read_csv(csv_path, nrows=0).columns
+        legacy = 'PLAYER' not in header and 'Player' in header
+        if legacy:
+            legacy_names = {new: old for old, new in LEGACY_COLUMNS.items()}
+            dtype = {legacy_names[col]: kind for col, kind in dtype.items() if col in legacy_names}
+            # The old layout wrote 0 for players without a status
+            dtype['Status'] = str
+
+        df = pd.read_csv(csv_path, dtype=dtype)
+
+        if legacy:
+            df = df.rename(columns=LEGACY_COLUMNS)
+            df['STATUS'] = df['STATUS'].replace('0', np.nan)
+            for col, default in LEGACY_DEFAULTS.items():
+                df[col] = default
+            df = df[COLUMNS]
+
+        # Players without a status are neither starting nor in the minors
+        df['STATUS'] = df['STATUS'].fillna('NO')
+
+        return PlayerStore.categorize(df)
+
+    @staticmethod
+    def apply_projections(df, csv_path):
+        # Blended PTS and PTS_SD saved by projections.py, matched on PLAYER and POS (and the
+        # order of players sharing both). The binary cache keeps them once it is rebuilt.
+        path = projections_path(csv_path)
+        if not os.path.exists(path):
+            return
+
+        projections = pd.read_csv(path, dtype={'PLAYER': str, 'POS': str})
+        keys = pd.DataFrame({'PLAYER': df['PLAYER'].astype(str), 'POS': df['POS'].astype(str)})
+        keys['N'] = keys.groupby(['PLAYER', 'POS']).cumcount()
+        projections['N'] = projections.groupby(['PLAYER', 'POS']).cumcount()
+        matched = keys.merge(projections, on=['PLAYER', 'POS', 'N'], how='left')
+
+        found = matched['PTS'].notna().to_numpy()
+        df.loc[found, 'PTS'] = matched.loc[found, 'PTS'].to_numpy().astype(df['PTS'].dtype)
+        df['PTS_SD'] = matched['PTS_SD'].fillna(0.0).to_numpy()
+
+    @staticmethod
+    def categorize(df, teams=()):
+        # Every FCHL team must be a category so a sale can move a player to any of them
+        extra_categories = {
+            'STATUS': ['NO', 'START', 'MINOR'],
+            'FCHL TEAM': FREE_AGENT_TEAMS + list(teams),
+        }
+
+        for col in CATEGORY_COLUMNS:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                labels = df[col].cat.categories
+            else:
+                labels = df[col].dropna().unique()
+
+            # Sorted categories keep sort_values ordering identical to the plain strings
+            categories = sorted(set(labels).union(extra_categories.get(col, [])))
+
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                if list(labels) != categories:
+                    df[col] = df[col].cat.set_categories(categories)
+            else:
+                df[col] = pd.Categorical(df[col], categories=categories)
+
+        return df.reset_index(drop=True)
+
+    def copy(self):
+        # Independent frame and masks over the same data, for per-scenario edits
+        store = copy.copy(self)
+        store.df = self.df.copy()
+        store.start = self.start.copy()
+        store.minor = self.minor.copy()
+        store.free_agents = self.free_agents.copy()
+        store.committed = self.committed.copy()
+        store.team_rows = dict(self.team_rows)
+        return store
+
+    def codes(self, col, values):
+        # Integer codes of the given labels, so masks compare ints instead of strings
+        categories = self.df[col].cat.categories
+        return [categories.get_loc(value) for value in values if value in categories]
+
+    def refresh(self):
+        # Recompute every mask and index from the current frame
+        df = self.df
+
+        pos_codes = df['POS'].cat.codes.to_numpy()
+        status_codes = df['STATUS'].cat.codes.to_numpy()
+        team_codes = df['FCHL TEAM'].cat.codes.to_numpy()
+        group_codes = df['GROUP'].cat.codes.to_numpy()
+
+        self.start = status_codes == self.codes('STATUS', ['START'])[0]
+        self.minor = status_codes == self.codes('STATUS', ['MINOR'])[0]
+        self.free_agents = np.isin(team_codes, self.codes('FCHL TEAM', FREE_AGENT_TEAMS))
+        self.committed = self.start | (self.minor & np.isin(group_codes, self.codes('GROUP', COMMITTED_GROUPS)))
+
+        self.positions = {
+            pos: np.flatnonzero(pos_codes == code) for code, pos in enumerate(df['POS'].cat.categories)
+        }
+        self.team_rows = {
+            team: np.flatnonzero(team_codes == code) for code, team in enumerate(df['FCHL TEAM'].cat.categories)
+        }
+
+        # Row indexes for every player name (names are not unique)
+        self.name_rows = {name: np.asarray(rows) for name, rows in df.groupby('PLAYER').indices.items()}
+
+    def team_start(self, team):
+        rows = self.team_rows.get(team, np.empty(0, dtype=int))
+        return rows[self.start[rows]]
+
+    def record_sale(self, idx, team, price):
+        # Move one player to a team as a START signing and update only his entries
+        self.move_player(idx, team, 'START', price)
+
+    def move_player(self, idx, team, status, salary=None):
+        # Move one player to a team and status (sales, keeper moves, promotions) and update
+        # only his entries
+        old_team = self.df.at[idx, 'FCHL TEAM']
+
+        self.df.loc[idx, 'FCHL TEAM'] = team
+        self.df.loc[idx, 'STATUS'] = status
+        if salary is not None:
+            self.df.loc[idx, 'SALARY'] = salary
+
+        self.start[idx] = status == 'START'
+        self.minor[idx] = status == 'MINOR'
+        self.free_agents[idx] = team in FREE_AGENT_TEAMS
+        self.committed[idx] = self.start[idx] or (self.minor[idx] and str(self.df.at[idx, 'GROUP']) in COMMITTED_GROUPS)
+
+        self.team_rows[old_team] = self.team_rows[old_team][self.team_rows[old_team] != idx]
+        self.team_rows[team] = np.sort(np.append(self.team_rows[team], idx))
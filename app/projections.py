@@ -0,0 +1,307 @@
+import difflib
+import os
+import re
+import sys
+import time
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from player_cache import PlayerCache
+from player_store import PROJECTION_COLUMNS, PlayerStore, projections_path
+
+# Rows read from a projection file at a time
+CHUNK_ROWS = 200000
+
+# Header names tried, in order, when a source does not name its columns
+NAME_COLUMNS = ['PLAYER', 'Player', 'Name', 'name', 'player_name']
+POINTS_COLUMNS = ['PTS', 'Pts', 'Points', 'points', 'FPTS']
+POSITION_COLUMNS = ['POS', 'Pos', 'Position', 'position']
+
+# Ratio a fuzzy match needs inside a last-name bucket, and across the whole league. A name with
+# the same last name and first initial only needs SAME_INITIAL_CUTOFF (Nick/Nicholas Suzuki is
+# 0.77) but is still checked, so Ryan Smith (0.73) is not taken for Reilly Smith.
+SAME_INITIAL_CUTOFF = 0.75
+BUCKET_CUTOFF = 0.8
+LEAGUE_CUTOFF = 0.9
+
+# Notes and suffixes that are not part of a player's name
+NAME_NOISE = re.compile(r"\([^)]*\)|\b(jr|sr|ii|iii)\b")
+NAME_PUNCTUATION = re.compile(r"[^a-z ]+")
+
+
+def normalize_name(name):
+    # 'Tony DeAngelo (NCM)' -> 'tony deangelo', 'J.T. Miller' -> 'jt miller', accents dropped
+    name = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode().lower()
+    name = NAME_NOISE.sub(' ', name)
+    name = NAME_PUNCTUATION.sub('', name.replace('-', ' '))
+    return ' '.join(name.split())
+
+
+class NameIndex:
+    def __init__(self, names, positions=None):
+        # Normalized PLAYER names mapped to their rows, bucketed by last name for fuzzy lookups.
+        # Every distinct source spelling is resolved once and remembered, so a file with
+        # millions of rows costs one lookup per player, not per row.
+        self.keys = [normalize_name(name) for name in names]
+        self.positions = None if positions is None else np.asarray(positions, dtype=str)
+
+        self.rows = {}
+        self.buckets = {}
+        for row, key in enumerate(self.keys):
+            self.rows.setdefault(key, []).append(row)
+            self.buckets.setdefault(key.rsplit(' ', 1)[-1], set()).add(key)
+
+        self.resolved = {}
+        self.fuzzy = {}  # Source spellings matched only by the fuzzy tiers
+
+    def match_key(self, key):
+        # Exact normalized name, then the closest name with the same last name (Mitch/Mitchell,
+        # Alex/Alexander), then the closest name anywhere for misspelled last names
+        if key in self.rows:
+            return key
+
+        bucket = self.buckets.get(key.rsplit(' ', 1)[-1], ())
+        same_initial = [candidate for candidate in bucket if candidate[:1] == key[:1]]
+        if len(same_initial) == 1 and difflib.SequenceMatcher(None, key, same_initial[0]).ratio() >= SAME_INITIAL_CUTOFF:
+            return same_initial[0]
+
+        close = difflib.get_close_matches(key, bucket, n=1, cutoff=BUCKET_CUTOFF)
+        if not close:
+            close = difflib.get_close_matches(key, self.rows, n=1, cutoff=LEAGUE_CUTOFF)
+        return close[0] if close else None
+
+    def resolve(self, name, pos=None):
+        # Row of a source name, or -1 when it has no match or several players share it
+        cache_key = (name, pos)
+        if cache_key in self.resolved:
+            return self.resolved[cache_key]
+
+        key = self.match_key(normalize_name(name))
+        rows = [] if key is None else self.rows[key]
+
+        # Shared names (two Sebastian Ahos) are told apart by position when the source has one
+        if len(rows) > 1 and pos is not None and self.positions is not None:
+            rows = [row for row in rows if self.positions[row] == pos]
+
+        row = rows[0] if len(rows) == 1 else -1
+        if row >= 0 and key != normalize_name(name):
+            self.fuzzy[name] = self.keys[row]
+        self.resolved[cache_key] = row
+        return row
+
+    def resolve_many(self, names, positions=None):
+        # Rows for a whole chunk: the distinct (name, position) pairs are resolved, then broadcast
+        names = pd.Series(names, copy=False).astype(str)
+        if positions is None:
+            codes, uniques = pd.factorize(names)
+            rows = np.array([self.resolve(name) for name in uniques], dtype=np.int64)
+        else:
+            pairs = pd.MultiIndex.from_arrays([names, pd.Series(positions, copy=False).astype(str)])
+            codes, uniques = pd.factorize(pairs)
+            rows = np.array([self.resolve(name, pos) for name, pos in uniques], dtype=np.int64)
+        return rows[codes] if len(rows) else np.full(len(names), -1, dtype=np.int64)
+
+
+class ProjectionSource:
+    def __init__(self, path, weight=1.0, name_column=None, points_column=None, position_column=None,
+                 per_game=False):
+        # One projection file. per_game=True sums every row of a player (one row per game);
+        # otherwise rows of the same player are averaged.
+        self.path = path
+        self.weight = weight
+        self.name_column = name_column
+        self.points_column = points_column
+        self.position_column = position_column
+        self.per_game = per_game
+
+    def header(self):
+        ext = os.path.splitext(self.path.lower().removesuffix('.gz'))[1]
+        if ext == '.parquet':
+            import pyarrow.parquet as pq
+            return pq.ParquetFile(self.path).schema_arrow.names
+        if ext in ('.xlsx', '.xlsm'):
+            import openpyxl
+            workbook = openpyxl.load_workbook(self.path, read_only=True)
+            try:
+                return [str(cell) for cell in next(workbook.active.iter_rows(max_row=1, values_only=True))]
+            finally:
+                workbook.close()
+        return pd.read_csv(self.path, nrows=0).columns.tolist()
+
+    def resolve_columns(self):
+        header = self.header()
+
+        def pick(given, candidates, required=True):
+            if given is not None:
+                return given
+            found = next((col for col in candidates if col in header), None)
+            if found is None and required:
+                raise ValueError(f"{self.path}: none of the columns {candidates} found in {header}")
+            return found
+
+        self.name_column = pick(self.name_column, NAME_COLUMNS)
+        self.points_column = pick(self.points_column, POINTS_COLUMNS)
+        self.position_column = pick(self.position_column, POSITION_COLUMNS, required=False)
+        return [col for col in (self.name_column, self.points_column, self.position_column) if col is not None]
+
+    def chunks(self, chunk_rows=CHUNK_ROWS):
+        # DataFrames of at most chunk_rows rows with only the needed columns. CSV streams through
+        # pandas; Parquet (pyarrow) and XLSX (openpyxl) stream through their own readers.
+        columns = self.resolve_columns()
+        ext = os.path.splitext(self.path.lower().removesuffix('.gz'))[1]
+
+        if ext == '.parquet':
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(self.path).iter_batches(batch_size=chunk_rows, columns=columns):
+                yield batch.to_pandas()
+
+        elif ext in ('.xlsx', '.xlsm'):
+            import openpyxl
+            workbook = openpyxl.load_workbook(self.path, read_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                header = [str(cell) for cell in next(rows)]
+                positions = [header.index(col) for col in columns]
+                block = []
+                for row in rows:
+                    block.append([row[k] for k in positions])
+                    if len(block) == chunk_rows:
+                        yield pd.DataFrame(block, columns=columns)
+                        block = []
+                if block:
+                    yield pd.DataFrame(block, columns=columns)
+            finally:
+                workbook.close()
+
+        else:
+            yield from pd.read_csv(self.path, usecols=columns, chunksize=chunk_rows)
+
+
+class ProjectionMerger:
+    def __init__(self, csv_path, teams=(), chunk_rows=CHUNK_ROWS):
+        # Blends projection files into the PTS of a player table. The blend is saved beside the
+        # CSV (player_store.projections_path), which every PlayerStore reading the CSV applies,
+        # and written into the table's binary cache (player_cache.py) so cached loads have it too.
+        self.csv_path = csv_path
+        self.chunk_rows = chunk_rows
+        self.store = PlayerStore(csv_path, teams=teams)
+        df = self.store.df
+        self.index = NameIndex(df['PLAYER'].tolist(), df['POS'].astype(str).to_numpy())
+
+        # Running weighted sums by player row, so a source is folded in as soon as it is read:
+        # total weight, weighted points and weighted squared points
+        n_players = len(df)
+        self.weight_sum = np.zeros(n_players)
+        self.weighted = np.zeros(n_players)
+        self.weighted_squares = np.zeros(n_players)
+        self.report = []
+
+    def ingest(self, source):
+        start_time = time.perf_counter()
+        n_players = len(self.store.df)
+        points = np.zeros(n_players)
+        rows_seen = np.zeros(n_players)
+        read = unmatched = 0
+        fuzzy_before = set(self.index.fuzzy)
+
+        for chunk in source.chunks(self.chunk_rows):
+            positions = None if source.position_column is None else chunk[source.position_column]
+            rows = self.index.resolve_many(chunk[source.name_column], positions)
+            matched = rows >= 0
+
+            values = pd.to_numeric(chunk[source.points_column], errors='coerce').to_numpy(dtype=float)
+            matched &= ~np.isnan(values)
+            points += np.bincount(rows[matched], weights=values[matched], minlength=n_players)
+            rows_seen += np.bincount(rows[matched], minlength=n_players)
+
+            read += len(chunk)
+            unmatched += int((rows < 0).sum())
+
+        # Names matched only approximately are listed so a wrong player is caught by eye
+        fuzzy = {name: player for name, player in self.index.fuzzy.items() if name not in fuzzy_before}
+        for name, player in fuzzy.items():
+            print(f"Warning: {os.path.basename(source.path)}: '{name}' matched to '{player}'")
+
+        covered = rows_seen > 0
+        projection = np.full(n_players, np.nan)
+        if source.per_game:
+            projection[covered] = points[covered]
+        else:
+            projection[covered] = points[covered] / rows_seen[covered]
+
+        self.weight_sum[covered] += source.weight
+        self.weighted[covered] += source.weight * projection[covered]
+        self.weighted_squares[covered] += source.weight * projection[covered] ** 2
+        self.report.append({
+            'source': os.path.basename(source.path), 'weight': source.weight, 'rows': read,
+            'unmatched rows': unmatched, 'fuzzy names': len(fuzzy), 'players': int(covered.sum()),
+            'seconds': round(time.perf_counter() - start_time, 2),
+        })
+        return projection
+
+    def blend(self):
+        # Weighted mean of the sources covering each player, and the weighted spread between
+        # them as PTS_SD. Players no source covers keep their PTS with no spread.
+        df = self.store.df
+        has_projection = self.weight_sum > 0
+        weight_sum = np.maximum(self.weight_sum, 1e-12)
+        mean = self.weighted / weight_sum
+        spread = np.maximum(self.weighted_squares / weight_sum - mean ** 2, 0)
+
+        pts = df['PTS'].to_numpy().copy()
+        pts[has_projection] = np.round(mean[has_projection]).astype(pts.dtype)
+        sd = np.where(has_projection, np.sqrt(spread), 0.0)
+        return pts, sd
+
+    def run(self, sources):
+        # Ingest every source, blend, then save PTS and PTS_SD beside the CSV and into the
+        # cache and the store
+        for source in sources:
+            self.ingest(source)
+            print(f"{self.report[-1]}")
+
+        pts, sd = self.blend()
+        self.store.df['PTS'] = pts
+        self.store.df['PTS_SD'] = sd
+        self.save(sources)
+
+        return pd.DataFrame(self.report)
+
+    def save(self, sources):
+        df = self.store.df
+        path = projections_path(self.csv_path)
+        tmp_path = path + '.tmp'
+        df[['PLAYER', 'POS'] + PROJECTION_COLUMNS].to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+        # A stale cache is rebuilt from the CSV on the next load and picks up the file above;
+        # a valid one takes the new columns and the new stamp of the file
+        info = {'projections': {
+            'file': os.path.basename(path),
+            'sources': [{'path': os.path.abspath(source.path), 'weight': source.weight, 'per_game': source.per_game}
+                        for source in sources],
+        }}
+        cache = PlayerCache(self.csv_path, dependencies=[path])
+        cache.update_columns({col: df[col].to_numpy() for col in PROJECTION_COLUMNS}, info)
+
+
+if __name__ == "__main__":
+    # python projections.py players.csv source.csv[:weight[:per_game]] ...
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+
+    sources = []
+    for arg in sys.argv[2:]:
+        path, *options = arg.split(':')
+        weight = float(options[0]) if options else 1.0
+        sources.append(ProjectionSource(path, weight, per_game=len(options) > 1 and options[1] == 'per_game'))
+
+    if not sources:
+        print("Usage: python projections.py players.csv source.csv[:weight[:per_game]] ...")
+        sys.exit(1)
+
+    merger = ProjectionMerger(csv_path)
+    report = merger.run(sources)
+    print(report.to_string(index=False))
+    print(f"{len(merger.index.fuzzy)} names matched fuzzily")
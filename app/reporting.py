@@ -0,0 +1,151 @@
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+from tabulate import tabulate
+
+# Rendering for FantasyAuction. Nothing in the valuation or the optimizer imports this module,
+# so headless runs never load rich or tabulate.
+
+# Row styles of the bid tables, by FCHL team
+BOT_STYLE = "bold bright_magenta"
+FREE_AGENT_STYLE = "bold bright_green"
+
+
+# Table titles of the usual positions; any other position is titled by its code
+POSITION_NAMES = {'F': "Forwards", 'D': "Defenders", 'G': "Goalies"}
+
+
+def position_sort_key(pos, positions=('F', 'D', 'G')):
+    # Custom sorting key for positions: roster order, unknown positions last
+    positions = list(positions)
+    return positions.index(pos) if pos in positions else len(positions)
+
+
+def format_side_by_side(table1, table2):
+    # Function to format tables side by side
+    table1_lines = table1.split('\n')
+    table2_lines = table2.split('\n')
+
+    max_lines = max(len(table1_lines), len(table2_lines))
+    table1_lines += [''] * (max_lines - len(table1_lines))
+    table2_lines += [''] * (max_lines - len(table2_lines))
+
+    combined_lines = [f"{line1:<60} {line2}" for line1, line2 in zip(table1_lines, table2_lines)]
+    return '\n'.join(combined_lines)
+
+
+def bid_table(df, position):
+    # One rich table for a position, sorted by PTS and numbered from 1
+    df = df.sort_values(by='PTS', ascending=False)
+    df = df.reset_index(drop=True)
+    df.index += 1
+
+    # Drop the 'Draftable' column for display purposes
+    df = df.drop(columns=['Draftable'])
+
+    table = Table(title=f"{position} Table", show_header=True, header_style="bold grey70")
+    table.add_column("No.", justify="right", style="cyan")
+    for col in df.columns:
+        table.add_column(col)
+
+    # Cell text and row style for every player at once instead of per iterrows row
+    team = df['FCHL TEAM'].astype(str).to_numpy()
+    styles = np.select([team == 'BOT', (team == 'UFA') | (team == 'RFA')], [BOT_STYLE, FREE_AGENT_STYLE], '')
+    cells = df.to_numpy(dtype=object).astype(str).tolist()
+
+    for number, row, style in zip(df.index.astype(str), cells, styles.tolist()):
+        table.add_row(number, *row, style=style or None)
+
+    return table, df
+
+
+def print_bid_tables(auction, console=None):
+    console = console or Console()
+    df = auction.players_df
+
+    for pos in auction.roster:
+        if pos not in auction.store.positions:
+            continue
+        position = POSITION_NAMES.get(pos, pos)
+        table, position_df = bid_table(df.loc[auction.store.positions[pos]], position)
+        console.print(table)
+
+        # Print summary with color formatting
+        console.print(f"Number of {position} with Bid > 0: {len(position_df[position_df['BID'] > 0])}", style="bright_yellow")
+        console.print(f"Number of {position} with Status == 'START': {len(position_df[position_df['STATUS'] == 'START'])}", style="bright_yellow")
+        console.print(f"Sum of Bid column for {position}: {position_df['BID'].sum()}", style="bright_yellow")
+        console.print("\n")
+
+
+def print_results(auction, total_pool, committed_salary, available_to_spend, player_count, total_z,
+                  total_bid_sum, restrict, dollar_per_z, best_solution):
+    print(f"TOTAL POOL: {total_pool}")
+
+    print(f"COMMITTED SALARY: {committed_salary:.1f}")
+
+    print(f"AVAILABLE TO SPEND: {available_to_spend:.1f}")
+
+    print(f"TOTAL Z: {total_z:.2f}")
+
+    print(f"Players to be auctioned: {player_count}")
+
+    print(f"$ Restriced during the Auciton: {restrict}")
+
+    print(f"DOLLAR_PER_Z: {dollar_per_z:.2f}")
+
+    print('=' * 90)
+
+    print("=" * 90)
+    print(f"Sum of all Bid Values: {total_bid_sum:.1f}")
+    print()
+    print("." * 90)
+    print()
+
+    df = auction.players_df
+    summary = auction.team_summary()
+
+    # One sort for the whole league: STATUS, custom POS order, then PTS. The sort is stable,
+    # so each team's slice keeps the order sorting that team alone would give.
+    sorted_players = df.sort_values(
+        by=['STATUS', 'POS', 'PTS'],
+        ascending=[False, True, False],
+        key=lambda col: col.astype(str).map(lambda pos: position_sort_key(pos, auction.roster)) if col.name == 'POS' else col
+    )
+    team_order = sorted_players.groupby('FCHL TEAM', observed=False).indices
+
+    for team_name, counts in zip(summary.index, summary.to_dict('records')):
+        summary_table = [
+            [f"{status} - {pos}", counts[f'{status} {pos}']] for status in ('START', 'MINOR') for pos in auction.roster
+        ] + [
+            ["-"*18, "-"*4],  # Separator line
+            ["Total START Players", counts['START']],
+            ["Total MINOR Players", counts['MINOR']],
+            ["Total PTS (START)", counts['PTS']],
+            ["-"*18, "-"*4],  # Separator line
+            ["Total Salary", round(counts['SALARY'], 2)]
+        ]
+
+        team_players = sorted_players.iloc[team_order.get(team_name, [])]
+        players_table = team_players[['PLAYER', 'GROUP', 'POS', 'STATUS', 'PTS', 'SALARY']].values.tolist()
+
+        players_table_str = tabulate(players_table, headers=["Player", "Pos", "Status", "Pts", "Salary"], tablefmt="fancy_outline")
+        summary_table_str = tabulate(summary_table, headers=["Category", "Count"], tablefmt="fancy_outline")
+
+        # Print the summary for the team
+        print("-" * 110)
+        print(f"{team_name}")
+        print("-" * 110)
+        print(format_side_by_side(players_table_str, summary_table_str))
+
+    lineup = auction.selected_players(best_solution)
+    solution_data = lineup[['PLAYER', 'POS', 'NHL TEAM', 'STATUS', 'PTS', 'SALARY', 'BID']].values.tolist()
+
+    headers = ["Player", "Position", "NHL Team", "Status", "Points", "Salary", "Bid"]
+
+    print()
+    print("|" * 110)
+    print("|" * 110)
+    print()
+
+    print("Optimized Team for BOT:")
+    print(tabulate(solution_data, headers=headers, tablefmt="fancy_outline"))
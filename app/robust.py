@@ -0,0 +1,178 @@
+import sys
+import time
+
+import numpy as np
+
+from solvers import Lineup, ScipBackend
+
+
+class RobustLineup:
+    def __init__(self, auction, probability=0.9, noise=0.25, market_noise=0.1, scenarios=2000, seed=0):
+        # BOT's lineup when free agents do not sell at their BID. Each price is BID times a
+        # lognormal factor: one shared by the whole auction (market_noise) and one per player
+        # (noise), as in auction_sim. The lineup must stay under the cap with `probability`.
+        self.auction = auction
+        self.probability = probability
+        self.noise = noise
+        self.market_noise = market_noise
+        self.n_scenarios = scenarios
+        self.rng = np.random.default_rng(seed)
+
+        if auction.model is None:
+            auction.build_model()
+
+        # BOT's own starters cost what they cost; only the other candidates are uncertain
+        must_include = auction.model_must_include
+        self.fixed_cost = float(auction.model_costs[must_include].sum())
+        self.uncertain = np.flatnonzero(~must_include)
+        self.slots = sum(auction.roster.values()) - int(must_include.sum())
+
+        df = auction.filtered_df
+        self.salaries = df['SALARY'].to_numpy(dtype=float)[self.uncertain]
+        self.bids = df['BID'].to_numpy(dtype=float)[self.uncertain]
+        self.costs = self.price_scenarios()
+
+    def price_scenarios(self):
+        # (scenarios, uncertain players) matrix of costs, with the same mean as BID
+        sigma = np.hypot(self.noise, self.market_noise)
+        market = self.market_noise * self.rng.standard_normal((self.n_scenarios, 1))
+        player = self.noise * self.rng.standard_normal((self.n_scenarios, len(self.bids)))
+        prices = self.bids[None, :] * np.exp(market + player - sigma ** 2 / 2)
+        prices = np.maximum(prices.round(1), self.auction.min_salary)
+        return self.salaries[None, :] + np.where(self.bids > 0, prices, 0)
+
+    def violation(self, lineup):
+        # Share of the price scenarios in which the lineup goes over the cap
+        if lineup.status != 'optimal':
+            return np.nan
+        picked = np.isin(self.auction.filtered_df.index[self.uncertain], lineup.rows)
+        totals = self.fixed_cost + self.costs[:, picked].sum(axis=1)
+        return float((totals > self.auction.salary_cap + 1e-9).mean())
+
+    def solve_budgeted(self):
+        # Bertsimas-Sim: the cap must hold when any gamma of the chosen players cost their high
+        # price, with gamma from the bound P(over the cap) <= exp(-gamma^2 / 2n). For a fixed
+        # theta that is the nominal model with costs c + max(d - theta, 0) and a cap lowered by
+        # gamma * theta, so a handful of nominal solves replace one large reformulated model.
+        # The robust optimum is at theta = 0 or at one of the deviations, so every distinct
+        # deviation is tried (a few dozen, as BIDs sit on a coarse grid) and the best is kept.
+        start_time = time.perf_counter()
+        auction = self.auction
+        costs = auction.model_costs
+
+        # How far above BID a player's price gets at the chosen probability
+        deviation = np.zeros(len(costs))
+        deviation[self.uncertain] = np.maximum(
+            np.quantile(self.costs, self.probability, axis=0) - self.salaries - self.bids, 0
+        )
+        self.gamma = min(self.slots, np.sqrt(-2 * self.slots * np.log(1 - self.probability)))
+
+        best = None
+        for theta in [0.0] + np.unique(deviation[deviation > 0]).tolist():
+            self.set_budget(costs + np.maximum(deviation - theta, 0), auction.salary_cap - self.gamma * theta)
+            lineup = ScipBackend().solve(auction)
+            if lineup.status == 'optimal' and (best is None or lineup.points > best[1].points):
+                best = (theta, lineup)
+
+        # Leave the nominal budget row behind
+        self.set_budget(costs, auction.salary_cap)
+
+        if best is None:
+            return Lineup('scip', 'infeasible', elapsed=time.perf_counter() - start_time)
+        self.theta, lineup = best
+        lineup.elapsed = time.perf_counter() - start_time
+        return lineup
+
+    def set_budget(self, costs, cap):
+        # Edit the budget row of the auction's model in place
+        auction = self.auction
+        auction.model.freeTransform()
+        for var, cost in zip(auction.model_vars, costs.tolist()):
+            auction.model.chgCoefLinear(auction.budget_cons, var, cost)
+        auction.model.chgRhs(auction.budget_cons, cap)
+
+    def solve_loading(self, steps=12):
+        # Heuristic for the sample-average chance constraint (over the cap in at most
+        # 1 - probability of the price scenarios). The exact SAA model needs a row and an
+        # indicator per scenario; SCIP does not close it within a minute even on 100 to 200
+        # representative scenarios, and 50 are too few to hold on the full sample. Instead each
+        # candidate is the nominal lineup with every cost loaded by lam times how far the
+        # player's price runs above BID, and the scenarios only check it with one matrix product.
+        # lam is bisected towards the least loading that meets the probability. A MIP need not
+        # be monotone in lam, so this is not an optimum: the best lineup that met the
+        # probability among every lam tried is returned, and its lam is kept in self.loading.
+        start_time = time.perf_counter()
+        auction = self.auction
+        costs = auction.model_costs
+
+        # The same deviation the budgeted mode protects against
+        loading = np.zeros(len(costs))
+        loading[self.uncertain] = np.maximum(
+            np.quantile(self.costs, self.probability, axis=0) - self.salaries - self.bids, 0
+        )
+
+        accepted = []  # (lam, lineup) of every lineup that met the probability
+
+        def attempt(lam):
+            self.set_budget(costs + lam * loading, auction.salary_cap)
+            lineup = ScipBackend().solve(auction)
+            self.solves += 1
+            if lineup.status != 'optimal':
+                return None
+            if self.violation(lineup) > 1 - self.probability:
+                return False
+            accepted.append((lam, lineup))
+            return True
+
+        self.solves = 0
+        low, high = 0.0, 1.0
+        result = attempt(0.0)
+        if not result:
+            # Grow the loading until some lineup meets the probability
+            while result is False and high < 64:
+                result = attempt(high)
+                if result is False:
+                    low, high = high, high * 2
+            if result:
+                for _ in range(steps):
+                    middle = (low + high) / 2
+                    if attempt(middle):
+                        high = middle
+                    else:
+                        low = middle
+
+        self.set_budget(costs, auction.salary_cap)
+        if not accepted:
+            return Lineup('scip', 'infeasible', elapsed=time.perf_counter() - start_time)
+        self.loading, lineup = max(accepted, key=lambda entry: entry[1].points)
+        lineup.elapsed = time.perf_counter() - start_time
+        return lineup
+
+
+if __name__ == "__main__":
+    from sillinger import FantasyAuction
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    probability = float(sys.argv[2]) if len(sys.argv) > 2 else 0.9
+
+    def fresh_auction():
+        auction = FantasyAuction(csv_path, verbose=False)
+        auction.process_data()
+        auction.build_model()
+        return auction
+
+    nominal = fresh_auction()
+    robust = RobustLineup(nominal, probability)
+    lineup = nominal.solve_lineup()
+    print(f"nominal:   {lineup.points:.0f} PTS, over the cap in {robust.violation(lineup):.1%} of scenarios")
+
+    robust = RobustLineup(fresh_auction(), probability)
+    lineup = robust.solve_budgeted()
+    print(f"budgeted:  {lineup.points:.0f} PTS, over the cap in {robust.violation(lineup):.1%} of scenarios "
+          f"(gamma {robust.gamma:.1f}, {lineup.elapsed:.2f}s)")
+
+    robust = RobustLineup(fresh_auction(), probability)
+    lineup = robust.solve_loading()
+    print(f"loading:   {lineup.points:.0f} PTS, over the cap in {robust.violation(lineup):.1%} of scenarios "
+          f"(loading {robust.loading:.2f}, {robust.solves} solves over {robust.n_scenarios} scenarios, "
+          f"{lineup.elapsed:.2f}s)")
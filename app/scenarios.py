@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from player_store import PlayerStore
+from sillinger import FantasyAuction, PENALTIES, SALARY, FORWARD, DEFENCE, GOALIE, VALUATION_FIELDS
+
+# Player data loaded once per process. Forked workers inherit it from the parent,
+# spawned workers receive it once through the pool initializer, never per task.
+_shared_store = None
+
+
+def _init_worker(store):
+    global _shared_store
+    _shared_store = store
+
+
+def resolve_players(store, names):
+    rows = []
+    for name in names:
+        matches = store.name_rows.get(name)
+        if matches is None:
+            raise ValueError(f"Unknown player: {name}")
+        rows.extend(matches.tolist())
+    return rows
+
+
+def solve_scenario(scenario):
+    # A scenario is a dict of overrides: name, salary_cap, forward, defence, goalie,
+    # penalties (per-team overrides) and forced/excluded player names
+    start_time = time.perf_counter()
+
+    store = _shared_store.copy()
+
+    # Roster counts are league rules, so they move the valuation baselines as well as BOT's lineup
+    roster = {
+        'F': scenario.get('forward', FORWARD),
+        'D': scenario.get('defence', DEFENCE),
+        'G': scenario.get('goalie', GOALIE),
+    }
+    penalties = {**PENALTIES, **scenario.get('penalties', {})}
+
+    auction = FantasyAuction(
+        store.csv_path, verbose=False, store=store,
+        salary_cap=scenario.get('salary_cap', SALARY), roster=roster, penalties=penalties
+    )
+
+    result = {
+        'scenario': scenario.get('name'),
+        'salary_cap': auction.salary_cap,
+        'forward': roster['F'],
+        'defence': roster['D'],
+        'goalie': roster['G'],
+        'total_penalties': sum(penalties.values()),
+    }
+
+    try:
+        forced = resolve_players(store, scenario.get('forced', ()))
+        excluded = resolve_players(store, scenario.get('excluded', ()))
+    except ValueError as ve:
+        result.update({'status': f"error: {ve}", 'elapsed': time.perf_counter() - start_time})
+        return result
+
+    valuation = dict(zip(VALUATION_FIELDS, auction.process_data()))
+    result['dollar_per_z'] = valuation['dollar_per_z']
+
+    auction.build_model(forced=forced, excluded=excluded)
+    best_solution = auction.solve_model()
+
+    if best_solution is None:
+        result['status'] = auction.model.getStatus()
+    else:
+        lineup = auction.selected_players(best_solution)
+        result.update({
+            'status': 'optimal',
+            'points': int(lineup['PTS'].sum()),
+            'spent': round(float((lineup['SALARY'] + lineup['BID']).sum()), 1),
+            'roster': lineup['PLAYER'].tolist(),
+        })
+
+    result['elapsed'] = time.perf_counter() - start_time
+    return result
+
+
+def run_scenarios(csv_path, scenarios, workers=None):
+    global _shared_store
+    _shared_store = PlayerStore(csv_path, teams=PENALTIES.keys())
+
+    if workers == 1 or len(scenarios) <= 1:
+        return pd.DataFrame([solve_scenario(scenario) for scenario in scenarios])
+
+    workers = workers or os.cpu_count()
+
+    # Fork shares the loaded store with the workers without copying it through a pipe
+    context = None
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+
+    # Batch several scenarios per task to keep the pipe traffic small
+    chunksize = max(1, len(scenarios) // (workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(_shared_store,)
+    ) as executor:
+        results = list(executor.map(solve_scenario, scenarios, chunksize=chunksize))
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+
+    # Example sweep: BOT cap against the number of forwards
+    scenarios = [
+        {'name': f"cap {cap} / {forward}F", 'salary_cap': cap, 'forward': forward}
+        for cap in [50.0, 52.0, 54.0, 56.8, 60.0]
+        for forward in [13, 14, 15]
+    ]
+
+    start_time = time.perf_counter()
+    results = run_scenarios(csv_path, scenarios)
+    elapsed = time.perf_counter() - start_time
+
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(results.drop(columns=['roster']))
+    print(f"Solved {len(scenarios)} scenarios in {elapsed:.2f} s")
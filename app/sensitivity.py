@@ -0,0 +1,100 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pyscipopt import Model, SCIP_PARAMSETTING, quicksum
+
+from sillinger import FantasyAuction
+
+
+def build_relaxation(auction):
+    # LP relaxation of BOT's selection from the coefficient vectors of the last build_model
+    lp = Model("PlayerSelectionLP")
+    lp.hideOutput()
+
+    # Presolve, heuristics and propagation would move the LP away from the original rows
+    # and leave no valid duals
+    lp.setPresolve(SCIP_PARAMSETTING.OFF)
+    lp.setHeuristics(SCIP_PARAMSETTING.OFF)
+    lp.setSeparating(SCIP_PARAMSETTING.OFF)
+    lp.disablePropagation()
+
+    lp_vars = [
+        lp.addVar(vtype="C", lb=1.0 if included else 0.0, ub=1.0, obj=points)
+        for points, included in zip(auction.model_points.tolist(), auction.model_must_include.tolist())
+    ]
+    lp.setMaximize()
+
+    budget_cons = lp.addCons(
+        quicksum(cost * var for cost, var in zip(auction.model_costs.tolist(), lp_vars)) <= auction.salary_cap
+    )
+    position_cons = {}
+    for pos, count in auction.roster.items():
+        position_vars = [lp_vars[k] for k in np.flatnonzero(auction.model_positions == pos)]
+        position_cons[pos] = lp.addCons(quicksum(position_vars) == count)
+
+    return lp, lp_vars, budget_cons, position_cons
+
+
+def lp_sensitivity(auction, best_solution=None):
+    # Duals of the cap and position rows plus break-even bids for every player in the model,
+    # all from one LP solve. Returns (duals, players) or None when the LP is not optimal.
+    start_time = time.perf_counter()
+
+    lp, lp_vars, budget_cons, position_cons = build_relaxation(auction)
+    lp.optimize()
+
+    if lp.getStatus() != "optimal":
+        print(f"Warning: The LP relaxation did not solve to optimality. Status: {lp.getStatus()}")
+        return None
+
+    # SCIP reports duals for its internal minimization, so flip them for the maximized problem
+    cap_dual = -lp.getDualsolLinear(budget_cons)
+    position_duals = {pos: -lp.getDualsolLinear(cons) for pos, cons in position_cons.items()}
+
+    duals = {
+        'lp_points': lp.getObjVal(),
+        'points_per_cap_dollar': cap_dual,
+        'points_per_roster_spot': position_duals,
+    }
+
+    # A player enters the LP optimum while PTS - cap_dual * cost - position_dual >= 0,
+    # so the break-even cost is (PTS - position_dual) / cap_dual
+    position_dual = pd.Series(auction.model_positions).map(position_duals).to_numpy(dtype=float)
+    if cap_dual > 1e-9:
+        break_even_cost = (auction.model_points - position_dual) / cap_dual
+    else:
+        break_even_cost = np.full(len(auction.model_points), np.inf)
+
+    players = auction.filtered_df[['PLAYER', 'POS', 'FCHL TEAM', 'PTS', 'SALARY', 'BID']].copy()
+    players['LP VALUE'] = np.round([lp.getVal(var) for var in lp_vars], 3)
+    players['BREAK-EVEN BID'] = (break_even_cost - players['SALARY'].to_numpy()).round(2)
+    players['SURPLUS'] = (players['BREAK-EVEN BID'] - players['BID']).round(2)
+
+    if best_solution is not None:
+        players['IN LINEUP'] = [best_solution[auction.player_vars[i]] > 0.5 for i in players.index]
+
+    duals['elapsed'] = time.perf_counter() - start_time
+    return duals, players.sort_values('SURPLUS', ascending=False)
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+    fantasy_auction.build_model()
+    best_solution = fantasy_auction.solve_model()
+
+    duals, players = lp_sensitivity(fantasy_auction, best_solution)
+
+    print(f"LP bound: {duals['lp_points']:.1f} PTS (MIP: {fantasy_auction.model.getObjVal():.0f})")
+    print(f"One more $1 of cap is worth {duals['points_per_cap_dollar']:.2f} PTS")
+    for pos, value in duals['points_per_roster_spot'].items():
+        print(f"Dual of the {pos} count: {value:.2f} PTS")
+
+    free_agents = players[fantasy_auction.store.free_agents[players.index]]
+    with pd.option_context('display.max_rows', 40, 'display.width', 200):
+        print(free_agents.head(40))
+    print(f"Sensitivity computed in {duals['elapsed'] * 1000:.0f} ms")
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import math
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+from league import LeagueModel
+from live_auction import LiveAuction
+from sillinger import PENALTIES
+
+# The live auction state, resident in the single worker process. Every sale and solve
+# runs there, so the server's event loop only ever moves bytes and answers reads, nominations
+# included, from the views the worker last encoded.
+_live = None
+
+
+def _init_worker(csv_path, backend):
+    global _live
+    _live = LiveAuction(csv_path, backend)
+
+
+def parse_event(body, fields):
+    # Field values of a POST body, in the order of fields ({name: str or float}). Anything else
+    # raises ValueError, which the handler answers with 400 before the worker sees the request.
+    try:
+        event = json.loads(body)
+    except ValueError as e:
+        raise ValueError(f"Body is not valid JSON: {e}")
+    if not isinstance(event, dict):
+        raise ValueError("Body must be a JSON object")
+
+    missing = [name for name in fields if name not in event]
+    if missing:
+        raise ValueError(f"Missing fields: {', '.join(missing)}")
+
+    values = []
+    for name, kind in fields.items():
+        value = event[name]
+        if kind is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+                raise ValueError(f"Field '{name}' must be a non-negative number")
+            value = float(value)
+        elif not isinstance(value, str) or not value.strip():
+            raise ValueError(f"Field '{name}' must be a non-empty string")
+        values.append(value)
+    return values
+
+
+def _records(df, columns):
+    return json.loads(df[columns].to_json(orient='records'))
+
+
+def snapshot():
+    # Everything the server hands out, encoded once per state change: the GET views by path and
+    # the /nomination answers by player name
+    auction = _live.auction
+    df = auction.players_df
+    store = _live.store
+
+    draftable = df[store.free_agents & (df['BID'] > 0).to_numpy()].sort_values('BID', ascending=False)
+    bids = _records(draftable, ['PLAYER', 'POS', 'NHL TEAM', 'PTS', 'BID'])
+
+    lineup = _live.recommendation()
+    roster = [] if lineup is None else _records(lineup, ['PLAYER', 'POS', 'FCHL TEAM', 'STATUS', 'PTS', 'SALARY', 'BID'])
+
+    league = LeagueModel(auction)
+    teams = [
+        {'team': team, 'cap_left': round(league.cap_left[team], 1), 'needs': league.needs[team]}
+        for team in league.teams
+    ]
+
+    summary = {
+        'dollar_per_z': _live.dollar_per_z,
+        'available_to_spend': round(_live.available_to_spend, 1),
+        'points': None if lineup is None else int(lineup['PTS'].sum()),
+        'spent': None if lineup is None else round(float((lineup['SALARY'] + lineup['BID']).sum()), 1),
+    }
+
+    views = {'/bids': bids, '/lineup': {**summary, 'players': roster}, '/teams': teams, '/summary': summary}
+    return {path: json.dumps(view).encode() for path, view in views.items()}, nominations(lineup)
+
+
+def nominations(lineup):
+    # Every player's current bid and whether BOT's lineup wants him, by name. A name find_player
+    # cannot resolve (shared by several rostered players) maps to its error message instead.
+    df = _live.auction.players_df
+    in_lineup = set() if lineup is None else set(lineup.index)
+    positions = df['POS'].astype(str).tolist()
+    points = df['PTS'].tolist()
+    bids = df['BID'].tolist()
+
+    answers = {}
+    for name in _live.store.name_rows:
+        try:
+            idx = _live.find_player(name)
+        except ValueError as e:
+            answers[name] = str(e)
+            continue
+        answers[name] = json.dumps({
+            'player': name, 'pos': positions[idx], 'pts': int(points[idx]), 'bid': float(bids[idx]),
+            'in_lineup': idx in in_lineup,
+        }).encode()
+    return answers
+
+
+def apply_sale(player, team, price):
+    _, elapsed = _live.record_sale(player, team, price)
+    return snapshot(), elapsed
+
+
+class AuctionServer:
+    def __init__(self, csv_path, backend='scip', host='127.0.0.1', port=8765):
+        self.csv_path = csv_path
+        self.backend = backend
+        self.host = host
+        self.port = port
+
+        # Latest encoded views and nomination answers; replaced as a whole, so a read never sees
+        # a half-applied sale
+        self.views = {}
+        self.nominations = {}
+        self.version = 0
+        self.sales = []
+        self.executor = None
+
+    async def start(self):
+        # One worker keeps sales in order and owns the only copy of the auction state
+        context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        self.executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=context, initializer=_init_worker, initargs=(self.csv_path, self.backend)
+        )
+
+        loop = asyncio.get_running_loop()
+        self.views, self.nominations = await loop.run_in_executor(self.executor, snapshot)
+        return await asyncio.start_server(self.handle, self.host, self.port)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def route(self, method, path, body):
+        loop = asyncio.get_running_loop()
+
+        if method == 'GET' and path in self.views:
+            return 200, self.views[path]
+
+        if method == 'GET' and path == '/sales':
+            return 200, json.dumps({'version': self.version, 'sales': self.sales}).encode()
+
+        if method == 'POST' and path == '/sale':
+            player, team, price = parse_event(body, {'player': str, 'team': str, 'price': float})
+            if team not in PENALTIES:
+                raise ValueError(f"Unknown team: {team}")
+
+            (views, nominations), elapsed = await loop.run_in_executor(self.executor, apply_sale, player, team, price)
+            self.views, self.nominations = views, nominations
+            self.version += 1
+            self.sales.append({'player': player, 'team': team, 'price': price})
+            return 200, json.dumps({'version': self.version, 'elapsed': elapsed}).encode()
+
+        if method == 'POST' and path == '/nomination':
+            # A read: answered here from the last state, even while a sale is solving
+            player, = parse_event(body, {'player': str})
+            answer = self.nominations.get(player)
+            if answer is None:
+                raise ValueError(f"Unknown player: {player}")
+            if isinstance(answer, str):
+                raise ValueError(answer)
+            return 200, answer
+
+        return 404, json.dumps({'error': f"No route for {method} {path}"}).encode()
+
+    async def handle(self, reader, writer):
+        # Minimal HTTP/1.1: one request per connection, JSON in and out
+        start_time = time.perf_counter()
+        try:
+            request_line = await reader.readline()
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            status, payload = await self.route(method, urlsplit(target).path, body)
+        except (ValueError, KeyError) as e:
+            # Bad JSON, missing fields, unknown players and teams all come back as ValueError/KeyError
+            status, payload = 400, json.dumps({'error': str(e)}).encode()
+        except Exception as e:
+            status, payload = 500, json.dumps({'error': f"{type(e).__name__}: {e}"}).encode()
+
+        reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}[status]
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nX-Elapsed-Ms: {(time.perf_counter() - start_time) * 1000:.2f}\r\n"
+            f"Connection: close\r\n\r\n".encode() + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(csv_path, backend, port):
+    server = AuctionServer(csv_path, backend, port=port)
+    listener = await server.start()
+    print(f"Serving on http://{server.host}:{server.port} "
+          f"(GET /bids /lineup /teams /summary /sales, POST /sale /nomination)")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    backend = sys.argv[2] if len(sys.argv) > 2 else 'scip'
+    port = int(sys.argv[3]) if len(sys.argv) > 3 else 8765
+
+    try:
+        asyncio.run(serve(csv_path, backend, port))
+    except KeyboardInterrupt:
+        pass
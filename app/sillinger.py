@@ -1,12 +1,16 @@
+import hashlib
 import time
+import numpy as np
 import pandas as pd 
-import json
-from rich.console import Console
-from rich.table import Table
-from tabulate import tabulate
 
+from instrumentation import StageTimer
+from league_config import get_league_config
+from player_store import PlayerStore
+from solvers import get_backend
+from zscores import ZScoreEngine
 
-from pyscipopt import Model
+
+from pyscipopt import Model, quicksum
 
 """
 Todo:
@@ -15,12 +19,15 @@ Todo:
 # Colour Bot Players and Prints
 """
 
-# Load teams from the JSON file
-with open('teams.json', 'r') as file:
-    teams_data = json.load(file)
+# Teams and penalties parsed once from teams.json and shared by every stage
+LEAGUE = get_league_config()
+PENALTIES = LEAGUE.penalties
 
-# Extract penalties from the teams data
-PENALTIES = {team: data['penalty'] for team, data in teams_data.items()}
+# Names of the values process_data returns, in order
+VALUATION_FIELDS = (
+    'total_pool', 'committed_salary', 'available_to_spend', 'player_count',
+    'total_z', 'total_bid_sum', 'restrict', 'dollar_per_z',
+)
 
 # Constants
 SALARY = 56.8
@@ -31,23 +38,52 @@ DEFENCE = 7
 GOALIE = 3
 
 class FantasyAuction:
-    def __init__(self, csv_path):
+    def __init__(self, csv_path, verbose=True, store=None, salary_cap=SALARY, roster=None, penalties=None,
+                 min_salary=MIN_SALARY, league_size=TEAMS, profiler=None, categories=None):
         self.csv_path = csv_path
-        self.players_df = self.load_data()
+        # When False the valuation runs without printing the baselines and bid tables
+        self.verbose = verbose
+        # The SCIP model is only created by build_model
+        self.model = None
+        # Per-stage wall time, peak memory and row counts when an instrumentation.Profiler is
+        # passed; otherwise a StageTimer keeps only the wall times
+        self.profiler = profiler if profiler is not None else StageTimer()
+
+        # Scenario settings, defaulting to the league constants
+        self.salary_cap = salary_cap  # BOT's budget in the optimizer
+        self.roster = roster if roster is not None else {'F': FORWARD, 'D': DEFENCE, 'G': GOALIE}
+        self.penalties = penalties if penalties is not None else PENALTIES
+        self.min_salary = min_salary  # Lowest bid, and what every draftable player is worth at Z = 0
+        self.league_size = league_size  # Teams sharing the pool: scales the cap pool and position baselines
+        # A categories.CategoryValuation values players on several stat columns; the combined
+        # VALUE column then replaces PTS in the z-scores and the optimizer's objective
+        self.categories = categories
+        self.value_column = 'PTS'
+        # Digest of the inputs the current model_* arrays were extracted from
+        self.model_data_key = None
+        self.model_key = None  # model_data_key the SCIP model was built from
+        self.model_forced = []
+        self.model_excluded = []
+
+        # An already loaded store (e.g. shared by scenario workers) skips the CSV read
+        if store is not None:
+            self.store = store
+            self.players_df = store.df
+        else:
+            self.players_df = self.load_data()
 
     def load_data(self):
         try:
-            # Load the data into a DataFrame
-            df = pd.read_csv(
-                self.csv_path, 
-                dtype={'AGE': int, 'PTS': int, 'SALARY': float, 'BID': float}
-            )
+            # Load the data into a typed store with precomputed masks and indexes
+            with self.profiler.stage('load') as stage:
+                self.store = PlayerStore(self.csv_path, teams=self.penalties.keys())
+                stage['rows'] = len(self.store.df)
 
         except Exception as e:
             print(f"Error reading the CSV file: {e}")
             exit(1)  # Exit the script
 
-        return df
+        return self.store.df
 
     def process_data(self):
         if self.players_df is None:
@@ -56,142 +92,139 @@ class FantasyAuction:
     
         # Initialize the Draftable column to NO
         self.players_df['Draftable'] = "NO"  
-        # Fill missing values in the 'STATUS' column with 'NO'
-        self.players_df['STATUS'] = self.players_df['STATUS'].fillna('NO')
+        # Missing 'STATUS' values are filled with 'NO' when the store loads the CSV
         # Set the salary of players with 'FCHL TEAM' as 'RFA', 'UFA', or 'ENT' to 0
-        self.players_df.loc[self.players_df['FCHL TEAM'].isin(['RFA', 'UFA', 'ENT']), 'SALARY'] = 0
+        self.players_df.loc[self.store.free_agents, 'SALARY'] = 0
 
-        total_pool = SALARY * TEAMS
+        total_pool = SALARY * self.league_size
         # Calculate the sum of the salaries of players with 'STATUS' as 'START' or 'MINOR' and 'GROUP' as 2 or 3
-        committed_salary = self.players_df[
-            (self.players_df['STATUS'] == 'START') |
-            ((self.players_df['STATUS'] == 'MINOR') & (self.players_df['GROUP'].isin(['2', '3'])))
-        ]['SALARY'].sum()
+        committed_salary = self.players_df.loc[self.store.committed, 'SALARY'].sum()
         # Calculate the sum of the penalties
-        total_penalties = sum(PENALTIES.values())   
+        total_penalties = sum(self.penalties.values())   
         # Add the sum of the penalties to committed_salary
         committed_salary += total_penalties     
         available_to_spend = total_pool - committed_salary
-        player_count, total_z = self.calculate_z_scores()
-        total_bid_sum, restrict, dollar_per_z = self.update_bids(player_count, total_z, available_to_spend)
-        return total_pool, committed_salary, available_to_spend, player_count, total_z, total_bid_sum, restrict, dollar_per_z
-
-    def calculate_z_scores(self):
-
-        grouped_players = self.players_df.groupby('POS')
-
-        F_baseline = FORWARD * TEAMS
-        D_baseline = DEFENCE * TEAMS
-        G_baseline = GOALIE * TEAMS
-
-        player_count = 0  # Initialize the counter
-        total_z = 0 
-
-        # Loop over each player group to perform calculations
-        for pos, group in grouped_players:
-            # Sort the group by points in descending order, and filter out 'MINOR' players
-            group = group[group['STATUS'] != 'MINOR'].sort_values('PTS', ascending=False)
-
-            if pos == 'F':
-                baseline = F_baseline
-            elif pos == 'D':
-                baseline = D_baseline
-            elif pos == 'G':
-                baseline = G_baseline
-            else:
-                continue
-
-            print(f"Initial {pos} Baseline: {baseline}")
-
-            # Slice the DataFrame first, then apply the boolean condition
-            below_baseline_slice = group.iloc[baseline:]
-            below_baseline_start_players = below_baseline_slice[below_baseline_slice['STATUS'] == 'START']
-            count_below_baseline_start = below_baseline_start_players.shape[0]
 
-            print(f"Count Below Baseline for {pos}: {count_below_baseline_start}")
+        if self.categories is not None:
+            with self.profiler.stage('categories', rows=len(self.players_df)):
+                self.players_df['VALUE'] = self.categories.value(self).round(2)
+            self.value_column = 'VALUE'
 
-            # Adjust the baseline
-            adjusted_baseline = baseline - count_below_baseline_start
-            print(f"Adjusted Baseline for {pos}: {adjusted_baseline}")
+        with self.profiler.stage('z_scores', rows=len(self.players_df)) as stage:
+            player_count, total_z = self.calculate_z_scores()
+            stage['draftable'] = player_count
 
+        with self.profiler.stage('bids', rows=player_count):
+            total_bid_sum, restrict, dollar_per_z = self.update_bids(player_count, total_z, available_to_spend)
+        return total_pool, committed_salary, available_to_spend, player_count, total_z, total_bid_sum, restrict, dollar_per_z
 
-            # Select the top players using the adjusted baseline
-            top_players = group.head(adjusted_baseline)
-
-            # Further processing with top_players if needed
-            #with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.expand_frame_repr', False):
-                #print(top_players[['PLAYER', 'POS', 'PTS', 'FCHL TEAM']])
-                #print("\n")
-
-            # if pos == 'F':
-            #     top_players = group.head(F_baseline)
-            # elif pos == 'D':
-            #     top_players = group.head(D_baseline)
-            # elif pos == 'G':
-            #     top_players = group.head(G_baseline)
-            # else:
-            #     continue
-
-            # Filter out players with 'FCHL TEAM' as 'ENT', 'RFA', or 'UFA'
-            filtered_top_players = top_players[top_players['FCHL TEAM'].isin(['ENT', 'RFA', 'UFA'])]
-
-            # Use .loc to update the Draftable column in self.players_df for filtered_top_players
-            draftable_indices = filtered_top_players.index
-            self.players_df.loc[draftable_indices, 'Draftable'] = "YES"
-
-            #print(f"Filtered {pos} Players:")
-            #print(filtered_top_players)
-
-            # Update the counter with the number of rows in filtered_top_players
-            player_count += len(filtered_top_players)
-
-            # Calculate Z-scores for filtered top players
-            points = filtered_top_players['PTS']
-            mean_pts = points.mean()
-            stdev_pts = points.std()
-
-            if stdev_pts == 0:
-                stdev_pts = 1  # Avoid division by zero
-
-            # Calculate and assign Z-scores directly in the DataFrame
-            z_scores = (points - mean_pts) / stdev_pts
-            z_scores -= z_scores.min()  # Standardize Z-scores so the minimum is 0
-
-            self.players_df.loc[draftable_indices, 'Z-score'] = z_scores.round(2)
-
-            total_z += z_scores.sum()
+    def calculate_z_scores(self):
+        # Per-position (player_count, total_z) so a single position can be revalued later
+        self.position_z = self.value_positions()
 
+        player_count = sum(count for count, _ in self.position_z.values())
+        total_z = sum(total for _, total in self.position_z.values())
         return player_count, total_z
-    
-    def build_model(self):
-        self.model = Model("PlayerSelection")
 
-        # Set the verbosity level to suppress output
-        self.model.setParam('display/verblevel', 1)  # Turns off output verbosity
-    
-        self.player_vars = {}
-
-        # Filter players based on specific criteria and remove players with Bid = 0
-        self.filtered_df = self.players_df[
-            ((self.players_df['FCHL TEAM'].isin(['ENT', 'UFA', 'RFA'])) & (self.players_df['BID'] > 0)) |
-            ((self.players_df['FCHL TEAM'] == 'BOT') & (self.players_df['STATUS'] == 'START'))
-        ]
-
-        for i, row in self.filtered_df.iterrows():
-            player_name = row['PLAYER']
-            player_position = row['POS']
-            self.player_vars[i] = self.model.addVar(vtype="B", name=f"{player_name}_{player_position}")
-
-        self.model.setObjective(
-            sum(row['PTS'] * self.player_vars[i] for i, row in self.filtered_df.iterrows()),
-            "maximize"
-        )
+    def calculate_position_z_scores(self, pos):
+        # Revalue one position, e.g. after a sale; None when the roster has no slots for it
+        return self.value_positions([pos]).get(pos)
+
+    def value_positions(self, positions=None):
+        # Baselines and z-scores of the roster positions (all of them, or just `positions`) in one
+        # grouped pass over the players; see zscores.py
+        engine = ZScoreEngine.from_store(self.store, self.roster, self.league_size, positions)
+        result = engine.compute(self.players_df[self.value_column].to_numpy(dtype=float))
+
+        if self.verbose:
+            for code, pos in enumerate(engine.positions):
+                print(f"Initial {pos} Baseline: {result.baseline[code]}")
+                print(f"Count Below Baseline for {pos}: {result.below_baseline[code]}")
+                print(f"Adjusted Baseline for {pos}: {result.adjusted_baseline[code]}")
+
+        # Free agents inside their position's adjusted baseline are draftable
+        draftable_indices = np.flatnonzero(result.draftable)
+        self.players_df.loc[draftable_indices, 'Draftable'] = "YES"
+        self.players_df.loc[draftable_indices, 'Z-score'] = result.z_scores[draftable_indices].round(2)
+
+        return {
+            pos: (int(result.count[code]), float(result.total[code])) for code, pos in enumerate(engine.positions)
+        }
+
+    def extract_model_data(self, forced=(), excluded=()):
+        with self.profiler.stage('extract') as stage:
+            # Filter players based on specific criteria and remove players with Bid = 0
+            # BOT starters plus any forced rows must be in the lineup, excluded rows never are
+            must_include = np.zeros(len(self.players_df), dtype=bool)
+            must_include[self.store.team_start('BOT')] = True
+            must_include[list(forced)] = True
+            must_exclude = np.zeros(len(self.players_df), dtype=bool)
+            must_exclude[list(excluded)] = True
+
+            self.filtered_df = self.players_df[
+                ((self.store.free_agents & (self.players_df['BID'] > 0).to_numpy()) | must_include) & ~must_exclude
+            ]
+
+            # Extract every coefficient the model needs as column vectors in one pass
+            self.model_points = self.filtered_df[self.value_column].to_numpy(dtype=float)
+            self.model_costs = (self.filtered_df['SALARY'] + self.filtered_df['BID']).to_numpy(dtype=float)
+            self.model_positions = self.filtered_df['POS'].astype(str).to_numpy()
+            self.model_must_include = must_include[self.filtered_df.index]
+            self.model_forced = list(forced)
+            self.model_excluded = list(excluded)
+            self.model_data_key = self.model_inputs_key(forced, excluded)
+            stage['rows'] = len(self.filtered_df)
+
+    def model_inputs_key(self, forced=(), excluded=()):
+        # Digest of the live columns and masks extract_model_data reads, so stale model data is
+        # caught after a sale, a revalue or a penalty change
+        df = self.players_df
+        digest = hashlib.sha1()
+        for col in [self.value_column, 'SALARY', 'BID']:
+            digest.update(df[col].to_numpy(dtype=np.float64).tobytes())
+        digest.update(df['POS'].cat.codes.to_numpy().tobytes())
+        digest.update(df['FCHL TEAM'].cat.codes.to_numpy().tobytes())
+        digest.update(self.store.start.tobytes())
+        digest.update(self.store.free_agents.tobytes())
+        digest.update(repr((sorted(int(i) for i in forced), sorted(int(i) for i in excluded))).encode())
+        return digest.hexdigest()
+
+    def model_data_current(self):
+        # True when the model_* arrays match the players as they are now
+        return self.model_data_key == self.model_inputs_key(self.model_forced, self.model_excluded)
+
+    def model_current(self):
+        # True when the SCIP model was built, or edited in place, for the current model data
+        return self.model is not None and self.model_key == self.model_data_key and self.model_data_current()
+
+    def build_model(self, forced=(), excluded=()):
+        with self.profiler.stage('build'):
+            self.model = Model("PlayerSelection")
+
+            # Set the verbosity level to suppress output
+            self.model.setParam('display/verblevel', 1)  # Turns off output verbosity
+
+            self.extract_model_data(forced, excluded)
+            self.model_key = self.model_data_key
+            names = (self.filtered_df['PLAYER'] + '_' + self.filtered_df['POS'].astype(str)).tolist()
+
+            # The objective is set through the variable coefficients instead of a summed expression
+            with self.profiler.stage('variables', rows=len(names)):
+                self.model_vars = [
+                    self.model.addVar(vtype="B", name=name, obj=points)
+                    for name, points in zip(names, self.model_points.tolist())
+                ]
+                self.model.setMaximize()
+                self.player_vars = dict(zip(self.filtered_df.index, self.model_vars))
 
-        self.add_constraints(self.player_vars)
+            with self.profiler.stage('constraints'):
+                self.add_constraints(self.player_vars, self.model_must_include)
 
     def solve_model(self):
         try:
-            self.model.optimize()
+            with self.profiler.stage('solve', rows=len(self.model_vars)) as stage:
+                self.model.optimize()
+                self.profiler.record_scip(self.model, stage)
             status = self.model.getStatus()
             if status == "optimal":
                 return self.get_solution()
@@ -207,121 +240,85 @@ class FantasyAuction:
             print(f"An unexpected error occurred during optimization: {e}")
             return None
 
-    def add_constraints(self, player_vars):
+    def add_constraints(self, player_vars, must_include):
         if self.filtered_df.empty:
             print("Error: No players to consider in the optimization.")
             return
 
-        # Identify players that must be included in the team
-        must_include_players = self.filtered_df.index[
-            (self.filtered_df['FCHL TEAM'] == 'BOT') & (self.filtered_df['STATUS'] == 'START')
-        ]
-
-        # Constraint 1: Sum of the "Bid" values must be under 56.8
-        self.model.addCons(
-            sum((row['SALARY'] + row['BID']) * player_vars[i] for i, row in self.filtered_df.iterrows()) <= SALARY
+        # Constraint 1: Sum of the "Bid" values must be under the cap (56.8)
+        self.budget_cons = self.model.addCons(
+            quicksum(cost * var for cost, var in zip(self.model_costs.tolist(), self.model_vars)) <= self.salary_cap
         )
 
-        # Constraint 3: Must have X Players with F in their Pos Column
-        self.model.addCons(
-            sum(player_vars[i] for i, row in self.filtered_df.iterrows() if row['POS'] == 'F') == FORWARD
-        )
+        # Constraints 3-5: Must have X Players with F, D and G in their Pos Column
+        # Kept by position so they can be edited in place
+        self.position_cons = {}
+        for pos, count in self.roster.items():
+            position_vars = [self.model_vars[k] for k in np.flatnonzero(self.model_positions == pos)]
+            self.position_cons[pos] = self.model.addCons(quicksum(position_vars) == count)
 
-        # Constraint 4: Must have X Players with D in their Pos Column
-        self.model.addCons(
-            sum(player_vars[i] for i, row in self.filtered_df.iterrows() if row['POS'] == 'D') == DEFENCE
-        )
+        # Constraint: Must include players from BOT team with status "start" and forced players
+        for k in np.flatnonzero(must_include):
+            self.model.chgVarLb(self.model_vars[k], 1)
 
-        # Constraint 5: Must have X Players with G in their Pos Column
-        self.model.addCons(
-            sum(player_vars[i] for i, row in self.filtered_df.iterrows() if row['POS'] == 'G') == GOALIE
-        )
+    @property
+    def timings(self):
+        # Seconds spent in each stage of the latest valuation, model build and solve
+        return self.profiler.timings
 
-        # Constraint: Must include players from BOT team with status "start"
-        for i in must_include_players:
-            self.model.addCons(player_vars[i] == 1)
-        pass
+    def print_timings(self):
+        # Compare the time spent building the model with the solve itself
+        print("Timing breakdown:")
+        for stage, seconds in self.timings.items():
+            print(f"  {stage:<12} {seconds * 1000:8.1f} ms")
 
     def get_solution(self):
         best_solution = self.model.getBestSol()
         return best_solution
 
+    def solve_lineup(self, backend='scip', cache=None):
+        # Solve BOT's selection with the named backend ('scip' or 'dp') and return a Lineup,
+        # through a solve_cache.SolveCache when one is given
+        if cache is not None:
+            return cache.solve(self, backend)
+        return get_backend(backend).solve(self)
+
+    def warm_start(self, incumbent):
+        # Hand a previous lineup ({row: value}, missing rows are 0) to SCIP as a starting solution
+        solution = self.model.createSol()
+        for i, value in incumbent.items():
+            if i in self.player_vars:
+                self.model.setSolVal(solution, self.player_vars[i], value)
+        self.model.addSol(solution)
+
+    def selected_players(self, best_solution):
+        # Rows of filtered_df picked in the solution
+        selected = [i for i in self.filtered_df.index if best_solution[self.player_vars[i]] > 0.5]
+        return self.filtered_df.loc[selected]
+
     def update_bids(self, player_count, total_z, available_to_spend):
-        restrict = player_count * MIN_SALARY
+        restrict = player_count * self.min_salary
         #print(f"Restricted amount: {restrict}")
 
         dollar_per_z = (available_to_spend - restrict) / total_z
         #print(f"Dollar per Z-score: {dollar_per_z}")
 
-        self.players_df.loc[self.players_df['Draftable'] == 'YES', 'BID'] = (self.players_df['Z-score'] * dollar_per_z) + MIN_SALARY
+        self.players_df.loc[self.players_df['Draftable'] == 'YES', 'BID'] = (self.players_df['Z-score'] * dollar_per_z) + self.min_salary
         self.players_df['BID'] = self.players_df['BID'].round(1)
 
-        # Split the DataFrame into three tables based on position
-        goalies_df = self.players_df[self.players_df['POS'] == 'G']
-        defenders_df = self.players_df[self.players_df['POS'] == 'D']
-        forwards_df = self.players_df[self.players_df['POS'] == 'F']
-
-        console = Console()
-
-        # Function to print DataFrame with numbering and summary using tabulate and rich
-        def print_table_with_summary(df, position):
-            df = df.sort_values(by='PTS', ascending=False)  # Sort by PTS column in descending order
-            df = df.reset_index(drop=True)
-            df.index += 1
-
-            # Drop the 'Draftable' column for display purposes
-            df = df.drop(columns=['Draftable'])
-
-            # Prepare the table using tabulate
-            table_str = tabulate(df, headers='keys', tablefmt="grid", showindex=False)
-
-            # Split the table into lines for coloring
-            table_lines = table_str.split("\n")
-
-            # Create a rich Table
-            rich_table = Table(title=f"{position} Table", show_header=True, header_style="bold grey70")
-
-            # Add a custom column for row numbering
-            rich_table.add_column("No.", justify="right", style="cyan")
-    
-            # Add columns, setting min_width for "Player" column to avoid wrapping
-            for col in df.columns:
-                if col == "Player":  # Adjust width specifically for the "Player" column
-                    rich_table.add_column(col, min_width=55)  # Increase the width for "Player"
-                else:
-                    rich_table.add_column(col)
-
-            # Add rows to the rich table, color those where 'FCHL TEAM' == 'BOT'
-            for index, row in df.iterrows():
-                row_str = [str(item) for item in row]
-                row_number = str(index + 0)  # Row number starts from 1
-
-                if row['FCHL TEAM'] == 'BOT':
-                    rich_table.add_row(row_number, *row_str, style="bold bright_magenta")  # Color the row red
-            # Color the row green if 'FCHL TEAM' is 'UFA' or 'RFA'
-                elif row['FCHL TEAM'] == 'UFA' or row['FCHL TEAM'] == 'RFA':
-                    rich_table.add_row(row_number, *row_str, style="bold bright_green")
-                else:
-                    rich_table.add_row(row_number, *row_str)
-
-            # Print the rich table with color
-            console.print(rich_table)
-
-            # Print summary with color formatting
-            console.print(f"Number of {position} with Bid > 0: {len(df[df['BID'] > 0])}", style="bright_yellow")
-            console.print(f"Number of {position} with Status == 'START': {len(df[df['STATUS'] == 'START'])}", style="bright_yellow")
-            console.print(f"Sum of Bid column for {position}: {df['BID'].sum()}", style="bright_yellow")
-            console.print("\n")
-
-        # Print the tables with summaries
-        print_table_with_summary(forwards_df, "Forwards")
-        print_table_with_summary(defenders_df, "Defenders")
-        print_table_with_summary(goalies_df, "Goalies")
-
         total_bid_sum = self.players_df['BID'].sum()
 
+        if self.verbose:
+            with self.profiler.stage('render_bid_tables'):
+                self.print_bid_tables()
+
         return total_bid_sum, restrict, dollar_per_z
 
+    def print_bid_tables(self):
+        # Rendering lives in reporting, which is only imported when something is printed
+        from reporting import print_bid_tables
+        print_bid_tables(self)
+
     def write_to_csv(self):
         current_time = time.strftime("%Y-%m-%d_%H-%M-%S")  # Current time in seconds since the epoch (1970-01-01 00:00:00)
 
@@ -332,151 +329,56 @@ class FantasyAuction:
         self.players_df.to_csv(file_path, index=False)
 
     def print_results(self, total_pool, committed_salary, available_to_spend, player_count, total_z, total_bid_sum, restrict, dollar_per_z, best_solution):
+        from reporting import print_results
+        with self.profiler.stage('render_results'):
+            print_results(
+                self, total_pool, committed_salary, available_to_spend, player_count, total_z,
+                total_bid_sum, restrict, dollar_per_z, best_solution
+            )
 
-        print(f"TOTAL POOL: {total_pool}")
-
-        print(f"COMMITTED SALARY: {committed_salary:.1f}")
-
-        print(f"AVAILABLE TO SPEND: {available_to_spend:.1f}")
-
-        print(f"TOTAL Z: {total_z:.2f}")
-
-        print(f"Players to be auctioned: {player_count}")
-
-        print(f"$ Restriced during the Auciton: {restrict}")
-
-        print(f"DOLLAR_PER_Z: {dollar_per_z:.2f}")
-
-        print('=' * 90)
-
-        #with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.expand_frame_repr', False):
-            #print(self.players_df.drop(columns=['NHL TEAM', 'AGE']).head(100))
-
-        print("=" * 90)
-        print(f"Sum of all Bid Values: {total_bid_sum:.1f}")
-        print()
-        print("." * 90)
-        print()
-
-
-        # Load teams from teams.json
-        with open('teams.json', 'r') as file:
-            teams = json.load(file)
-        
-        # Group players by team
-        grouped = self.players_df.groupby('FCHL TEAM')
-
-        # Function to format tables side by side
-        def format_side_by_side(table1, table2):
-            table1_lines = table1.split('\n')
-            table2_lines = table2.split('\n')
-            
-            max_lines = max(len(table1_lines), len(table2_lines))
-            table1_lines += [''] * (max_lines - len(table1_lines))
-            table2_lines += [''] * (max_lines - len(table2_lines))
-            
-            combined_lines = [f"{line1:<60} {line2}" for line1, line2 in zip(table1_lines, table2_lines)]
-            return '\n'.join(combined_lines)
-
-        # Custom sorting key for positions
-        def position_sort_key(pos):
-            if pos == 'F':
-                return 0
-            elif pos == 'D':
-                return 1
-            elif pos == 'G':
-                return 2
-            return 3
-
-        # Iterate over each team and calculate the summary
-        for team_name in teams:
-            team_players = grouped.get_group(team_name) 
-            
-            # Calculate the number of each position where status = 'START'
-            start_counts = team_players[team_players['STATUS'] == 'START']['POS'].value_counts()
-            num_start_f = start_counts.get('F', 0)
-            num_start_d = start_counts.get('D', 0)
-            num_start_g = start_counts.get('G', 0)
-            
-            # Calculate the number of each position where status = 'MINOR'
-            minor_counts = team_players[team_players['STATUS'] == 'MINOR']['POS'].value_counts()
-            num_minor_f = minor_counts.get('F', 0)
-            num_minor_d = minor_counts.get('D', 0)
-            num_minor_g = minor_counts.get('G', 0)
-
-            # Calculate the total number of players with STATUS = 'START' and 'MINOR'
-            total_start_players = team_players[team_players['STATUS'] == 'START'].shape[0]
-            total_minor_players = team_players[team_players['STATUS'] == 'MINOR'].shape[0]
-
-            # Calculate the sum of points for players with STATUS = 'START'
-            total_pts_start = team_players[team_players['STATUS'] == 'START']['PTS'].sum()
-            
-            # Calculate the sum of salaries
-            total_salary = team_players[
-                (team_players['STATUS'] == 'START') | 
-                ((team_players['STATUS'] == 'MINOR') & (team_players['GROUP'].isin(["2", "3"])))
-            ]['SALARY'].sum()
-
-            # Prepare the summary table
-            summary_table = [
-                    ["START - F", num_start_f],
-                    ["START - D", num_start_d],
-                    ["START - G", num_start_g],
-                    ["MINOR - F", num_minor_f],
-                    ["MINOR - D", num_minor_d],
-                    ["MINOR - G", num_minor_g],
-                    ["-"*18, "-"*4],  # Separator line
-                    ["Total START Players", total_start_players],
-                    ["Total MINOR Players", total_minor_players],
-                    ["Total PTS (START)", total_pts_start],
-                    ["-"*18, "-"*4],  # Separator line
-                    ["Total Salary", round(total_salary, 2)]
-                ]
+    def team_summary(self):
+        # START/MINOR counts per position, START points and committed salary for every team
+        # in this auction, counted in one pass over the team codes
+        df = self.players_df
+        store = self.store
+
+        categories = df['FCHL TEAM'].cat.categories
+        team_codes = df['FCHL TEAM'].cat.codes.to_numpy()
+        has_team = team_codes >= 0
 
-            # Sort the players by STATUS, custom POS order, and PTS
-            sorted_players = team_players.sort_values(
-                by=['STATUS', 'POS', 'PTS'], 
-                ascending=[False, True, False], 
-                key=lambda col: col.map(position_sort_key) if col.name == 'POS' else col
+        def per_team(mask, weights=None):
+            mask = mask & has_team
+            return np.bincount(
+                team_codes[mask], weights=None if weights is None else weights[mask], minlength=len(categories)
             )
-            
-            # Prepare the players table
-            players_table = sorted_players[['PLAYER', 'GROUP', 'POS', 'STATUS', 'PTS', 'SALARY']].values.tolist()
-            
-            # Convert tables to string format
-            players_table_str = tabulate(players_table, headers=["Player", "Pos", "Status", "Pts", "Salary"], tablefmt="fancy_outline")
-            summary_table_str = tabulate(summary_table, headers=["Category", "Count"], tablefmt="fancy_outline")
-    
-            # Print the summary for the team
-            print("-" * 110)
-            print(f"{team_name}")
-            print("-" * 110)
-            print(format_side_by_side(players_table_str, summary_table_str))
-            #print()
-
-        solution_data = []
-        
-        for i, row in self.filtered_df.iterrows():
-            if best_solution[self.player_vars[i]] > 0.5:  # If the player is selected in the solution
-                solution_data.append([
-                    row['PLAYER'],
-                    row['POS'],
-                    row['NHL TEAM'],
-                    row['STATUS'],
-                    row['PTS'],
-                    row['SALARY'],
-                    row['BID']
-                ])
-
-        headers = ["Player", "Position", "NHL Team", "Status", "Points", "Salary", "Bid"]
-
-        print()
-        print("|" * 110)
-        print("|" * 110)
-        print()
-                  
-        print("Optimized Team for BOT:")
-        print(tabulate(solution_data, headers=headers, tablefmt="fancy_outline"))
+
+        summary = {}
+        for status, status_mask in (('START', store.start), ('MINOR', store.minor)):
+            for pos in self.roster:
+                in_position = np.zeros(len(df), dtype=bool)
+                in_position[store.positions.get(pos, [])] = True
+                summary[f'{status} {pos}'] = per_team(status_mask & in_position)
+        summary['START'] = per_team(store.start)
+        summary['MINOR'] = per_team(store.minor)
+        summary['PTS'] = per_team(store.start, df['PTS'].to_numpy(dtype=float)).astype(int)
+        summary['SALARY'] = per_team(store.committed, df['SALARY'].to_numpy(dtype=float))
+
+        return pd.DataFrame(summary, index=categories).loc[list(self.penalties)]
+
+    def compute(self, backend='scip'):
+        # Headless run: valuation, BOT lineup and team summaries as data. Nothing is rendered
+        # unless the auction was created with verbose=True.
+        valuation = dict(zip(VALUATION_FIELDS, self.process_data()))
+        lineup = self.solve_lineup(backend)
+
+        return {
+            'valuation': valuation,
+            'players': self.players_df,
+            'status': lineup.status,
+            'lineup': lineup.players(self) if lineup.status == 'optimal' else None,
+            'points': lineup.points,
+            'teams': self.team_summary(),
+        }
 
 if __name__ == "__main__":
     # Instantiate the FantasyAuction class
@@ -492,3 +394,5 @@ if __name__ == "__main__":
     # Print the results
     if best_solution is not None:
         fantasy_auction.print_results(total_pool, committed_salary, available_to_spend, player_count, total_z, total_bid_sum, restrict, dollar_per_z, best_solution)
+
+    fantasy_auction.print_timings()
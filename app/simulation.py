@@ -0,0 +1,93 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sillinger import FantasyAuction, VALUATION_FIELDS
+from zscores import ZScoreEngine
+
+
+class ProjectionSimulator:
+    def __init__(self, auction, sd_column='PTS_SD', relative_sd=0.15, seed=None):
+        self.auction = auction
+        self.rng = np.random.default_rng(seed)
+
+        # Deterministic valuation first: it zeroes free-agent salaries and gives the spend pool
+        valuation = dict(zip(VALUATION_FIELDS, auction.process_data()))
+        self.available_to_spend = valuation['available_to_spend']
+
+        df = auction.players_df
+        store = auction.store
+
+        # Draws move the auction's own value column (PTS, or VALUE with categories) and its floor
+        self.points = df[auction.value_column].to_numpy(dtype=float)
+        self.min_salary = auction.min_salary
+
+        # Per-player standard deviation from the data when present, else a share of the value.
+        # The data's spread is in PTS, so category values always use the share.
+        if sd_column in df.columns and auction.value_column == 'PTS':
+            self.sd = df[sd_column].fillna(0).to_numpy(dtype=float)
+        else:
+            self.sd = self.points * relative_sd
+
+        # Positions, baselines and player masks are fixed for every draw
+        self.engine = ZScoreEngine.from_store(store, auction.roster, auction.league_size)
+        self.free_agents = store.free_agents
+
+    def draw_bids(self, draws):
+        # Returns a (draws, players) array of bids; non-draftable entries are 0
+        pts = self.points + self.sd * self.rng.standard_normal((draws, len(self.points)))
+        pts = np.maximum(pts, 0)
+
+        result = self.engine.compute(pts)
+        player_count = result.count.sum(axis=1)
+        total_z = result.total.sum(axis=1)
+
+        restrict = player_count * self.min_salary
+        dollar_per_z = (self.available_to_spend - restrict) / total_z
+
+        bids = np.where(
+            result.draftable, (result.z_scores.round(2) * dollar_per_z[:, None] + self.min_salary).round(1), 0
+        )
+        return bids, dollar_per_z
+
+    def run(self, draws=10000, chunk_size=1000):
+        start_time = time.perf_counter()
+
+        chunks = []
+        dollar_per_z = []
+        for first in range(0, draws, chunk_size):
+            bids, chunk_dollar_per_z = self.draw_bids(min(chunk_size, draws - first))
+            # Only free agents carry a bid, so keep just their columns
+            chunks.append(bids[:, self.free_agents])
+            dollar_per_z.append(chunk_dollar_per_z)
+
+        bids = np.vstack(chunks)
+        self.dollar_per_z = np.concatenate(dollar_per_z)
+        self.elapsed = time.perf_counter() - start_time
+
+        df = self.auction.players_df
+        p10, p50, p90 = np.percentile(bids, [10, 50, 90], axis=0)
+
+        results = df.loc[self.free_agents, ['PLAYER', 'POS', 'FCHL TEAM', 'PTS', 'BID']].copy()
+        results['DRAFTABLE %'] = ((bids > 0).mean(axis=0) * 100).round(1)
+        results['BID MEAN'] = bids.mean(axis=0).round(2)
+        results['BID P10'] = p10
+        results['BID P50'] = p50
+        results['BID P90'] = p90
+
+        return results[results['DRAFTABLE %'] > 0].sort_values('BID P50', ascending=False)
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    draws = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    simulator = ProjectionSimulator(FantasyAuction(csv_path, verbose=False), seed=0)
+    results = simulator.run(draws)
+
+    with pd.option_context('display.max_rows', 60, 'display.width', 200):
+        print(results.head(60))
+    print(f"DOLLAR_PER_Z p10/p50/p90: {np.percentile(simulator.dollar_per_z, [10, 50, 90]).round(2)}")
+    print(f"Simulated {draws} draws over {len(simulator.points)} players in {simulator.elapsed:.2f} s")
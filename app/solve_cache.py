@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from solvers import Lineup, get_backend
+
+# Bump when the fingerprint or the stored entry changes shape
+SOLVE_CACHE_VERSION = 1
+
+
+class SolveCache:
+    def __init__(self, maxsize=256, cache_dir=None):
+        # Solved lineups keyed by a fingerprint of the model inputs. The newest maxsize entries
+        # stay in memory; with cache_dir entries are also written there as JSON and survive
+        # restarts, with the same maxsize bound on the files.
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.disk_entries = OrderedDict()  # Keys of the files in cache_dir, least recently used first
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            files = [name for name in os.listdir(cache_dir) if name.endswith('.json')]
+            files.sort(key=lambda name: os.path.getmtime(os.path.join(cache_dir, name)))
+            for name in files:
+                self.disk_entries[name[:-len('.json')]] = None
+            self.evict_files()
+
+    @staticmethod
+    def fingerprint(auction):
+        # Canonical inputs of BOT's selection: the candidate rows with their value, cost and POS,
+        # the must-include set, the cap and the roster counts. Rows are hashed in index order,
+        # so two extracts of the same question give the same key.
+        df = auction.filtered_df.sort_index()
+
+        must_include = set(auction.store.team_start('BOT').tolist())
+        must_include.update(auction.model_forced)
+
+        digest = hashlib.sha1()
+        digest.update(str(SOLVE_CACHE_VERSION).encode())
+        digest.update(df.index.to_numpy(dtype=np.int64).tobytes())
+        digest.update(df[getattr(auction, 'value_column', 'PTS')].to_numpy(dtype=np.float64).tobytes())
+        # Costs are compared on the $0.0001 grid so float noise from sums does not split entries
+        digest.update(np.round((df['SALARY'] + df['BID']).to_numpy(dtype=np.float64) * 1e4).astype(np.int64).tobytes())
+        digest.update('\0'.join(df['POS'].astype(str)).encode())
+        digest.update(np.isin(df.index, sorted(must_include)).tobytes())
+        digest.update(repr((round(float(auction.salary_cap), 4), sorted(auction.roster.items()))).encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        lineup = self.entries.get(key)
+        if lineup is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return lineup
+
+        if self.cache_dir is not None and os.path.exists(self.path(key)):
+            try:
+                with open(self.path(key), 'r') as file:
+                    entry = json.load(file)
+            except (OSError, ValueError):
+                return None
+            lineup = Lineup(entry['backend'], entry['status'], entry['rows'], entry['points'])
+            self.remember(key, lineup)
+            self.touch_file(key)
+            self.disk_hits += 1
+            return lineup
+
+        return None
+
+    def remember(self, key, lineup):
+        self.entries[key] = lineup
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def put(self, key, lineup):
+        self.remember(key, lineup)
+
+        if self.cache_dir is not None:
+            entry = {'backend': lineup.backend, 'status': lineup.status, 'rows': [int(row) for row in lineup.rows],
+                     'points': lineup.points}
+            # Write then rename, so a crash never leaves half an entry behind
+            tmp_path = self.path(key) + '.tmp'
+            try:
+                with open(tmp_path, 'w') as file:
+                    json.dump(entry, file)
+                os.replace(tmp_path, self.path(key))
+            except OSError as e:
+                print(f"Warning: could not write the solve cache: {e}")
+                return
+            self.disk_entries[key] = None
+            self.disk_entries.move_to_end(key)
+            self.evict_files()
+
+    def touch_file(self, key):
+        # The modification time orders the files by use across restarts
+        self.disk_entries[key] = None
+        self.disk_entries.move_to_end(key)
+        try:
+            os.utime(self.path(key))
+        except OSError:
+            pass
+
+    def evict_files(self):
+        while len(self.disk_entries) > self.maxsize:
+            key, _ = self.disk_entries.popitem(last=False)
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+
+    def cached_lineup(self, lineup, start_time):
+        return Lineup(lineup.backend, lineup.status, lineup.rows, lineup.points,
+                      time.perf_counter() - start_time, cached=True)
+
+    def solve(self, auction, backend='scip'):
+        # BOT's lineup for the auction's current model inputs, from the cache when this exact
+        # question was solved before
+        start_time = time.perf_counter()
+
+        # A sale, revalue or penalty change since the last extract leaves the model data stale;
+        # the key must describe the players as they are now
+        if not auction.model_data_current():
+            auction.extract_model_data(auction.model_forced, auction.model_excluded)
+
+        key = self.fingerprint(auction)
+        lineup = self.get(key)
+        if lineup is not None:
+            return self.cached_lineup(lineup, start_time)
+
+        # The model may still be one built for another question, e.g. the forced players of the
+        # last what_if hit, which only re-extracted
+        self.misses += 1
+        if backend == 'scip' and not auction.model_current():
+            auction.build_model(auction.model_forced, auction.model_excluded)
+        lineup = get_backend(backend).solve(auction)
+        self.put(key, lineup)
+        return lineup
+
+    def what_if(self, auction, forced=(), excluded=(), backend='scip'):
+        # One what-if click: only the cheap extract runs before the lookup, and the model is
+        # rebuilt for the forced/excluded players only on a miss
+        start_time = time.perf_counter()
+
+        auction.extract_model_data(forced, excluded)
+        key = self.fingerprint(auction)
+        lineup = self.get(key)
+        if lineup is not None:
+            return self.cached_lineup(lineup, start_time)
+
+        self.misses += 1
+        if backend == 'scip' and not auction.model_current():
+            auction.build_model(forced, excluded)
+        lineup = get_backend(backend).solve(auction)
+        self.put(key, lineup)
+        return lineup
+
+    def stats(self):
+        return {'entries': len(self.entries), 'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses}
+
+
+if __name__ == "__main__":
+    from sillinger import FantasyAuction
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '../data/players-24.csv'
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), '.cache', 'solves')
+
+    fantasy_auction = FantasyAuction(csv_path, verbose=False)
+    fantasy_auction.process_data()
+    cache = SolveCache(cache_dir=cache_dir)
+
+    # Clicking through forcing each of the ten priciest free agents, twice
+    free_agents = fantasy_auction.players_df[fantasy_auction.store.free_agents]
+    candidates = free_agents.nlargest(10, 'BID').index.tolist()
+
+    for round_number in range(2):
+        elapsed = []
+        for idx in candidates:
+            lineup = cache.what_if(fantasy_auction, forced=[idx])
+            elapsed.append(lineup.elapsed)
+        print(f"Round {round_number + 1}: {np.mean(elapsed) * 1000:.2f} ms per what-if, {cache.stats()}")
@@ -0,0 +1,119 @@
+import time
+
+import numpy as np
+
+from knapsack import on_grid, solve_roster, to_units
+
+
+class Lineup:
+    def __init__(self, backend, status, rows=(), points=None, elapsed=0.0, cached=False):
+        self.backend = backend
+        self.status = status
+        self.rows = list(rows)  # Row labels of players_df picked for BOT
+        self.points = points
+        self.elapsed = elapsed
+        self.cached = cached  # True when the lineup came from a SolveCache instead of a solve
+
+    def players(self, auction):
+        return auction.filtered_df.loc[self.rows]
+
+
+class ScipBackend:
+    name = 'scip'
+
+    def solve(self, auction):
+        start_time = time.perf_counter()
+
+        if auction.model is None:
+            auction.build_model()
+
+        best_solution = auction.solve_model()
+        if best_solution is None:
+            return Lineup(self.name, auction.model.getStatus(), elapsed=time.perf_counter() - start_time)
+
+        rows = [i for i, var in auction.player_vars.items() if best_solution[var] > 0.5]
+        return Lineup(
+            self.name, 'optimal', rows, auction.model.getObjVal(), time.perf_counter() - start_time
+        )
+
+
+class KnapsackBackend:
+    # Exact in-process DP over the discretised budget, one table per position merged across F/D/G
+    name = 'dp'
+
+    def solve(self, auction):
+        start_time = time.perf_counter()
+
+        # Re-extract when a sale or revalue changed the players since the last extract
+        if not auction.model_data_current():
+            auction.extract_model_data(auction.model_forced, auction.model_excluded)
+
+        # The DP is exact only when every cost sits on the $0.1 grid
+        if not on_grid(auction.model_costs) or not on_grid([auction.salary_cap]):
+            print("Warning: Costs are not on the $0.1 grid, falling back to SCIP.")
+            return ScipBackend().solve(auction)
+
+        must_include = auction.model_must_include
+        roster = dict(auction.roster)
+        for pos in auction.model_positions[must_include]:
+            roster[pos] -= 1
+
+        budget = int(to_units(auction.salary_cap - auction.model_costs[must_include].sum()))
+        if budget < 0 or min(roster.values()) < 0:
+            return Lineup(self.name, 'infeasible', elapsed=time.perf_counter() - start_time)
+
+        free = np.flatnonzero(~must_include)
+        result = solve_roster(
+            auction.model_points[free], auction.model_costs[free], auction.model_positions[free], roster, budget
+        )
+        if result is None:
+            return Lineup(self.name, 'infeasible', elapsed=time.perf_counter() - start_time)
+
+        points, selected = result
+        picked = np.concatenate([np.flatnonzero(must_include), free[selected]])
+        rows = auction.filtered_df.index[np.sort(picked)].tolist()
+
+        return Lineup(
+            self.name, 'optimal', rows, points + auction.model_points[must_include].sum(),
+            time.perf_counter() - start_time
+        )
+
+
+BACKENDS = {
+    'scip': ScipBackend(),
+    'dp': KnapsackBackend(),
+}
+
+
+def get_backend(name):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown solver backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]
+
+
+def cross_check(auction):
+    # Solve with both backends and confirm they reach the same optimum
+    scip_lineup = get_backend('scip').solve(auction)
+    dp_lineup = get_backend('dp').solve(auction)
+
+    if scip_lineup.status != dp_lineup.status:
+        print(f"Warning: SCIP status {scip_lineup.status} but DP status {dp_lineup.status}")
+        return False
+    if scip_lineup.status == 'optimal' and abs(scip_lineup.points - dp_lineup.points) > 1e-6:
+        print(f"Warning: SCIP found {scip_lineup.points} PTS but DP found {dp_lineup.points} PTS")
+        return False
+
+    # Both lineups must also respect the cap and roster counts
+    for lineup in [scip_lineup, dp_lineup]:
+        if lineup.status != 'optimal':
+            continue
+        players = lineup.players(auction)
+        counts = players['POS'].astype(str).value_counts()
+        if (players['SALARY'] + players['BID']).sum() > auction.salary_cap + 1e-6:
+            print(f"Warning: The {lineup.backend} lineup is over the cap")
+            return False
+        if any(counts.get(pos, 0) != count for pos, count in auction.roster.items()):
+            print(f"Warning: The {lineup.backend} lineup has the wrong roster counts")
+            return False
+
+    return True
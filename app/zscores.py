@@ -0,0 +1,117 @@
+import numpy as np
+
+
+class ZScores:
+    # Result of one ZScoreEngine pass. Player arrays have the shape of the points given to
+    # compute (players, or draws x players); per-position arrays have one column per position
+    # in engine.positions (positions, or draws x positions).
+    def __init__(self, draftable, z_scores, count, total, baseline, below_baseline, adjusted_baseline):
+        self.draftable = draftable
+        self.z_scores = z_scores
+        self.count = count
+        self.total = total
+        self.baseline = baseline
+        self.below_baseline = below_baseline
+        self.adjusted_baseline = adjusted_baseline
+
+
+class ZScoreEngine:
+    def __init__(self, pos_codes, baselines, eligible, start, free_agents):
+        # pos_codes: position number of every player (-1 when not valued), baselines: players
+        # every position rosters league-wide, eligible: players that take part in the baseline
+        # (not MINOR), start and free_agents: boolean masks of START players and free agents.
+        # Everything that does not depend on points is fixed here, so batch callers pay for it once.
+        self.baselines = np.asarray(baselines, dtype=np.int64)
+        pos_codes = np.asarray(pos_codes, dtype=np.int64)
+
+        # Valued players ordered by position, so every position is one contiguous band of columns
+        columns = np.flatnonzero((pos_codes >= 0) & eligible)
+        self.columns = columns[np.argsort(pos_codes[columns], kind='stable')]
+        self.groups = pos_codes[self.columns]
+        self.offsets = np.searchsorted(self.groups, np.arange(len(self.baselines)))
+        self.start = np.asarray(start)[self.columns]
+        self.free_agents = np.asarray(free_agents)[self.columns]
+        self.n_players = len(pos_codes)
+        self.n_positions = len(self.baselines)
+
+    @classmethod
+    def from_store(cls, store, roster, league_size, positions=None):
+        # One engine for the positions of the roster (or just `positions`) that occur in the data.
+        # Any position code works, so a C/LW/RW/UTIL league only needs a matching roster.
+        positions = [pos for pos in store.positions if pos in roster and (positions is None or pos in positions)]
+
+        pos_codes = np.full(len(store.df), -1, dtype=np.int64)
+        for code, pos in enumerate(positions):
+            pos_codes[store.positions[pos]] = code
+
+        engine = cls(pos_codes, [roster[pos] * league_size for pos in positions], ~store.minor, store.start,
+                     store.free_agents)
+        engine.positions = positions
+        return engine
+
+    def compute(self, points):
+        # Ranks, adjusted baselines, mean/std and min-shifted z-scores of every position in one
+        # grouped pass. points is a vector of players or a (draws, players) matrix; each draw is
+        # valued on its own.
+        points = np.asarray(points, dtype=float)
+        batch = points.ndim == 2
+        draws = points.shape[0] if batch else 1
+        n_groups = draws * self.n_positions
+
+        # One group per (draw, position), laid out draw-major like the flattened values
+        values = points.reshape(draws, -1)[:, self.columns]
+        groups = (np.arange(draws)[:, None] * self.n_positions + self.groups[None, :]).ravel()
+        start = np.tile(self.start, draws)
+        free_agents = np.tile(self.free_agents, draws)
+
+        # Rank inside the position, most points first: a stable argsort per draw over a key that
+        # keeps each position in its own band. Tied players rank in row order, so at a baseline
+        # the earlier row is draftable. The per-position sort_values this replaced used quicksort,
+        # whose order among ties is unspecified; on players-24 it kept John Marino (row 318)
+        # instead of Esa Lindell (row 308), both 26 PTS at the D cutoff. Counts and totals do not
+        # depend on the tie order.
+        ranks = np.empty(values.shape, dtype=np.int64)
+        if values.size:
+            span = np.ceil(values.max() - values.min()) + 1
+            order = np.argsort(self.groups * span + (values.max() - values), axis=1, kind='stable')
+            band_ranks = np.arange(len(self.columns)) - self.offsets[self.groups]
+            np.put_along_axis(ranks, order, np.broadcast_to(band_ranks, order.shape), axis=1)
+        values = values.ravel()
+        ranks = ranks.ravel()
+
+        # START players pushed below the baseline shrink it, one per player
+        baseline = np.tile(self.baselines, draws)
+        below_baseline = np.bincount(groups, weights=(ranks >= baseline[groups]) & start, minlength=n_groups)
+        below_baseline = below_baseline.astype(np.int64)
+        adjusted_baseline = baseline - below_baseline
+
+        draftable = (ranks < adjusted_baseline[groups]) & free_agents
+
+        # Mean and sample standard deviation of the draftable players of each group
+        count = np.bincount(groups, weights=draftable, minlength=n_groups).astype(np.int64)
+        mean = np.bincount(groups, weights=np.where(draftable, values, 0), minlength=n_groups) / np.maximum(count, 1)
+        deviation = values - mean[groups]
+        squares = np.bincount(groups, weights=np.where(draftable, deviation ** 2, 0), minlength=n_groups)
+        stdev = np.sqrt(squares / np.maximum(count - 1, 1))
+        stdev[(stdev == 0) | (count < 2)] = 1  # Avoid division by zero
+
+        # Standardize Z-scores so the minimum draftable player of each group is 0
+        lowest = np.full(n_groups, np.inf)
+        np.minimum.at(lowest, groups[draftable], values[draftable])
+        z_min = np.where(count > 0, (lowest - mean) / stdev, 0)
+        z_scores = np.where(draftable, deviation / stdev[groups] - z_min[groups], 0)
+        total = np.bincount(groups, weights=z_scores, minlength=n_groups)
+
+        # Back to the caller's layout
+        player_draftable = np.zeros((draws, self.n_players), dtype=bool)
+        player_z_scores = np.zeros((draws, self.n_players))
+        player_draftable[:, self.columns] = draftable.reshape(draws, -1)
+        player_z_scores[:, self.columns] = z_scores.reshape(draws, -1)
+
+        per_position = [array.reshape(draws, self.n_positions) for array in
+                        (count, total, baseline, below_baseline, adjusted_baseline)]
+        if not batch:
+            player_draftable, player_z_scores = player_draftable[0], player_z_scores[0]
+            per_position = [array[0] for array in per_position]
+
+        return ZScores(player_draftable, player_z_scores, *per_position)
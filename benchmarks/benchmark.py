@@ -0,0 +1,207 @@
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# The benchmark lives outside app/ and imports the scripts the way they import each other
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+
+from player_store import COLUMNS, FREE_AGENT_TEAMS, PlayerStore  # noqa: E402
+from sillinger import FantasyAuction, SALARY, FORWARD, DEFENCE, GOALIE  # noqa: E402
+
+# Stages timed for every synthetic league, in pipeline order
+STAGES = ['load', 'z_scores', 'bids', 'build', 'solve', 'report', 'bid_tables']
+
+# The verbose bid tables render every player through tabulate and rich, which takes minutes
+# at 100k rows, so larger leagues leave that stage out
+MAX_TABLE_ROWS = 10000
+
+# A stage counts as a regression when it is this much slower than the baseline and
+# slower by more than the noise floor
+REGRESSION_RATIO = 1.25
+NOISE_FLOOR = 0.005
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def synthetic_league(rows, teams=11, roster=None, seed=0):
+    # A player table shaped like players-24.csv: every team has about two thirds of its roster
+    # signed as START players plus a few MINOR prospects, everyone else is a free agent.
+    # Team codes are BOT, T02, T03, ...; returns the frame and a zero-penalty dict per team.
+    roster = roster or {'F': FORWARD, 'D': DEFENCE, 'G': GOALIE}
+    rng = np.random.default_rng(seed)
+
+    codes = ['BOT'] + [f"T{n:02d}" for n in range(2, teams + 1)]
+
+    # Position mix of players-24: about 57% forwards, 34% defence, 9% goalies
+    positions = rng.choice(['F', 'D', 'G'], size=rows, p=[0.57, 0.34, 0.09])
+
+    # Points fall off like a real league: a few stars, a long tail near zero
+    scale = np.select([positions == 'F', positions == 'D'], [30.0, 18.0], 25.0)
+    points = np.minimum(rng.gamma(1.2, scale), 150).astype(int)
+
+    df = pd.DataFrame({
+        'PLAYER': [f"Player {n}" for n in range(rows)],
+        'POS': positions,
+        'GROUP': rng.choice(['3', 'A', 'B', 'C', '2'], size=rows, p=[0.76, 0.11, 0.05, 0.05, 0.03]),
+        'STATUS': '',
+        'FCHL TEAM': rng.choice(FREE_AGENT_TEAMS, size=rows, p=[0.05, 0.05, 0.9]),
+        'NHL TEAM': rng.choice([f"N{n:02d}" for n in range(32)], size=rows),
+        'AGE': rng.integers(19, 39, size=rows),
+        'SALARY': np.round(rng.uniform(0.5, 3.0, size=rows), 1),
+        'BID': 0.0,
+        'PTS': points,
+    })
+
+    # Each team signs the best remaining players until two thirds of every position is full
+    taken = np.zeros(rows, dtype=bool)
+    for pos, count in roster.items():
+        ranked = np.flatnonzero(positions == pos)[np.argsort(-points[positions == pos], kind='stable')]
+        signed = ranked[:count * 2 // 3 * teams]
+        df.loc[signed, 'FCHL TEAM'] = np.resize(codes, len(signed))
+        df.loc[signed, 'STATUS'] = 'START'
+        df.loc[signed, 'SALARY'] = np.round(rng.uniform(0.5, 5.0, size=len(signed)), 1)
+        taken[signed] = True
+
+    # Three prospects per team from further down the list
+    prospects = rng.choice(np.flatnonzero(~taken), size=min(3 * teams, int((~taken).sum())), replace=False)
+    df.loc[prospects, 'FCHL TEAM'] = np.resize(codes, len(prospects))
+    df.loc[prospects, 'STATUS'] = 'MINOR'
+
+    return df[COLUMNS], {code: 0.0 for code in codes}
+
+
+def run_pipeline(csv_path, penalties, roster, teams, bid_tables=True):
+    # Seconds per stage for one pass of load, valuation, model and report
+    timings = {}
+
+    start_time = time.perf_counter()
+    store = PlayerStore(csv_path, teams=penalties.keys(), use_cache=False)
+    timings['load'] = time.perf_counter() - start_time
+
+    auction = FantasyAuction(
+        csv_path, verbose=False, store=store, roster=roster, penalties=penalties, league_size=teams
+    )
+    processed = auction.process_data()
+    timings['z_scores'] = auction.timings['z_scores']
+    timings['bids'] = auction.timings['bids']
+
+    auction.build_model()
+    best_solution = auction.solve_model()
+    timings['build'] = auction.timings['build']
+    timings['solve'] = auction.timings['solve']
+
+    # Reports are rendered in full but thrown away
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        auction.print_results(*processed, best_solution)
+    timings['report'] = time.perf_counter() - start_time
+
+    if bid_tables:
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            auction.print_bid_tables()
+        timings['bid_tables'] = time.perf_counter() - start_time
+
+    return timings
+
+
+def run_benchmarks(sizes=(1000, 10000, 100000), teams=11, roster=None, repeats=3, seed=0):
+    # Best of `repeats` passes for every stage and league size
+    roster = roster or {'F': FORWARD, 'D': DEFENCE, 'G': GOALIE}
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            df, penalties = synthetic_league(rows, teams, roster, seed)
+            csv_path = os.path.join(tmp, f"players-{rows}.csv")
+            df.to_csv(csv_path, index=False)
+
+            bid_tables = rows <= MAX_TABLE_ROWS
+            passes = [run_pipeline(csv_path, penalties, roster, teams, bid_tables) for _ in range(repeats)]
+            results.append({
+                'rows': rows,
+                'teams': teams,
+                'roster': roster,
+                'stages': {stage: min(timings[stage] for timings in passes) for stage in STAGES if stage in passes[0]},
+            })
+
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'salary_cap': SALARY,
+        'repeats': repeats,
+        'results': results,
+    }
+
+
+def compare(current, baseline):
+    # One row per league size and stage, with the slowdown against the baseline
+    baseline_results = {(entry['rows'], entry['teams']): entry['stages'] for entry in baseline['results']}
+
+    rows = []
+    for entry in current['results']:
+        previous = baseline_results.get((entry['rows'], entry['teams']), {})
+        for stage, seconds in entry['stages'].items():
+            before = previous.get(stage)
+            ratio = seconds / before if before else np.nan
+            rows.append({
+                'rows': entry['rows'],
+                'stage': stage,
+                'ms': round(seconds * 1000, 1),
+                'baseline ms': round(before * 1000, 1) if before else np.nan,
+                'ratio': round(ratio, 2),
+                'regression': bool(before and ratio > REGRESSION_RATIO and seconds - before > NOISE_FLOOR),
+            })
+
+    return pd.DataFrame(rows)
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+if __name__ == "__main__":
+    # python benchmarks/benchmark.py [--save] [rows ...]
+    args = sys.argv[1:]
+    save = '--save' in args
+    sizes = [int(arg) for arg in args if arg != '--save'] or [1000, 10000, 100000]
+
+    current = run_benchmarks(sizes)
+    baseline = load_baseline()
+
+    if baseline is None:
+        table = pd.DataFrame([
+            {'rows': entry['rows'], 'stage': stage, 'ms': round(seconds * 1000, 1)}
+            for entry in current['results'] for stage, seconds in entry['stages'].items()
+        ])
+        print(table.pivot(index='stage', columns='rows', values='ms').reindex(STAGES))
+    else:
+        table = compare(current, baseline)
+        with pd.option_context('display.max_rows', None, 'display.width', 200):
+            print(table)
+        regressions = table[table['regression']]
+        if len(regressions):
+            print(f"{len(regressions)} stage(s) slower than the baseline by more than {REGRESSION_RATIO}x")
+
+    if save:
+        save_baseline(current)
+        print(f"Baseline saved to {BASELINE_PATH}")
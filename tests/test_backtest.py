@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+
+import backtest  # noqa: E402
+
+
+class SeasonsTest(unittest.TestCase):
+    def test_default_seasons_outside_app(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                for path in backtest.SEASONS.values():
+                    self.assertTrue(os.path.isfile(path), path)
+
+                output_path = os.path.join(tmp, 'backtest.jsonl')
+                results = backtest.run_backtest([{'name': 'baseline'}], output_path, workers=1)
+            finally:
+                os.chdir(cwd)
+
+            self.assertEqual(sorted(results['season']), sorted(backtest.SEASONS))
+            with open(output_path) as output:
+                self.assertEqual(len(output.readlines()), len(backtest.SEASONS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+from benchmark import (  # noqa: E402
+    NOISE_FLOOR, STAGES, compare, load_baseline, run_pipeline, save_baseline, synthetic_league,
+)
+from player_store import COLUMNS  # noqa: E402
+
+ROSTER = {'F': 14, 'D': 7, 'G': 3}
+
+
+def results(stages, rows=1000, teams=11):
+    return {'results': [{'rows': rows, 'teams': teams, 'roster': ROSTER, 'stages': stages}]}
+
+
+class SyntheticLeagueTest(unittest.TestCase):
+    def test_deterministic(self):
+        df, penalties = synthetic_league(2000, seed=3)
+        again, _ = synthetic_league(2000, seed=3)
+        other, _ = synthetic_league(2000, seed=4)
+
+        self.assertTrue(df.equals(again))
+        self.assertFalse(df.equals(other))
+        self.assertEqual(list(df.columns), COLUMNS)
+        self.assertEqual(list(penalties), ['BOT'] + [f"T{n:02d}" for n in range(2, 12)])
+
+    def test_rosters(self):
+        df, penalties = synthetic_league(2000, teams=11, roster=ROSTER)
+        for team in penalties:
+            players = df[df['FCHL TEAM'] == team]
+            starters = players[players['STATUS'] == 'START']['POS'].value_counts()
+            for pos, count in ROSTER.items():
+                self.assertEqual(starters[pos], count * 2 // 3, f"{team} {pos}")
+            self.assertEqual((players['STATUS'] == 'MINOR').sum(), 3, team)
+
+        # Everyone else is a free agent without a status
+        unsigned = ~df['FCHL TEAM'].isin(list(penalties))
+        self.assertTrue((df.loc[unsigned, 'STATUS'] == '').all())
+
+    def test_pipeline_runs(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            df, penalties = synthetic_league(500, seed=1)
+            csv_path = os.path.join(tmp_dir, 'players.csv')
+            df.to_csv(csv_path, index=False)
+            timings = run_pipeline(csv_path, penalties, ROSTER, len(penalties), bid_tables=False)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.assertEqual(list(timings), [stage for stage in STAGES if stage != 'bid_tables'])
+        self.assertTrue(all(seconds >= 0 for seconds in timings.values()))
+
+
+class CompareTest(unittest.TestCase):
+    def test_regressions(self):
+        baseline = results({'load': 0.1, 'z_scores': 0.001, 'bids': 0.05, 'solve': 0.2})
+        current = results({'load': 0.2, 'z_scores': 0.002, 'bids': 0.04, 'solve': 0.24, 'report': 0.3})
+        table = compare(current, baseline).set_index('stage')
+
+        # Twice as slow, over the noise floor
+        self.assertTrue(table.at['load', 'regression'])
+        self.assertEqual(table.at['load', 'ratio'], 2.0)
+        # Twice as slow but within the noise floor
+        self.assertLess(0.002 - 0.001, NOISE_FLOOR)
+        self.assertFalse(table.at['z_scores', 'regression'])
+        # Faster, and slower by less than the ratio
+        self.assertFalse(table.at['bids', 'regression'])
+        self.assertFalse(table.at['solve', 'regression'])
+        # A stage the baseline does not have
+        self.assertTrue(np.isnan(table.at['report', 'ratio']))
+        self.assertFalse(table.at['report', 'regression'])
+
+    def test_other_league_sizes_are_not_compared(self):
+        table = compare(results({'load': 1.0}, rows=5000), results({'load': 0.1}))
+        self.assertTrue(np.isnan(table.at[0, 'baseline ms']))
+        self.assertFalse(table.at[0, 'regression'])
+
+    def test_saved_baseline(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, 'baseline.json')
+            self.assertIsNone(load_baseline(path))
+            current = results({'load': 0.1, 'solve': 0.2})
+            save_baseline(current, path)
+            self.assertEqual(load_baseline(path), current)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def test_checked_in_baseline(self):
+        baseline = load_baseline()
+        self.assertIsNotNone(baseline)
+        for entry in baseline['results']:
+            self.assertLessEqual(set(entry['stages']), set(STAGES))
+        table = compare(baseline, baseline)
+        self.assertFalse(table['regression'].any())
+        self.assertTrue((table['ratio'] == 1.0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from event_log import SNAPSHOT_COLUMNS  # noqa: E402
+from live_auction import LiveAuction  # noqa: E402
+
+
+def sales_for(live, count=12):
+    # The priciest free agents go to the other teams at their bid; BOT buys one of them cheap
+    df = live.auction.players_df
+    free_agents = df[live.store.free_agents & (df['Draftable'] == 'YES').to_numpy()]
+    teams = [team for team in live.auction.penalties if team != 'BOT']
+    sales = []
+    for k, idx in enumerate(free_agents.nlargest(count, 'BID').index):
+        if k == 0:
+            sales.append((int(idx), 'BOT', 1.0))
+        else:
+            sales.append((int(idx), teams[k % len(teams)], float(max(1.0, round(df.at[idx, 'BID'])))))
+    return sales
+
+
+class EventLogReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def run_session(self, snapshot_every):
+        live = LiveAuction(CSV_PATH, log_dir=self.log_dir)
+        live.log.snapshot_every = snapshot_every
+        for idx, team, price in sales_for(live, 25):
+            live.record_sale(idx, team, price)
+
+        # A keeper promotion and a penalty change after the last snapshot
+        bot = live.store.team_rows['BOT']
+        live.move_player(int(bot[live.store.minor[bot]][0]), 'BOT', 'START')
+        team = next(team for team in live.auction.penalties if team != 'BOT')
+        live.set_penalty(team, live.auction.penalties[team] + 2)
+        return live
+
+    def assert_same_state(self, live, recovered):
+        columns = SNAPSHOT_COLUMNS
+        self.assertTrue(
+            live.auction.players_df[columns].astype(str).equals(recovered.auction.players_df[columns].astype(str))
+        )
+        for field, value in live.totals().items():
+            self.assertAlmostEqual(getattr(recovered, field), value, places=6, msg=field)
+        self.assertEqual(live.auction.penalties, recovered.auction.penalties)
+        self.assertEqual(sorted(live.recommendation().index), sorted(recovered.recommendation().index))
+
+    def test_snapshot_and_tail(self):
+        live = self.run_session(snapshot_every=10)
+        recovered = LiveAuction(CSV_PATH, log_dir=self.log_dir)
+        self.assertEqual(recovered.replayed, 7)
+        self.assert_same_state(live, recovered)
+
+    def test_full_replay_without_snapshot(self):
+        live = self.run_session(snapshot_every=1000)
+        self.assertFalse(os.path.exists(live.log.snapshot_path))
+        recovered = LiveAuction(CSV_PATH, log_dir=self.log_dir)
+        self.assertEqual(recovered.replayed, 27)
+        self.assert_same_state(live, recovered)
+
+    def test_torn_last_line_is_dropped(self):
+        live = self.run_session(snapshot_every=10)
+        with open(live.log.events_path, 'ab') as file:
+            file.write(b'{"seq": 28, "kind": "sa')
+
+        recovered = LiveAuction(CSV_PATH, log_dir=self.log_dir)
+        self.assert_same_state(live, recovered)
+        self.assertEqual(recovered.log.seq, 27)
+        with open(live.log.events_path, 'rb') as file:
+            self.assertTrue(file.read().endswith(b'\n'))
+
+    def test_recovery_continues_the_log(self):
+        live = self.run_session(snapshot_every=10)
+        recovered = LiveAuction(CSV_PATH, log_dir=self.log_dir)
+
+        df = recovered.auction.players_df
+        idx = int(df[recovered.store.free_agents & (df['BID'] > 0).to_numpy()].index[0])
+        team = next(team for team in live.auction.penalties if team != 'BOT')
+        recovered.record_sale(idx, team, 1.0)
+        self.assertEqual(recovered.log.seq, 28)
+
+        again = LiveAuction(CSV_PATH, log_dir=self.log_dir)
+        self.assertTrue(np.allclose(
+            again.auction.players_df['BID'].to_numpy(), recovered.auction.players_df['BID'].to_numpy()
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
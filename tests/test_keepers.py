@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from keepers import KeeperPlanner  # noqa: E402
+from sillinger import FantasyAuction  # noqa: E402
+
+
+def new_auction():
+    auction = FantasyAuction(CSV_PATH, verbose=False)
+    auction.process_data()
+    auction.extract_model_data()
+    return auction
+
+
+class KeeperPlannerTest(unittest.TestCase):
+    def test_stale_model_data_is_re_extracted(self):
+        auction = new_auction()
+        free_agents = auction.filtered_df.index[~auction.model_must_include]
+        top = auction.players_df.loc[free_agents].nlargest(1, 'PTS').index[0]
+
+        # A new BID after the extract must reach the plan's costs
+        auction.players_df.loc[top, 'BID'] = auction.salary_cap
+        planner = KeeperPlanner(auction, seasons=2)
+        self.assertTrue(auction.model_data_current())
+        k = int(np.flatnonzero(planner.rows == top)[0])
+        self.assertAlmostEqual(planner.costs[k], auction.players_df.at[top, 'SALARY'] + auction.salary_cap)
+
+    def test_contracts_run_through_the_horizon_by_default(self):
+        auction = new_auction()
+        planner = KeeperPlanner(auction, seasons=3)
+        self.assertTrue((planner.contract_seasons == 3).all())
+
+        acquired = auction.model_must_include.copy()
+        starts, slots = planner.plan_season(1, acquired)
+        self.assertTrue(starts.any())
+
+    def test_expired_contracts_go_to_the_market(self):
+        auction = new_auction()
+        groups = auction.players_df['GROUP'].astype(str).unique()
+        planner = KeeperPlanner(auction, seasons=3, contract_seasons={group: 1 for group in groups})
+        self.assertTrue((planner.contract_seasons == 1).all())
+
+        # Nobody is under contract after this season, so every slot is bought
+        starts, slots = planner.plan_season(1, auction.model_must_include.copy())
+        self.assertFalse(starts.any())
+        self.assertEqual(sum(slots.values()), sum(auction.roster.values()))
+
+    def test_contracts_by_row(self):
+        auction = new_auction()
+        starters = auction.store.team_start('BOT')
+        acquired = auction.model_must_include.copy()
+        default = KeeperPlanner(auction, seasons=3)
+        starts, _ = default.plan_season(1, acquired)
+        self.assertTrue(np.isin(default.rows[starts], starters).any())
+
+        # Only BOT's current starters expire: none of them may start next season
+        seasons = np.full(len(auction.players_df), 3)
+        seasons[starters] = 1
+        planner = KeeperPlanner(auction, seasons=3, contract_seasons=seasons)
+        starts, _ = planner.plan_season(1, acquired)
+        self.assertFalse(np.isin(planner.rows[starts], starters).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from league import LeagueModel  # noqa: E402
+from sillinger import FantasyAuction  # noqa: E402
+
+
+class LeagueModelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        auction = FantasyAuction(CSV_PATH, verbose=False)
+        auction.process_data()
+        cls.league = LeagueModel(auction)
+
+    def assert_feasible(self, assignment):
+        self.assertFalse(assignment.index.duplicated().any())
+        for team in self.league.teams:
+            players = assignment[assignment['TEAM'] == team]
+            spent = (self.league.pool_df.loc[players.index, 'SALARY'] + players['BID']).sum()
+            self.assertLessEqual(spent, self.league.cap_left[team] + 1e-6, team)
+            counts = players['POS'].astype(str).value_counts()
+            for pos, need in self.league.needs[team].items():
+                self.assertLessEqual(counts.get(pos, 0), need, f"{team} {pos}")
+
+    def test_full_model_is_optimal(self):
+        assignment = self.league.solve()
+        self.assert_feasible(assignment)
+        self.assertEqual(assignment.attrs['status'], 'optimal')
+        self.assertAlmostEqual(assignment.attrs['points'], assignment['PTS'].sum())
+
+        decomposed = self.league.solve_decomposed(iterations=5, workers=1)
+        self.assertLessEqual(decomposed.attrs['points'], assignment.attrs['points'] + 1e-6)
+        self.assertGreaterEqual(decomposed.attrs['bound'], assignment.attrs['points'] - 1e-6)
+
+    def test_process_pool_matches_sequential(self):
+        sequential = self.league.solve_decomposed(iterations=5, workers=1)
+        parallel = self.league.solve_decomposed(iterations=5, workers=2)
+        self.assert_feasible(parallel)
+        self.assertTrue(sequential.equals(parallel))
+        self.assertEqual(sequential.attrs['iterations'], parallel.attrs['iterations'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from live_auction import LiveAuction  # noqa: E402
+from sillinger import FantasyAuction, VALUATION_FIELDS  # noqa: E402
+
+STATE_COLUMNS = ['FCHL TEAM', 'STATUS', 'SALARY', 'BID', 'Draftable', 'Z-score']
+
+
+def sales_for(live, count=12):
+    # The priciest free agents go to the other teams at their bid; BOT buys one of them cheap
+    df = live.auction.players_df
+    free_agents = df[live.store.free_agents & (df['Draftable'] == 'YES').to_numpy()]
+    teams = [team for team in live.auction.penalties if team != 'BOT']
+    sales = []
+    for k, idx in enumerate(free_agents.nlargest(count, 'BID').index):
+        if k == 0:
+            sales.append((int(idx), 'BOT', 1.0))
+        else:
+            sales.append((int(idx), teams[k % len(teams)], float(max(1.0, round(df.at[idx, 'BID'])))))
+    return sales
+
+
+def lineup_points(lineup):
+    return None if lineup is None else float(lineup['PTS'].sum())
+
+
+class IncrementalUpdateTest(unittest.TestCase):
+    def test_sales_match_a_full_rebuild(self):
+        for backend in ['scip', 'dp']:
+            with self.subTest(backend=backend):
+                live = LiveAuction(CSV_PATH, backend)
+                sales = sales_for(live)
+                for idx, team, price in sales:
+                    live.record_sale(idx, team, price)
+
+                # The same sales recorded before a from-scratch valuation and model
+                auction = FantasyAuction(CSV_PATH, verbose=False)
+                for idx, team, price in sales:
+                    auction.store.record_sale(idx, team, price)
+                totals = dict(zip(VALUATION_FIELDS, auction.process_data()))
+                auction.build_model()
+                best_solution = auction.solve_model()
+
+                live_df = live.auction.players_df[STATE_COLUMNS]
+                rebuilt_df = auction.players_df[STATE_COLUMNS]
+                self.assertTrue(live_df.astype(str).equals(rebuilt_df.astype(str)))
+                for field, value in totals.items():
+                    self.assertAlmostEqual(getattr(live, field), value, places=6, msg=field)
+
+                self.assertIsNotNone(best_solution)
+                self.assertAlmostEqual(
+                    lineup_points(live.recommendation()), lineup_points(auction.selected_players(best_solution))
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
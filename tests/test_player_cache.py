@@ -0,0 +1,101 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from player_cache import PlayerCache  # noqa: E402
+from player_store import PlayerStore, projections_path  # noqa: E402
+
+
+class UpdateColumnsTest(unittest.TestCase):
+    def setUp(self):
+        # A private copy of the CSV so the cache lands in a throwaway folder
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'players.csv')
+        shutil.copy(CSV_PATH, self.csv_path)
+        self.df = PlayerStore.load(self.csv_path)
+        self.cache = PlayerCache(self.csv_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_meta_after_two_updates(self):
+        n_players = len(self.df)
+        columns = list(self.cache.read_meta()['columns'])
+
+        self.assertTrue(self.cache.update_columns({'PTS_SD': np.ones(n_players)}, {'projections': {'file': 'a.csv'}}))
+        self.assertTrue(self.cache.update_columns(
+            {'PTS': np.arange(n_players), 'PTS_SD': np.full(n_players, 2.0)}, {'projections': {'file': 'b.csv'}}
+        ))
+
+        meta = self.cache.read_meta()
+        self.assertEqual(meta['projections'], {'file': 'b.csv'})
+        self.assertNotIn('file', meta)
+        self.assertNotIn('kind', meta)
+        self.assertEqual(list(meta['columns']), columns + ['PTS_SD'])
+
+        # PTS kept its file; PTS_SD got a new one once and reused it
+        self.assertEqual(meta['columns']['PTS']['file'], f"{columns.index('PTS'):03d}.npy")
+        self.assertEqual(meta['columns']['PTS_SD']['file'], f"{len(columns):03d}.npy")
+
+        df = self.cache.load()
+        self.assertTrue(np.array_equal(df['PTS'].to_numpy(), np.arange(n_players)))
+        self.assertTrue(np.array_equal(df['PTS_SD'].to_numpy(), np.full(n_players, 2.0)))
+
+
+class ProjectionsDependencyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'players.csv')
+        shutil.copy(CSV_PATH, self.csv_path)
+        self.projections_path = projections_path(self.csv_path)
+        self.cache = PlayerCache(self.csv_path, dependencies=[self.projections_path])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_projections(self, pts):
+        df = PlayerStore.read_csv(self.csv_path)
+        df = df[['PLAYER', 'POS']].assign(PTS=pts, PTS_SD=1.5)
+        df.to_csv(self.projections_path, index=False)
+
+    def test_projections_feed_the_cache(self):
+        self.write_projections(7)
+        df = PlayerStore.load(self.csv_path)
+        self.assertTrue((df['PTS'] == 7).all())
+        self.assertIsNotNone(self.cache.load())
+
+        # Edited: the next load rebuilds from the CSV and the new file
+        self.write_projections(8)
+        self.assertIsNone(self.cache.load())
+        self.assertTrue((PlayerStore.load(self.csv_path)['PTS'] == 8).all())
+
+        # Touched with the same contents: the cache stays
+        stat = os.stat(self.projections_path)
+        os.utime(self.projections_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNotNone(self.cache.load())
+
+        # Deleted: back to the PTS of the CSV
+        os.remove(self.projections_path)
+        self.assertIsNone(self.cache.load())
+        df = PlayerStore.load(self.csv_path)
+        self.assertTrue(df['PTS'].equals(PlayerStore.read_csv(self.csv_path)['PTS']))
+        self.assertNotIn('PTS_SD', df)
+
+    def test_projections_added_later(self):
+        PlayerStore.load(self.csv_path)
+        self.assertIsNotNone(self.cache.load())
+        self.write_projections(9)
+        self.assertIsNone(self.cache.load())
+        self.assertTrue((PlayerStore.load(self.csv_path)['PTS'] == 9).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from player_cache import PlayerCache  # noqa: E402
+from player_store import projections_path  # noqa: E402
+from projections import NameIndex, ProjectionMerger, ProjectionSource  # noqa: E402
+
+NAMES = ['Mitch Marner', 'Nicholas Suzuki', 'Alex Ovechkin', 'Reilly Smith', 'Cole Smith', 'Sebastian Aho',
+         'Sebastian Aho', 'Tony DeAngelo']
+POSITIONS = ['F', 'F', 'F', 'F', 'F', 'F', 'D', 'D']
+
+
+class NameIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex(NAMES, POSITIONS)
+
+    def test_true_matches(self):
+        for name, row in [('Mitchell Marner', 0), ('Nick Suzuki', 1), ('Alexander Ovechkin', 2),
+                          ('Reily Smith', 3), ('Tony DeAngelo (NCM)', 7), ('Sebastian Aho', -1)]:
+            with self.subTest(name=name):
+                self.assertEqual(self.index.resolve(name), row)
+        self.assertEqual(self.index.resolve('Sebastian Aho', 'D'), 6)
+
+    def test_false_matches(self):
+        # Another player with the same last name, with or without the same initial
+        for name in ['Ryan Smith', 'Craig Smith', 'Mitch Marnerr Jones', 'Nick Foligno']:
+            with self.subTest(name=name):
+                self.assertEqual(self.index.resolve(name), -1)
+
+    def test_fuzzy_matches_are_recorded(self):
+        self.index.resolve('Mitch Marner')
+        self.index.resolve('Mitchell Marner')
+        self.index.resolve('Ryan Smith')
+        self.assertEqual(self.index.fuzzy, {'Mitchell Marner': 'mitch marner'})
+
+
+class ProjectionMergerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'players.csv')
+        shutil.copy(CSV_PATH, self.csv_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_only_true_matches_are_merged(self):
+        source_path = os.path.join(self.tmp_dir, 'source.csv')
+        pd.DataFrame({'Player': ['Mitchell Marner', 'Ryan Smith', 'Nick Suzuki'], 'PTS': [120, 99, 81]}).to_csv(
+            source_path, index=False
+        )
+
+        merger = ProjectionMerger(self.csv_path)
+        before = merger.store.df.set_index('PLAYER')['PTS']
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            report = merger.run([ProjectionSource(source_path)])
+
+        after = merger.store.df.set_index('PLAYER')['PTS']
+        self.assertEqual(after['Mitch Marner'], 120)
+        self.assertEqual(after['Nick Suzuki'], 81)
+        self.assertEqual(after['Reilly Smith'], before['Reilly Smith'])
+
+        self.assertEqual(report.loc[0, 'unmatched rows'], 1)
+        self.assertEqual(report.loc[0, 'fuzzy names'], 1)
+        self.assertIn("'Mitchell Marner' matched to 'mitch marner'", output.getvalue())
+
+        # The cache took the blend and the stamp of the new projections file
+        cached = PlayerCache(self.csv_path, dependencies=[projections_path(self.csv_path)]).load()
+        self.assertIsNotNone(cached)
+        self.assertTrue(cached['PTS'].equals(merger.store.df['PTS']))
+
+
+if __name__ == '__main__':
+    unittest.main()
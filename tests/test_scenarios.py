@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from scenarios import run_scenarios  # noqa: E402
+from sillinger import FantasyAuction, VALUATION_FIELDS  # noqa: E402
+
+
+class ScenariosTest(unittest.TestCase):
+    def test_results_match_a_direct_run(self):
+        scenarios = [{'name': 'nominal'}, {'name': 'cap 50', 'salary_cap': 50.0}, {'name': '15F', 'forward': 15}]
+        sequential = run_scenarios(CSV_PATH, scenarios, workers=1)
+        parallel = run_scenarios(CSV_PATH, scenarios, workers=2)
+        columns = ['scenario', 'dollar_per_z', 'points', 'spent', 'status']
+        self.assertTrue(sequential[columns].equals(parallel[columns]))
+
+        for k, scenario in enumerate(scenarios):
+            with self.subTest(scenario=scenario['name']):
+                roster = {'F': scenario.get('forward', 14), 'D': 7, 'G': 3}
+                auction = FantasyAuction(CSV_PATH, verbose=False, roster=roster,
+                                         salary_cap=scenario.get('salary_cap', 56.8))
+                valuation = dict(zip(VALUATION_FIELDS, auction.process_data()))
+                self.assertAlmostEqual(sequential.at[k, 'dollar_per_z'], valuation['dollar_per_z'])
+
+                lineup = auction.solve_lineup()
+                self.assertEqual(sequential.at[k, 'points'], int(round(lineup.points)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from sensitivity import build_relaxation, lp_sensitivity  # noqa: E402
+from sillinger import FantasyAuction  # noqa: E402
+
+# A small step keeps every perturbed LP on the same basis as long as it is not degenerate
+STEP = 1e-3
+
+
+def lp_value(auction, cap=0.0, pos=None, count=0.0):
+    # LP optimum with the cap and one position's count moved by the given amounts
+    lp, _, budget_cons, position_cons = build_relaxation(auction)
+    lp.chgRhs(budget_cons, auction.salary_cap + cap)
+    if pos is not None:
+        lp.chgLhs(position_cons[pos], auction.roster[pos] + count)
+        lp.chgRhs(position_cons[pos], auction.roster[pos] + count)
+    lp.optimize()
+    return lp.getObjVal() if lp.getStatus() == 'optimal' else None
+
+
+class DualsTest(unittest.TestCase):
+    def setUp(self):
+        self.auction = FantasyAuction(CSV_PATH, verbose=False)
+        self.auction.process_data()
+        self.auction.build_model()
+        self.duals, self.players = lp_sensitivity(self.auction)
+
+    def assert_matches_difference(self, dual, **change):
+        # A dual lies between the one-sided slopes of the LP value; both equal it off a kink. A
+        # side is skipped when the move makes the LP infeasible, e.g. fewer goalie spots than
+        # BOT already starts.
+        key = 'cap' if 'cap' in change else 'count'
+        step = change[key]
+        base = lp_value(self.auction)
+        up = lp_value(self.auction, **{**change, key: step})
+        down = lp_value(self.auction, **{**change, key: -step})
+        self.assertFalse(up is None and down is None)
+        if up is not None:
+            self.assertLessEqual((up - base) / step, dual + 1e-4)
+        if down is not None:
+            self.assertGreaterEqual((base - down) / step, dual - 1e-4)
+
+    def test_lp_value(self):
+        self.assertAlmostEqual(self.duals['lp_points'], lp_value(self.auction), places=6)
+
+    def test_cap_dual(self):
+        self.assertGreater(self.duals['points_per_cap_dollar'], 0)
+        self.assert_matches_difference(self.duals['points_per_cap_dollar'], cap=STEP)
+
+    def test_position_duals(self):
+        for pos, dual in self.duals['points_per_roster_spot'].items():
+            with self.subTest(pos=pos):
+                self.assert_matches_difference(dual, pos=pos, count=STEP)
+
+    def test_break_even_bid(self):
+        # A free agent left out of the LP optimum enters it once his bid drops below break-even
+        players = self.players[self.auction.store.free_agents[self.players.index] & (self.players['LP VALUE'] == 0)]
+        idx = players.index[np.argmax(players['BREAK-EVEN BID'].to_numpy())]
+        break_even = players.at[idx, 'BREAK-EVEN BID']
+        self.assertGreaterEqual(break_even, 0)
+
+        self.auction.players_df.loc[idx, 'BID'] = max(break_even - 0.5, 0)
+        self.auction.extract_model_data()
+        _, repriced = lp_sensitivity(self.auction)
+        self.assertGreater(repriced.at[idx, 'LP VALUE'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+import server  # noqa: E402
+from live_auction import LiveAuction  # noqa: E402
+
+
+async def request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    payload = b'' if body is None else json.dumps(body).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(content)
+
+
+class NominationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        server._live = LiveAuction(CSV_PATH)
+        cls.views, cls.nominations = server.snapshot()
+
+    @classmethod
+    def tearDownClass(cls):
+        server._live = None
+
+    def route(self, method, path, body):
+        # No worker at all: anything that reached for one would fail
+        auction_server = server.AuctionServer(CSV_PATH)
+        auction_server.views, auction_server.nominations = self.views, self.nominations
+        return asyncio.run(auction_server.route(method, path, json.dumps(body).encode()))
+
+    def test_answered_without_the_worker(self):
+        lineup = server._live.recommendation()
+        for idx in [lineup.index[0], server._live.auction.players_df['BID'].idxmax()]:
+            name = server._live.auction.players_df.at[idx, 'PLAYER']
+            status, payload = self.route('POST', '/nomination', {'player': name})
+            answer = json.loads(payload)
+            self.assertEqual(status, 200)
+            self.assertEqual(answer['player'], name)
+            self.assertEqual(answer['bid'], float(server._live.auction.players_df.at[idx, 'BID']))
+            self.assertEqual(answer['in_lineup'], idx in lineup.index)
+
+    def test_unknown_and_bad_requests(self):
+        with self.assertRaisesRegex(ValueError, 'Unknown player'):
+            self.route('POST', '/nomination', {'player': 'Nobody At All'})
+        with self.assertRaisesRegex(ValueError, 'Missing fields'):
+            self.route('POST', '/nomination', {})
+
+    def test_shared_names(self):
+        # A name find_player cannot resolve is answered with its error, as before
+        for name, rows in server._live.store.name_rows.items():
+            answer = self.nominations[name]
+            try:
+                server._live.find_player(name)
+            except ValueError as e:
+                self.assertEqual(answer, str(e))
+            else:
+                self.assertIsInstance(answer, bytes)
+
+
+class ServerTest(unittest.TestCase):
+    def test_sale_then_nomination(self):
+        async def session():
+            auction_server = server.AuctionServer(CSV_PATH, port=0)
+            listener = await auction_server.start()
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                status, before = await request(port, 'POST', '/nomination', {'player': 'Connor McDavid'})
+                self.assertEqual(status, 200)
+                self.assertGreater(before['bid'], 0)
+
+                status, sale = await request(port, 'POST', '/sale',
+                                             {'player': 'Connor McDavid', 'team': 'GVR', 'price': before['bid']})
+                self.assertEqual((status, sale['version']), (200, 1))
+
+                # The answer follows the new state: a sold player is no free agent any more
+                status, after = await request(port, 'POST', '/nomination', {'player': 'Connor McDavid'})
+                self.assertEqual(status, 200)
+                self.assertFalse(after['in_lineup'])
+
+                status, error = await request(port, 'POST', '/nomination', {'player': 7})
+                self.assertEqual(status, 400)
+            finally:
+                listener.close()
+                await listener.wait_closed()
+                auction_server.close()
+
+        asyncio.run(session())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from auction_sim import AuctionSimulator  # noqa: E402
+from market import MarketPricer  # noqa: E402
+from sillinger import FantasyAuction  # noqa: E402
+from simulation import ProjectionSimulator  # noqa: E402
+
+
+class DoubledPoints:
+    # Stands in for a categories.CategoryValuation: VALUE is twice PTS
+    def value(self, auction):
+        return auction.players_df['PTS'] * 2.0
+
+
+def new_auction(**kwargs):
+    auction = FantasyAuction(CSV_PATH, verbose=False, **kwargs)
+    auction.process_data()
+    return auction
+
+
+class AuctionSettingsTest(unittest.TestCase):
+    def test_projection_draws_use_min_salary(self):
+        for min_salary in [0.5, 1.0]:
+            with self.subTest(min_salary=min_salary):
+                simulator = ProjectionSimulator(new_auction(min_salary=min_salary), seed=0)
+                bids, _ = simulator.draw_bids(20)
+                self.assertGreaterEqual(bids[bids > 0].min(), min_salary)
+
+    def test_projection_draws_use_the_value_column(self):
+        auction = new_auction(categories=DoubledPoints())
+        simulator = ProjectionSimulator(auction, seed=0)
+        self.assertEqual(auction.value_column, 'VALUE')
+        self.assertTrue(np.array_equal(simulator.points, auction.players_df['VALUE'].to_numpy(dtype=float)))
+        self.assertTrue(np.allclose(simulator.sd, simulator.points * 0.15))
+
+    def test_market_uses_the_auction(self):
+        auction = new_auction(min_salary=1.0, categories=DoubledPoints())
+        pricer = MarketPricer(auction)
+        self.assertTrue(np.array_equal(pricer.points, auction.players_df['PTS'].to_numpy()[pricer.rows] * 2.0))
+
+        pricer.run(max_iterations=50)
+        self.assertGreaterEqual(pricer.prices.min(), 1.0)
+
+    def test_auction_sim_uses_the_auction(self):
+        auction = new_auction(min_salary=1.0, categories=DoubledPoints())
+        simulator = AuctionSimulator(auction)
+        self.assertTrue(np.array_equal(simulator.expected_prices(2.0), 1.0 + (simulator.bids - 1.0) * 2.0))
+
+        starters = auction.store.team_start('BOT')
+        self.assertEqual(simulator.bot_base_points, 2.0 * auction.players_df.loc[starters, 'PTS'].sum())
+
+        result = simulator.run_auction({'name': 'expensive first'}, seed=0)
+        self.assertGreaterEqual(result['points'], simulator.bot_base_points)
+        if result['spent']:
+            self.assertGreaterEqual(result['spent'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from sillinger import FantasyAuction  # noqa: E402
+from solve_cache import SolveCache  # noqa: E402
+from solvers import ScipBackend  # noqa: E402
+
+
+class SolveCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.auction = FantasyAuction(CSV_PATH, verbose=False)
+        self.auction.process_data()
+        self.auction.build_model()
+        nominal = ScipBackend().solve(self.auction)
+
+        # Two pricey free agents the nominal lineup leaves out
+        df = self.auction.players_df
+        free_agents = df[self.auction.store.free_agents & (df['BID'] > 0).to_numpy()]
+        self.forced = [idx for idx in free_agents.nlargest(10, 'BID').index if idx not in nominal.rows][:2]
+
+    def expected(self, forced):
+        auction = FantasyAuction(CSV_PATH, verbose=False)
+        auction.process_data()
+        auction.build_model(forced)
+        return ScipBackend().solve(auction)
+
+    def test_what_if_hit_then_miss(self):
+        cache = SolveCache()
+        a, b = self.forced
+        cache.what_if(self.auction, forced=[a])
+        cache.what_if(self.auction, forced=[b])
+
+        # The hit only re-extracts for a; the SCIP model is still the one built for b
+        self.assertTrue(cache.what_if(self.auction, forced=[a]).cached)
+        self.assertFalse(self.auction.model_current())
+
+        # A miss for the same question must not solve b's model
+        lineup = SolveCache().solve(self.auction)
+        self.assertFalse(lineup.cached)
+        self.assertIn(a, lineup.rows)
+        self.assertNotIn(b, lineup.rows)
+        self.assertAlmostEqual(lineup.points, self.expected([a]).points, places=6)
+        self.assertTrue(self.auction.model_current())
+
+    def test_what_if_results(self):
+        cache = SolveCache()
+        for forced in [[self.forced[0]], [], [self.forced[0]], self.forced]:
+            with self.subTest(forced=forced):
+                lineup = cache.what_if(self.auction, forced=forced)
+                self.assertTrue(set(forced) <= set(lineup.rows))
+                self.assertAlmostEqual(lineup.points, self.expected(forced).points, places=6)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
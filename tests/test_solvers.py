@@ -0,0 +1,96 @@
+import os
+import sys
+import unittest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from knapsack import on_grid  # noqa: E402
+from sillinger import FantasyAuction  # noqa: E402
+from solvers import KnapsackBackend, ScipBackend  # noqa: E402
+
+
+def new_auction():
+    auction = FantasyAuction(CSV_PATH, verbose=False)
+    auction.process_data()
+    return auction
+
+
+class KnapsackAgreesWithScipTest(unittest.TestCase):
+    def assert_same_optimum(self, auction):
+        scip = ScipBackend().solve(auction)
+        dp = KnapsackBackend().solve(auction)
+
+        self.assertEqual(scip.status, dp.status)
+        if scip.status != 'optimal':
+            return scip, dp
+        self.assertAlmostEqual(scip.points, dp.points, places=6)
+
+        # Both lineups fill the roster exactly and stay under the cap
+        for lineup in [scip, dp]:
+            players = lineup.players(auction)
+            counts = players['POS'].astype(str).value_counts()
+            for pos, count in auction.roster.items():
+                self.assertEqual(counts.get(pos, 0), count, f"{lineup.backend} {pos}")
+            self.assertLessEqual((players['SALARY'] + players['BID']).sum(), auction.salary_cap + 1e-6)
+        return scip, dp
+
+    def test_costs_are_on_the_dp_grid(self):
+        # Otherwise the DP falls back to SCIP and the comparison proves nothing
+        auction = new_auction()
+        auction.extract_model_data()
+        self.assertTrue(on_grid(auction.model_costs))
+
+    def test_range_of_caps(self):
+        auction = new_auction()
+        for cap in [10.0, 25.0, 40.0, 56.8, 80.0]:
+            with self.subTest(cap=cap):
+                auction.salary_cap = cap
+                auction.build_model()
+                self.assert_same_optimum(auction)
+
+    def test_roster_counts(self):
+        auction = new_auction()
+        for roster in [{'F': 14, 'D': 7, 'G': 3}, {'F': 16, 'D': 6, 'G': 2}, {'F': 12, 'D': 8, 'G': 4}]:
+            with self.subTest(roster=roster):
+                auction.roster = roster
+                auction.build_model()
+                self.assert_same_optimum(auction)
+
+    def test_forced_and_excluded_players(self):
+        auction = new_auction()
+        auction.build_model()
+        nominal = ScipBackend().solve(auction)
+
+        free_agents = auction.players_df[auction.store.free_agents & (auction.players_df['BID'] > 0).to_numpy()]
+        forced = [idx for idx in free_agents.nlargest(10, 'BID').index if idx not in nominal.rows][:2]
+        excluded = [idx for idx in nominal.rows if auction.store.free_agents[idx]][:2]
+
+        auction.build_model(forced, excluded)
+        self.assertEqual(auction.model_must_include.sum(), len(auction.store.team_start('BOT')) + len(forced))
+        scip, dp = self.assert_same_optimum(auction)
+        for lineup in [scip, dp]:
+            self.assertTrue(set(forced) <= set(lineup.rows))
+            self.assertFalse(set(excluded) & set(lineup.rows))
+
+    def test_dp_re_extracts_stale_model_data(self):
+        auction = new_auction()
+        auction.build_model()
+        self.assertTrue(auction.model_data_current())
+
+        # A new BID after the extract must reach the DP
+        top = auction.players_df.loc[auction.filtered_df.index[~auction.model_must_include]].nlargest(1, 'PTS').index[0]
+        auction.players_df.loc[top, 'BID'] = auction.salary_cap
+        self.assertFalse(auction.model_data_current())
+
+        dp = KnapsackBackend().solve(auction)
+        self.assertTrue(auction.model_data_current())
+        self.assertNotIn(top, dp.rows)
+
+        auction.build_model()
+        self.assertAlmostEqual(ScipBackend().solve(auction).points, dp.points, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
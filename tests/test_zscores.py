@@ -0,0 +1,123 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+sys.path.insert(0, APP_DIR)
+CSV_PATH = os.path.join(os.path.dirname(APP_DIR), 'data', 'players-24.csv')
+
+from sillinger import FantasyAuction  # noqa: E402
+from zscores import ZScoreEngine  # noqa: E402
+
+
+def per_position_z_scores(auction, kind='stable'):
+    # The per-position path ZScoreEngine replaced: sort each position by points, shrink the
+    # baseline by the START players below it, then z-score the free agents above it. kind='stable'
+    # is the engine's tie rule; the original used sort_values' default quicksort.
+    df = auction.players_df
+    store = auction.store
+    draftable = np.zeros(len(df), dtype=bool)
+    z_scores = np.zeros(len(df))
+    totals = {}
+
+    for pos, rows in store.positions.items():
+        if pos not in auction.roster:
+            continue
+        group = df.loc[rows[~store.minor[rows]]].sort_values(auction.value_column, ascending=False, kind=kind)
+        baseline = auction.roster[pos] * auction.league_size
+        adjusted_baseline = baseline - int(store.start[group.index[baseline:]].sum())
+
+        top_players = group.head(adjusted_baseline)
+        top_players = top_players[store.free_agents[top_players.index]]
+        points = top_players[auction.value_column]
+        stdev = points.std()
+        if stdev == 0 or np.isnan(stdev):
+            stdev = 1
+        z = (points - points.mean()) / stdev
+        z -= z.min()
+
+        draftable[top_players.index] = True
+        z_scores[top_players.index] = z
+        totals[pos] = (len(top_players), z.sum())
+
+    return draftable, z_scores, totals
+
+
+def new_auction(**kwargs):
+    auction = FantasyAuction(CSV_PATH, verbose=False, **kwargs)
+    auction.process_data()
+    return auction
+
+
+class ZScoreEngineTest(unittest.TestCase):
+    def assert_same_as_per_position(self, auction):
+        draftable, z_scores, totals = per_position_z_scores(auction)
+        engine = ZScoreEngine.from_store(auction.store, auction.roster, auction.league_size)
+        result = engine.compute(auction.players_df[auction.value_column].to_numpy(dtype=float))
+
+        self.assertTrue(np.array_equal(result.draftable, draftable))
+        self.assertTrue(np.allclose(result.z_scores, z_scores))
+        for code, pos in enumerate(engine.positions):
+            self.assertEqual(result.count[code], totals[pos][0], pos)
+            self.assertAlmostEqual(result.total[code], totals[pos][1], places=9, msg=pos)
+
+    def test_players_24(self):
+        self.assert_same_as_per_position(new_auction())
+
+    def test_random_points_with_ties(self):
+        # Points on a small range, so most cutoffs fall inside a run of tied players
+        auction = new_auction()
+        rng = np.random.default_rng(0)
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                auction.players_df['PTS'] = rng.integers(0, 30, size=len(auction.players_df))
+                self.assert_same_as_per_position(auction)
+
+    def test_league_sizes_and_rosters(self):
+        for league_size, roster in [(8, {'F': 12, 'D': 6, 'G': 2}), (14, {'F': 14, 'D': 7, 'G': 3})]:
+            with self.subTest(league_size=league_size):
+                self.assert_same_as_per_position(new_auction(league_size=league_size, roster=roster))
+
+    def test_quicksort_differs_only_among_ties(self):
+        # The original quicksort may pick another of several players tied at a cutoff; who is
+        # draftable changes, the counts and totals do not
+        auction = new_auction()
+        draftable, _, totals = per_position_z_scores(auction)
+        quick_draftable, _, quick_totals = per_position_z_scores(auction, kind='quicksort')
+
+        points = auction.players_df['PTS'].to_numpy()
+        for row in np.flatnonzero(draftable != quick_draftable):
+            pos = auction.players_df.at[row, 'POS']
+            tied = (points == points[row]) & (auction.players_df['POS'] == pos).to_numpy()
+            self.assertGreater(tied.sum(), 1)
+        for pos, (count, total) in totals.items():
+            self.assertEqual(count, quick_totals[pos][0])
+            self.assertAlmostEqual(total, quick_totals[pos][1], places=9)
+
+    def test_ties_go_to_the_earlier_row(self):
+        # Esa Lindell (row 308) and John Marino (row 318) both have 26 points at the D cutoff
+        df = new_auction().players_df
+        self.assertEqual(df.at[308, 'PLAYER'], 'Esa Lindell')
+        self.assertEqual(df.at[318, 'PLAYER'], 'John Marino')
+        self.assertEqual(df.at[308, 'PTS'], df.at[318, 'PTS'])
+        self.assertEqual(df.at[308, 'Draftable'], 'YES')
+        self.assertEqual(df.at[318, 'Draftable'], 'NO')
+
+    def test_batch_matches_single_draws(self):
+        auction = new_auction()
+        engine = ZScoreEngine.from_store(auction.store, auction.roster, auction.league_size)
+        rng = np.random.default_rng(1)
+        draws = rng.integers(0, 60, size=(4, len(auction.players_df))).astype(float)
+
+        batch = engine.compute(draws)
+        for k, points in enumerate(draws):
+            single = engine.compute(points)
+            self.assertTrue(np.array_equal(batch.draftable[k], single.draftable))
+            self.assertTrue(np.allclose(batch.z_scores[k], single.z_scores))
+            self.assertTrue(np.array_equal(batch.count[k], single.count))
+
+
+if __name__ == '__main__':
+    unittest.main()